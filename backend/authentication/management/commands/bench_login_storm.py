@@ -0,0 +1,109 @@
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+from authentication.models import User, UserProfile
+from core.benchmarking import http_json, latency_summary
+
+BENCH_PASSWORD = 'bench-login-123'
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede a latência de GET /api/tickets/ (p50/p95/p99) em um servidor em execução, '
+        'com e sem uma rajada de logins simultâneos. Suba o servidor com LOGIN_IP_RATE/LOGIN_EMAIL_RATE '
+        'altos para que a rajada chegue ao limite de concorrência em vez do throttle.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--users', type=int, default=200, help='Atendentes usados na rajada.')
+        parser.add_argument('--login-workers', type=int, default=50)
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--duration', type=float, default=10.0)
+
+    def handle(self, *args, **options):
+        self.base_url = options['base_url'].rstrip('/')
+        emails = self._ensure_users(options['users'])
+        token = self._login(emails[0])[1]['access_token']
+
+        baseline = self._measure_reads(token, options['readers'], options['duration'])
+        self._report('Sem rajada de logins', baseline)
+
+        stop = threading.Event()
+        statuses = Counter()
+        storm = threading.Thread(
+            target=self._storm, args=(emails, options['login_workers'], stop, statuses)
+        )
+        storm.start()
+        try:
+            during = self._measure_reads(token, options['readers'], options['duration'])
+        finally:
+            stop.set()
+            storm.join()
+
+        self._report('Durante a rajada de logins', during)
+        self.stdout.write(
+            'Respostas do login: ' + ', '.join(f'{code}={total}' for code, total in sorted(statuses.items()))
+        )
+
+    def _ensure_users(self, total):
+        emails = [f'bench-login-{i}@cloudpark.com' for i in range(total)]
+        existing = set(User.objects.filter(email__in=emails).values_list('email', flat=True))
+        password = make_password(BENCH_PASSWORD)
+        User.objects.bulk_create([
+            User(email=email, password=password, profile=UserProfile.ATTENDANT, is_staff=True)
+            for email in emails if email not in existing
+        ])
+        return emails
+
+    def _request(self, method, path, body=None, token=None):
+        return http_json(method, f'{self.base_url}{path}', body=body, token=token)
+
+    def _login(self, email):
+        return self._request('POST', '/api/auth/login/', {'email': email, 'password': BENCH_PASSWORD})
+
+    def _storm(self, emails, workers, stop, statuses):
+        lock = threading.Lock()
+
+        def worker(offset):
+            index = offset
+            while not stop.is_set():
+                code, _ = self._login(emails[index % len(emails)])
+                with lock:
+                    statuses[code] += 1
+                index += workers
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for offset in range(workers):
+                executor.submit(worker, offset)
+
+    def _measure_reads(self, token, readers, duration):
+        latencies = []
+        lock = threading.Lock()
+        deadline = time.monotonic() + duration
+
+        def reader():
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                self._request('GET', '/api/tickets/?page=1', token=token)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed * 1000)
+
+        with ThreadPoolExecutor(max_workers=readers) as executor:
+            for _ in range(readers):
+                executor.submit(reader)
+
+        return latencies
+
+    def _report(self, label, latencies):
+        self.stdout.write(
+            f'{label}: {len(latencies)} leituras, {latency_summary(latencies)} '
+            f'média={statistics.fmean(latencies) if latencies else 0:.1f}ms'
+        )
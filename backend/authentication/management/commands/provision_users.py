@@ -0,0 +1,145 @@
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from authentication.models import User, UserProfile, get_attendant_permission_ids
+
+
+def hash_passwords(passwords):
+    return [make_password(password) for password in passwords]
+
+
+class Command(BaseCommand):
+    help = (
+        'Cria usuários em massa a partir de um CSV (email,password[,profile]), com hash de senha '
+        'em paralelo e permissões de atendente atribuídas em lote.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--workers e --batch-size devem ser maiores que zero.')
+
+        self.permission_ids = get_attendant_permission_ids()
+        self.created = 0
+        self.failed = 0
+        self.hash_seconds = 0.0
+        self.insert_seconds = 0.0
+        started = time.perf_counter()
+
+        executor = None
+        if options['workers'] > 1:
+            executor = ProcessPoolExecutor(max_workers=options['workers'], initializer=django.setup)
+
+        try:
+            with open(options['path'], newline='', encoding='utf-8-sig') as stream:
+                batch = []
+                for row in self._valid_rows(csv.DictReader(stream)):
+                    batch.append(row)
+                    if len(batch) >= options['batch_size']:
+                        self._provision(batch, executor, options['workers'])
+                        batch = []
+                if batch:
+                    self._provision(batch, executor, options['workers'])
+        finally:
+            if executor:
+                executor.shutdown()
+
+        elapsed = time.perf_counter() - started
+        rate = self.created / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'{self.created} usuários criados, {self.failed} com erro em {elapsed:.1f}s '
+            f'({rate:.0f} usuários/s; hash {self.hash_seconds:.1f}s, gravação {self.insert_seconds:.1f}s).'
+        ))
+
+    def _fail(self, line, message):
+        self.failed += 1
+        self.stderr.write(f'Linha {line}: {message}')
+
+    def _valid_rows(self, reader):
+        seen = set()
+        for row in reader:
+            line = reader.line_num
+            email = User.objects.normalize_email((row.get('email') or '').strip())
+            password = row.get('password') or ''
+            profile = (row.get('profile') or UserProfile.ATTENDANT).strip()
+
+            try:
+                validate_email(email)
+            except ValidationError:
+                self._fail(line, f'e-mail inválido "{email}".')
+                continue
+            if not password:
+                self._fail(line, 'senha é obrigatória.')
+                continue
+            if profile not in UserProfile.values:
+                self._fail(line, f'perfil inválido "{profile}".')
+                continue
+            if email.lower() in seen:
+                self._fail(line, f'e-mail duplicado no arquivo "{email}".')
+                continue
+
+            seen.add(email.lower())
+            yield line, email, password, profile
+
+    def _hash(self, passwords, executor, workers):
+        if executor is None:
+            return hash_passwords(passwords)
+        chunk = max(1, len(passwords) // (workers * 4))
+        chunks = [passwords[i:i + chunk] for i in range(0, len(passwords), chunk)]
+        return [hashed for result in executor.map(hash_passwords, chunks) for hashed in result]
+
+    def _provision(self, batch, executor, workers):
+        existing = {
+            email.lower() for email in
+            User.objects.filter(email__in=[email for _, email, _, _ in batch]).values_list('email', flat=True)
+        }
+        rows = []
+        for line, email, password, profile in batch:
+            if email.lower() in existing:
+                self._fail(line, f'usuário já existe "{email}".')
+            else:
+                rows.append((email, password, profile))
+        if not rows:
+            return
+
+        started = time.perf_counter()
+        hashes = self._hash([password for _, password, _ in rows], executor, workers)
+        self.hash_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            User.objects.bulk_create([
+                User(
+                    email=email,
+                    password=hashed,
+                    profile=profile,
+                    is_staff=profile == UserProfile.ATTENDANT
+                )
+                for (email, _, profile), hashed in zip(rows, hashes)
+            ])
+
+            attendant_ids = User.objects.filter(
+                email__in=[email for email, _, profile in rows if profile == UserProfile.ATTENDANT]
+            ).values_list('id', flat=True)
+
+            UserPermission = User.user_permissions.through
+            UserPermission.objects.bulk_create([
+                UserPermission(user_id=user_id, permission_id=permission_id)
+                for user_id in attendant_ids
+                for permission_id in self.permission_ids
+            ], batch_size=1000, ignore_conflicts=True)
+        self.insert_seconds += time.perf_counter() - started
+        self.created += len(rows)
@@ -1,9 +1,8 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_init, post_migrate, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import Permission
-from django.contrib.contenttypes.models import ContentType
 
 
 class CustomUserManager(BaseUserManager):
@@ -50,22 +49,60 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = "Usuários"
 
 
+ATTENDANT_TICKET_PERMISSIONS = ('add_ticket', 'change_ticket', 'view_ticket')
+
+_attendant_permission_ids = []
+
+
+def get_attendant_permission_ids():
+    if not _attendant_permission_ids:
+        _attendant_permission_ids.extend(
+            Permission.objects.filter(
+                content_type__app_label='core',
+                content_type__model='ticket',
+                codename__in=ATTENDANT_TICKET_PERMISSIONS
+            ).values_list('id', flat=True)
+        )
+    return _attendant_permission_ids
+
+
+@receiver(post_migrate)
+def clear_attendant_permission_ids(sender, **kwargs):
+    _attendant_permission_ids.clear()
+
+
+@receiver(post_init, sender=User)
+def remember_profile(sender, instance, **kwargs):
+    instance._loaded_profile = instance.__dict__.get('profile')
+
+
 @receiver(post_save, sender=User)
-def add_attendant_permissions(sender, instance, created, **kwargs):
-    if instance.profile == 'attendant':
-        try:
-            from core.models import Ticket
-            content_type = ContentType.objects.get_for_model(Ticket)
-            add_permission = Permission.objects.get(content_type=content_type, codename='add_ticket')
-            change_permission = Permission.objects.get(content_type=content_type, codename='change_ticket')
-            view_permission = Permission.objects.get(content_type=content_type, codename='view_ticket')
-
-            if not instance.user_permissions.filter(codename='add_ticket').exists():
-                instance.user_permissions.add(add_permission, change_permission, view_permission)
-
-            if not instance.is_staff:
-                instance.is_staff = True
-                instance.save(update_fields=['is_staff'])
-
-        except Exception as e:
-            print(f"Erro ao adicionar permissões para atendente: {e}")
+def add_attendant_permissions(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and 'profile' not in update_fields:
+        return
+    if not created and instance.profile == instance._loaded_profile:
+        return
+
+    instance._loaded_profile = instance.profile
+    if instance.profile != UserProfile.ATTENDANT:
+        return
+
+    try:
+        permission_ids = get_attendant_permission_ids()
+        if len(permission_ids) != len(ATTENDANT_TICKET_PERMISSIONS):
+            return
+
+        UserPermission = User.user_permissions.through
+        UserPermission.objects.bulk_create(
+            [UserPermission(user_id=instance.pk, permission_id=pk) for pk in permission_ids],
+            ignore_conflicts=True
+        )
+
+        if not instance.is_staff:
+            User.objects.filter(pk=instance.pk).update(is_staff=True)
+            instance.is_staff = True
+
+    except Exception as e:
+        print(f"Erro ao adicionar permissões para atendente: {e}")
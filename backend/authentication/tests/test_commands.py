@@ -0,0 +1,69 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from authentication.models import UserProfile
+
+User = get_user_model()
+
+
+class ProvisionUsersCommandTest(TestCase):
+    def setUp(self):
+        User.objects.create_user(email='existente@test.com', password='testpass123')
+
+    def _write(self, content):
+        handle = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8')
+        handle.write(content)
+        handle.close()
+        self.addCleanup(os.remove, handle.name)
+        return handle.name
+
+    def _provision(self, content, **options):
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            'provision_users', self._write(content), stdout=stdout, stderr=stderr, **options
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_provision_users(self):
+        stdout, stderr = self._provision(
+            'email,password,profile\n'
+            'a1@test.com,senha123,\n'
+            'a2@test.com,senha123,attendant\n'
+            't1@test.com,senha123,technician\n'
+            'invalido,senha123,\n'
+            'a3@test.com,,\n'
+            'a4@test.com,senha123,gerente\n'
+            'A1@test.com,senha123,\n'
+            'existente@test.com,senha123,\n',
+            workers=1, batch_size=2
+        )
+
+        self.assertIn('3 usuários criados, 5 com erro', stdout)
+        self.assertEqual(len(stderr.strip().splitlines()), 5)
+
+        attendant = User.objects.get(email='a1@test.com')
+        self.assertTrue(attendant.is_staff)
+        self.assertTrue(attendant.check_password('senha123'))
+        self.assertEqual(
+            set(attendant.user_permissions.values_list('codename', flat=True)),
+            {'add_ticket', 'change_ticket', 'view_ticket'}
+        )
+
+        technician = User.objects.get(email='t1@test.com')
+        self.assertEqual(technician.profile, UserProfile.TECHNICIAN)
+        self.assertFalse(technician.is_staff)
+        self.assertFalse(technician.user_permissions.exists())
+
+    def test_provision_users_hashes_in_parallel(self):
+        stdout, _ = self._provision(
+            'email,password\n' + ''.join(f'user{i}@test.com,senha{i}\n' for i in range(6)),
+            workers=2
+        )
+
+        self.assertIn('6 usuários criados', stdout)
+        self.assertTrue(User.objects.get(email='user5@test.com').check_password('senha5'))
@@ -2,7 +2,14 @@ from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.authentication import user_cache
 from authentication.models import UserProfile
+from core.models import Ticket
 
 User = get_user_model()
 
@@ -10,6 +17,7 @@ User = get_user_model()
 class JWTAuthenticationTest(APITestCase):
     def setUp(self):
         self.client = APIClient()
+        cache.clear()
         
         self.technician = User.objects.create_user(
             email='tecnico@test.com',
@@ -91,4 +99,112 @@ class JWTAuthenticationTest(APITestCase):
     def test_api_access_without_jwt(self):
         response = self.client.get(reverse('ticket-list'))
         
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED) 
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ClaimsJWTAuthenticationTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        user_cache.clear()
+        cache.clear()
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        Ticket.objects.create(title='Do atendente', attendant=self.attendant)
+        Ticket.objects.create(title='Do técnico', attendant=self.technician)
+
+    def _login(self, email):
+        response = self.client.post(reverse('login'), {'email': email, 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access_token"]}')
+        return response
+
+    def _user_queries(self, context):
+        return [
+            query for query in context.captured_queries
+            if 'FROM "authentication_user"' in query['sql']
+        ]
+
+    def test_access_token_carries_user_claims(self):
+        response = self._login('tecnico@test.com')
+
+        token = AccessToken(response.data['access_token'])
+        self.assertEqual(token['profile'], UserProfile.TECHNICIAN)
+        self.assertFalse(token['is_superuser'])
+
+    def test_authenticated_request_does_not_load_user(self):
+        self._login('atendente@test.com')
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('ticket-list'), {'status': 'open'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(self._user_queries(context), [])
+
+    def test_refreshed_access_token_keeps_claims(self):
+        refresh_token = self._login('tecnico@test.com').data['refresh_token']
+
+        response = self.client.post(reverse('refresh'), {'refresh_token': refresh_token})
+
+        self.assertEqual(AccessToken(response.data['access_token'])['profile'], UserProfile.TECHNICIAN)
+
+    def test_refresh_uses_current_profile(self):
+        refresh_token = self._login('tecnico@test.com').data['refresh_token']
+        self.technician.profile = UserProfile.ATTENDANT
+        self.technician.save()
+
+        response = self.client.post(reverse('refresh'), {'refresh_token': refresh_token})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(AccessToken(response.data['access_token'])['profile'], UserProfile.ATTENDANT)
+
+    def test_refresh_rejects_inactive_user(self):
+        refresh_token = self._login('tecnico@test.com').data['refresh_token']
+        self.technician.is_active = False
+        self.technician.save()
+
+        response = self.client.post(reverse('refresh'), {'refresh_token': refresh_token})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertNotIn('access_token', response.data)
+
+    def test_refresh_rejects_deleted_user(self):
+        refresh_token = self._login('tecnico@test.com').data['refresh_token']
+        Ticket.objects.filter(attendant=self.technician).delete()
+        self.technician.delete()
+
+        response = self.client.post(reverse('refresh'), {'refresh_token': refresh_token})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_without_claims_uses_cached_user(self):
+        token = AccessToken.for_user(self.technician)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse('ticket-list'))
+            response = self.client.get(reverse('ticket-list'), {'status': 'open'})
+
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(self._user_queries(context)), 1)
+
+    def test_user_save_invalidates_cached_user(self):
+        token = AccessToken.for_user(self.technician)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.get(reverse('ticket-list'))
+
+        self.technician.is_active = False
+        self.technician.save()
+
+        response = self.client.get(reverse('ticket-list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,71 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from authentication.models import UserProfile
+from authentication.throttling import LoginEmailThrottle, LoginIPThrottle, password_check_gate
+
+User = get_user_model()
+
+
+class LoginThrottlingTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+    def _login(self, email='tecnico@test.com', password='testpass123', **extra):
+        return self.client.post(reverse('login'), {'email': email, 'password': password}, **extra)
+
+    def test_login_rejected_when_gate_is_full(self):
+        acquired = []
+        while password_check_gate._semaphore.acquire(blocking=False):
+            acquired.append(True)
+        try:
+            with mock.patch.object(password_check_gate, 'timeout', 0):
+                response = self._login()
+        finally:
+            for _ in acquired:
+                password_check_gate._semaphore.release()
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], str(password_check_gate.retry_after))
+
+        self.assertEqual(self._login().status_code, status.HTTP_200_OK)
+
+    def test_login_throttled_per_email(self):
+        with mock.patch.object(LoginEmailThrottle, 'THROTTLE_RATES', {'login_email': '2/min'}):
+            self._login(password='errada')
+            self._login(password='errada')
+            response = self._login()
+            other = self._login(email='outro@test.com', password='errada')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(other.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_login_email_throttle_ignores_case(self):
+        with mock.patch.object(LoginEmailThrottle, 'THROTTLE_RATES', {'login_email': '1/min'}):
+            self._login(password='errada')
+            response = self._login(email='TECNICO@test.com')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_login_throttled_per_ip(self):
+        with mock.patch.object(LoginIPThrottle, 'THROTTLE_RATES', {'login_ip': '2/min'}):
+            self._login(email='a@test.com', REMOTE_ADDR='10.0.0.1')
+            self._login(email='b@test.com', REMOTE_ADDR='10.0.0.1')
+            response = self._login(REMOTE_ADDR='10.0.0.1')
+            other = self._login(REMOTE_ADDR='10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(other.status_code, status.HTTP_200_OK)
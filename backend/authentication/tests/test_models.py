@@ -0,0 +1,81 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+
+from authentication.models import UserProfile, get_attendant_permission_ids
+
+User = get_user_model()
+
+
+class AttendantPermissionsTest(TestCase):
+    def setUp(self):
+        get_attendant_permission_ids()
+        self.password = make_password('testpass123')
+
+    def _codenames(self, user):
+        return set(user.user_permissions.values_list('codename', flat=True))
+
+    def test_create_attendant_assigns_permissions(self):
+        with self.assertNumQueries(3):
+            user = User.objects.create(
+                email='atendente@test.com',
+                password=self.password,
+                profile=UserProfile.ATTENDANT
+            )
+
+        user.refresh_from_db()
+        self.assertTrue(user.is_staff)
+        self.assertEqual(self._codenames(user), {'add_ticket', 'change_ticket', 'view_ticket'})
+
+    def test_create_technician_skips_permissions(self):
+        with self.assertNumQueries(1):
+            user = User.objects.create(
+                email='tecnico@test.com',
+                password=self.password,
+                profile=UserProfile.TECHNICIAN
+            )
+
+        self.assertEqual(self._codenames(user), set())
+
+    def test_update_without_profile_change_is_a_single_query(self):
+        user = User.objects.create(
+            email='atendente@test.com',
+            password=self.password,
+            profile=UserProfile.ATTENDANT
+        )
+        user = User.objects.get(pk=user.pk)
+
+        with self.assertNumQueries(1):
+            user.is_active = False
+            user.save()
+
+        with self.assertNumQueries(1):
+            user.save(update_fields=['last_login'])
+
+    def test_profile_change_to_attendant_assigns_permissions(self):
+        user = User.objects.create(
+            email='tecnico@test.com',
+            password=self.password,
+            profile=UserProfile.TECHNICIAN,
+            is_staff=True
+        )
+        user = User.objects.get(pk=user.pk)
+
+        with self.assertNumQueries(2):
+            user.profile = UserProfile.ATTENDANT
+            user.save()
+
+        self.assertEqual(self._codenames(user), {'add_ticket', 'change_ticket', 'view_ticket'})
+
+    def test_repeated_assignment_is_idempotent(self):
+        user = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+        user.profile = UserProfile.TECHNICIAN
+        user.save()
+        user.profile = UserProfile.ATTENDANT
+        user.save()
+
+        self.assertEqual(user.user_permissions.count(), 3)
@@ -0,0 +1,49 @@
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginIPThrottle(SimpleRateThrottle):
+    scope = 'login_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class LoginEmailThrottle(SimpleRateThrottle):
+    scope = 'login_email'
+
+    def get_cache_key(self, request, view):
+        email = request.data.get('email')
+        if not email or not isinstance(email, str):
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': email.strip().lower()}
+
+
+class PasswordCheckGate:
+    def __init__(self, capacity, timeout, retry_after):
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._semaphore = threading.BoundedSemaphore(capacity)
+
+    @contextmanager
+    def acquire(self):
+        if not self._semaphore.acquire(timeout=self.timeout):
+            raise Throttled(
+                wait=self.retry_after,
+                detail='Muitas tentativas de login simultâneas. Tente novamente em instantes.'
+            )
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+password_check_gate = PasswordCheckGate(
+    capacity=settings.LOGIN_MAX_CONCURRENT_CHECKS,
+    timeout=settings.LOGIN_GATE_TIMEOUT,
+    retry_after=settings.LOGIN_RETRY_AFTER
+)
@@ -0,0 +1,19 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+USER_CLAIMS = ('profile', 'is_superuser', 'is_staff')
+
+
+class ClaimsRefreshToken(RefreshToken):
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+
+
+def access_token_for(refresh, user):
+    token = refresh.access_token
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
@@ -1,14 +1,25 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes, authentication_classes
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+    throttle_classes,
+)
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
 
+from .models import User
+from .throttling import LoginEmailThrottle, LoginIPThrottle, password_check_gate
+from .tokens import ClaimsRefreshToken, access_token_for
+
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
 @authentication_classes([])
+@throttle_classes([LoginIPThrottle, LoginEmailThrottle])
 def login_view(request):
     email = request.data.get('email')
     password = request.data.get('password')
@@ -19,7 +30,8 @@ def login_view(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    user = authenticate(email=email, password=password)
+    with password_check_gate.acquire():
+        user = authenticate(email=email, password=password)
 
     if user is None:
         return Response(
@@ -33,7 +45,7 @@ def login_view(request):
             status=status.HTTP_401_UNAUTHORIZED
         )
 
-    refresh = RefreshToken.for_user(user)
+    refresh = ClaimsRefreshToken.for_user(user)
 
     return Response({
         'access_token': str(refresh.access_token),
@@ -62,11 +74,19 @@ def refresh_token_view(request):
 
     try:
         refresh = RefreshToken(refresh_token)
-        return Response({
-            'access_token': str(refresh.access_token),
-        })
     except Exception:
         return Response(
             {'error': 'Token inválido.'},
             status=status.HTTP_401_UNAUTHORIZED
         )
+
+    user = User.objects.filter(pk=refresh.get(api_settings.USER_ID_CLAIM)).first()
+    if user is None or not user.is_active:
+        return Response(
+            {'error': 'Usuário não encontrado ou inativo.'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+
+    return Response({
+        'access_token': str(access_token_for(refresh, user)),
+    })
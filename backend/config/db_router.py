@@ -0,0 +1,71 @@
+import hashlib
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICATED_APPS = {'core', 'authentication'}
+
+_request_state = ContextVar('replica_request_state', default=None)
+
+
+class RequestState:
+    def __init__(self, client_key, pinned):
+        self.client_key = client_key
+        self.pinned = pinned
+        self.wrote = False
+
+
+def _client_key(request):
+    credential = (
+        request.headers.get('Authorization')
+        or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    )
+    if not credential:
+        return None
+    return 'db:pinned:' + hashlib.md5(credential.encode(), usedforsecurity=False).hexdigest()
+
+
+def start_request(request):
+    client_key = _client_key(request) if settings.DATABASE_REPLICAS else None
+    pinned = client_key is not None and cache.get(client_key) is not None
+    return _request_state.set(RequestState(client_key, pinned))
+
+
+def finish_request(token):
+    state = _request_state.get()
+    if state is not None and state.wrote and state.client_key:
+        cache.set(state.client_key, 1, timeout=settings.REPLICA_PIN_SECONDS)
+    _request_state.reset(token)
+
+
+def is_pinned():
+    state = _request_state.get()
+    return state is not None and (state.pinned or state.wrote)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not settings.DATABASE_REPLICAS or model._meta.app_label not in REPLICATED_APPS:
+            return None
+        state = _request_state.get()
+        if state is None or state.pinned or state.wrote:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db not in settings.DATABASE_REPLICAS
@@ -1,5 +1,9 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.utils.deprecation import MiddlewareMixin
 
+from .db_router import finish_request, start_request
+from .profiling import record_render, report_profile, should_profile, start_profile, stop_profile
+
 
 class DisableCSRFMiddleware(MiddlewareMixin):
     def process_request(self, request):
@@ -13,3 +17,66 @@ class APIRestMiddleware(MiddlewareMixin):
         if request.path.startswith('/api/'):
             request.is_api_request = True
         return None
+
+
+class ReplicaPinningMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = start_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            finish_request(token)
+
+    async def __acall__(self, request):
+        token = start_request(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            finish_request(token)
+
+
+class RequestProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not should_profile(request):
+            return self.get_response(request)
+        profile, token = start_profile(request, capture=True)
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_profile(profile, token)
+        return report_profile(profile, response)
+
+    async def __acall__(self, request):
+        if not should_profile(request):
+            return await self.get_response(request)
+        profile, token = start_profile(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_profile(profile, token)
+        return report_profile(profile, response)
+
+    def process_template_response(self, request, response):
+        return record_render(response)
@@ -0,0 +1,175 @@
+import cProfile
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_current_profile = ContextVar('request_profile', default=None)
+_profiler_lock = threading.Lock()
+_saved_profiles = []
+_saved_profiles_lock = threading.Lock()
+
+
+class RequestProfile:
+    def __init__(self, request):
+        self.method = request.method
+        self.path = request.path
+        self.started = time.perf_counter()
+        self.total = 0.0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.queries = Counter()
+        self.profiler = None
+
+    @property
+    def query_count(self):
+        return sum(self.queries.values())
+
+    @property
+    def duplicate_count(self):
+        return self.query_count - len(self.queries)
+
+    def record_query(self, sql, params, duration):
+        self.db_time += duration
+        self.queries[sql, repr(params)] += 1
+
+    def server_timing(self):
+        return ', '.join([
+            f'total;dur={self.total * 1000:.1f}',
+            f'db;dur={self.db_time * 1000:.1f};desc="consultas={self.query_count} duplicadas={self.duplicate_count}"',
+            f'serialize;dur={self.serialize_time * 1000:.1f}',
+        ])
+
+    def log_entry(self, status_code):
+        entry = {
+            'method': self.method,
+            'path': self.path,
+            'status': status_code,
+            'total_ms': round(self.total * 1000, 1),
+            'db_ms': round(self.db_time * 1000, 1),
+            'queries': self.query_count,
+            'duplicate_queries': self.duplicate_count,
+            'serialize_ms': round(self.serialize_time * 1000, 1),
+        }
+        (sql, _), repeated = self.queries.most_common(1)[0] if self.queries else ((None, None), 0)
+        if repeated > 1:
+            entry['most_repeated_query'] = {'sql': sql, 'count': repeated}
+        return entry
+
+
+def _record_query(execute, sql, params, many, context):
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, params, time.perf_counter() - started)
+
+
+def install_query_recorder(sender=None, connection=None, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+connection_created.connect(install_query_recorder)
+
+
+def should_profile(request):
+    if not settings.REQUEST_PROFILING:
+        return False
+    if request.headers.get('X-Profile') == '1':
+        return True
+    return random.random() < settings.REQUEST_PROFILING_SAMPLE_RATE
+
+
+def start_profile(request, capture=False):
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(connection=connection)
+
+    profile = RequestProfile(request)
+    if capture and settings.REQUEST_PROFILING_DIR and _profiler_lock.acquire(blocking=False):
+        profile.profiler = cProfile.Profile()
+        profile.profiler.enable()
+    return profile, _current_profile.set(profile)
+
+
+def stop_profile(profile, token):
+    profile.total = time.perf_counter() - profile.started
+    _current_profile.reset(token)
+    if profile.profiler is not None:
+        profile.profiler.disable()
+        _profiler_lock.release()
+
+
+def report_profile(profile, response):
+    response['Server-Timing'] = profile.server_timing()
+    if profile.total * 1000 >= settings.REQUEST_PROFILING_SLOW_MS:
+        entry = profile.log_entry(response.status_code)
+        if profile.profiler is not None:
+            entry['profile'] = _save_profile(profile)
+        logger.warning('Requisição lenta: %s', json.dumps(entry, ensure_ascii=False), extra={'profile': entry})
+    return response
+
+
+def _save_profile(profile):
+    directory = Path(settings.REQUEST_PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = re.sub(r'[^A-Za-z0-9]+', '_', profile.path).strip('_') or 'root'
+    path = directory / (
+        f'{time.strftime("%Y%m%d-%H%M%S")}-{profile.method}-{name}-'
+        f'{profile.total * 1000:.0f}ms-{uuid.uuid4().hex[:8]}.prof'
+    )
+    profile.profiler.dump_stats(path)
+
+    with _saved_profiles_lock:
+        _saved_profiles.append((profile.total, path))
+        _saved_profiles.sort(key=lambda saved: saved[0], reverse=True)
+        while len(_saved_profiles) > settings.REQUEST_PROFILING_KEEP:
+            _, discarded = _saved_profiles.pop()
+            discarded.unlink(missing_ok=True)
+    return str(path)
+
+
+def record_render(response):
+    profile = _current_profile.get()
+    if profile is None:
+        return response
+
+    started = time.perf_counter()
+    db_time = profile.db_time
+
+    def finished(rendered):
+        profile.serialize_time += time.perf_counter() - started - (profile.db_time - db_time)
+
+    response.add_post_render_callback(finished)
+    return response
+
+
+@contextmanager
+def serialization():
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    db_time = profile.db_time
+    try:
+        yield
+    finally:
+        profile.serialize_time += time.perf_counter() - started - (profile.db_time - db_time)
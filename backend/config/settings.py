@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -52,9 +52,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.RequestProfilingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'config.middleware.DisableCSRFMiddleware',
     'config.middleware.APIRestMiddleware',
+    'config.middleware.ReplicaPinningMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -87,13 +89,146 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
+# DB_ENGINE=sqlite (padrão) ou postgresql.
+
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+
+if DB_ENGINE == 'postgresql':
+    # Com pool (DB_POOL=True) as conexões são reaproveitadas pelo psycopg_pool e
+    # CONN_MAX_AGE precisa ser 0; sem pool, conexões persistentes por worker.
+    # Em ASGI prefira o pool: conexões persistentes não são reaproveitadas entre requisições.
+    DB_POOL = config('DB_POOL', default=False, cast=bool)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME', default='cloudpark'),
+            'USER': config('DB_USER', default='cloudpark'),
+            'PASSWORD': config('DB_PASSWORD', default=''),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            'CONN_MAX_AGE': 0 if DB_POOL else config('DB_CONN_MAX_AGE', default=60, cast=int),
+            'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+            'OPTIONS': {
+                'pool': {
+                    'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+                    'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+                    'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+                },
+            } if DB_POOL else {},
+        }
+    }
+else:
+    # WAL permite leituras concorrentes com uma escrita; IMMEDIATE pega o lock de escrita
+    # no BEGIN, então transações de leitura+escrita esperam o busy timeout em vez de
+    # falharem com "database is locked" ao promover o lock.
+    SQLITE_TUNED = config('SQLITE_TUNED', default=True, cast=bool)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': config('SQLITE_PATH', default=str(BASE_DIR / 'db.sqlite3')),
+            'OPTIONS': {
+                'timeout': config('SQLITE_BUSY_TIMEOUT', default=20, cast=float),
+                'transaction_mode': 'IMMEDIATE',
+                'init_command': (
+                    'PRAGMA journal_mode=WAL;'
+                    'PRAGMA synchronous=NORMAL;'
+                    f"PRAGMA cache_size=-{config('SQLITE_CACHE_SIZE_KB', default=65536, cast=int)};"
+                    f"PRAGMA mmap_size={config('SQLITE_MMAP_SIZE', default=268435456, cast=int)};"
+                    'PRAGMA temp_store=MEMORY;'
+                ),
+            } if SQLITE_TUNED else {},
+        }
+    }
+
+# Réplicas de leitura: consultas de leitura de core/authentication vão para as réplicas;
+# escritas e leituras do mesmo cliente nos REPLICA_PIN_SECONDS seguintes a uma escrita
+# ficam no primário. Postgres: DB_REPLICA_HOSTS=host1,host2:5433.
+# SQLite: SQLITE_REPLICA_PATHS=/tmp/replica.sqlite3 (copiadas com sync_sqlite_replicas).
+
+if DB_ENGINE == 'postgresql':
+    replicas = [
+        {'HOST': host, 'PORT': port or DATABASES['default']['PORT']}
+        for host, _, port in (
+            value.partition(':') for value in config('DB_REPLICA_HOSTS', default='', cast=Csv())
+        )
+    ]
+else:
+    replicas = [{'NAME': path} for path in config('SQLITE_REPLICA_PATHS', default='', cast=Csv())]
+
+DATABASE_REPLICAS = []
+for index, replica in enumerate(replicas):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {**DATABASES['default'], **replica, 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['config.db_router.ReplicaRouter']
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# O cache local (LocMemCache) é por processo; com vários workers use um backend compartilhado.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='cloudpark'),
     }
 }
 
+TICKET_LIST_CACHE_ALIAS = 'default'
+TICKET_LIST_CACHE_TIMEOUT = config('TICKET_LIST_CACHE_TIMEOUT', default=60, cast=int)
+
+# Número de processos servindo a aplicação (exportado pelo gunicorn.conf.py). Com mais de um,
+# tudo o que depende de estado compartilhado entre workers precisa de um cache compartilhado.
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+
+# Eventos de tickets (SSE). O broker em processo só alcança conexões do próprio worker;
+# com vários workers/nós o padrão passa a ser core.events.CacheBroker, que exige um cache
+# compartilhado (CACHE_BACKEND Redis/Memcached/banco) — verificado pelos system checks.
+TICKET_EVENTS_BACKEND = config(
+    'TICKET_EVENTS_BACKEND',
+    default='core.events.CacheBroker' if WEB_CONCURRENCY > 1 else 'core.events.InProcessBroker'
+)
+TICKET_EVENTS_HISTORY = config('TICKET_EVENTS_HISTORY', default=1000, cast=int)
+TICKET_EVENTS_QUEUE_SIZE = config('TICKET_EVENTS_QUEUE_SIZE', default=100, cast=int)
+TICKET_EVENTS_HEARTBEAT = config('TICKET_EVENTS_HEARTBEAT', default=15, cast=float)
+TICKET_EVENTS_RETRY = config('TICKET_EVENTS_RETRY', default=3000, cast=int)
+TICKET_EVENTS_CACHE_ALIAS = 'default'
+TICKET_EVENTS_CACHE_TIMEOUT = config('TICKET_EVENTS_CACHE_TIMEOUT', default=3600, cast=int)
+TICKET_EVENTS_POLL_INTERVAL = config('TICKET_EVENTS_POLL_INTERVAL', default=1, cast=float)
+
+# Sincronização incremental: alterações mais recentes que esta janela (segundos) ficam para a
+# próxima chamada, para que transações ainda em andamento não sejam puladas pelo cursor.
+TICKET_SYNC_SETTLE_SECONDS = config('TICKET_SYNC_SETTLE_SECONDS', default=5, cast=float)
+
+# Arquivamento: chamados resolvidos/cancelados há mais de TICKET_ARCHIVE_AFTER_DAYS dias são
+# movidos para core_ticketarchive pelo comando archive_tickets, em lotes de transações curtas.
+TICKET_ARCHIVE_AFTER_DAYS = config('TICKET_ARCHIVE_AFTER_DAYS', default=90, cast=int)
+TICKET_ARCHIVE_BATCH_SIZE = config('TICKET_ARCHIVE_BATCH_SIZE', default=500, cast=int)
+
+# Profiling de requisições: com REQUEST_PROFILING ativo, requisições com o cabeçalho
+# "X-Profile: 1" ou sorteadas por REQUEST_PROFILING_SAMPLE_RATE recebem o cabeçalho
+# Server-Timing (total, banco, serialização). As que passam de REQUEST_PROFILING_SLOW_MS
+# geram um log estruturado e, com REQUEST_PROFILING_DIR definido, um arquivo cProfile
+# (.prof); apenas os REQUEST_PROFILING_KEEP mais lentos são mantidos.
+REQUEST_PROFILING = config('REQUEST_PROFILING', default=False, cast=bool)
+REQUEST_PROFILING_SAMPLE_RATE = config('REQUEST_PROFILING_SAMPLE_RATE', default=0.0, cast=float)
+REQUEST_PROFILING_SLOW_MS = config('REQUEST_PROFILING_SLOW_MS', default=500, cast=float)
+REQUEST_PROFILING_DIR = config('REQUEST_PROFILING_DIR', default='')
+REQUEST_PROFILING_KEEP = config('REQUEST_PROFILING_KEEP', default=20, cast=int)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'config.profiling': {'handlers': ['console'], 'level': 'WARNING', 'propagate': False},
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -141,7 +276,7 @@ AUTH_USER_MODEL = 'authentication.User'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.authentication.ClaimsJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
@@ -151,6 +286,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': config('LOGIN_IP_RATE', default='60/min'),
+        'login_email': config('LOGIN_EMAIL_RATE', default='10/min'),
+    },
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
@@ -182,6 +321,15 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
+# Cache em processo dos usuários autenticados via JWT (segundos / quantidade de usuários)
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=30, cast=int)
+AUTH_USER_CACHE_SIZE = config('AUTH_USER_CACHE_SIZE', default=1024, cast=int)
+
+# Login: limite de verificações de senha (PBKDF2) simultâneas por processo
+LOGIN_MAX_CONCURRENT_CHECKS = config('LOGIN_MAX_CONCURRENT_CHECKS', default=2, cast=int)
+LOGIN_GATE_TIMEOUT = config('LOGIN_GATE_TIMEOUT', default=0.5, cast=float)
+LOGIN_RETRY_AFTER = config('LOGIN_RETRY_AFTER', default=2, cast=int)
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
@@ -15,10 +15,12 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 from core.views import TicketViewSet
+from core.async_views import ticket_detail, ticket_events, ticket_list, ticket_update_status
 from authentication.views import login_view, refresh_token_view
 
 router = DefaultRouter()
@@ -27,11 +29,20 @@ router.register(r'tickets', TicketViewSet, basename='ticket')
 urlpatterns = [
     path('api/auth/login/', login_view, name='login'),
     path('api/auth/refresh/', refresh_token_view, name='refresh'),
+    path('api/tickets/events/', ticket_events, name='ticket-events'),
     path('api/', include(router.urls)),
+    path('api/async/tickets/', ticket_list, name='async-ticket-list'),
+    path('api/async/tickets/<int:pk>/', ticket_detail, name='async-ticket-detail'),
+    path(
+        'api/async/tickets/<int:pk>/update_status/',
+        ticket_update_status,
+        name='async-ticket-update-status'
+    ),
     
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     
+    *staticfiles_urlpatterns(),
     path('', admin.site.urls),
 ]
@@ -1,15 +1,91 @@
+from datetime import datetime
+
 from django.contrib import admin
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db import connections, models, transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 from .models import Ticket, TicketStatus
+from .search import search_tickets
+from .transitions import change_status, change_statuses, is_valid_transition, loaded_status
+
+
+def _truncate(moment, kind):
+    return datetime(
+        moment.year,
+        1 if kind == 'year' else moment.month,
+        moment.day if kind == 'day' else 1,
+    )
+
+
+def _next(start, kind):
+    if kind == 'year':
+        return start.replace(year=start.year + 1)
+    if kind == 'month':
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return datetime.fromordinal(start.toordinal() + 1)
+
+
+class ChangelistQuerySet(models.QuerySet):
+    def datetimes(self, field_name, kind, order='ASC', tzinfo=None):
+        bounds = self.aggregate(first=Min(field_name), last=Max(field_name))
+        if bounds['first'] is None:
+            return []
+
+        tzinfo = tzinfo or timezone.get_current_timezone()
+        start = _truncate(timezone.localtime(bounds['first'], tzinfo), kind)
+        last = timezone.localtime(bounds['last'], tzinfo).replace(tzinfo=None)
+        buckets = []
+        while start <= last:
+            end = _next(start, kind)
+            bucket = timezone.make_aware(start, tzinfo)
+            if self.filter(**{
+                f'{field_name}__gte': bucket,
+                f'{field_name}__lt': timezone.make_aware(end, tzinfo),
+            }).exists():
+                buckets.append(bucket)
+            start = end
+        return buckets if order == 'ASC' else buckets[::-1]
+
+
+class CappedCountPaginator(Paginator):
+    count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        estimate = self._estimated_count(queryset)
+        if estimate is not None and estimate > self.count_limit:
+            return estimate
+        return queryset.order_by()[:self.count_limit].count()
+
+    def _estimated_count(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql' or queryset.query.where:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] > 0 else None
 
 
 @admin.register(Ticket)
 class TicketAdmin(admin.ModelAdmin):
     list_display = ['title', 'priority', 'status', 'attendant', 'created_at']
     list_filter = ['priority', 'status', 'created_at']
+    list_select_related = ['attendant']
     search_fields = ['title', 'description']
     readonly_fields = ['attendant', 'created_at', 'updated_at']
+    date_hierarchy = 'created_at'
+    paginator = CappedCountPaginator
+    show_full_result_count = False
+    actions = ['start_progress', 'resolve', 'cancel', 'reopen']
 
     fieldsets = (
         ('Informações Básicas', {
@@ -60,6 +136,9 @@ class TicketAdmin(admin.ModelAdmin):
             if 'status' in form.base_fields:
                 del form.base_fields['status']
 
+        if 'status' in form.base_fields:
+            form.base_fields['status'].show_hidden_initial = True
+
         return form
 
     def save_model(self, request, obj, form, change):
@@ -75,14 +154,98 @@ class TicketAdmin(admin.ModelAdmin):
                         messages.error(request, 'Usuários com perfil de atendente não podem alterar o status para "Resolvido".')
                         return
 
+            self._save_change(request, obj, form)
+            return
+
         super().save_model(request, obj, form, change)
 
+    def _save_change(self, request, obj, form):
+        expected_status = self._expected_status(obj, form)
+        if form is not None:
+            status_changed = 'status' in form.changed_data
+            changed_fields = [name for name in form.changed_data if name != 'status']
+        else:
+            status_changed = obj.status != expected_status
+            changed_fields = [
+                field.name for field in obj._meta.concrete_fields
+                if not field.primary_key and field.name not in ('status', 'updated_at')
+            ]
+
+        with transaction.atomic():
+            if status_changed and not change_status(obj, obj.status, expected_status, request.user):
+                messages.error(request, 'O status do chamado foi alterado por outra pessoa. Recarregue a página e tente novamente.')
+                return
+            if changed_fields:
+                obj.save(update_fields=[*changed_fields, 'updated_at'])
+
+    def _expected_status(self, obj, form):
+        if form is not None and 'status' in form.fields:
+            bound_field = form['status']
+            initial = form.data.get(bound_field.html_initial_name)
+            if initial:
+                return form.fields['status'].to_python(initial)
+        return loaded_status(obj)
+
+    @admin.action(description='Iniciar atendimento dos chamados selecionados', permissions=['change_status'])
+    def start_progress(self, request, queryset):
+        self._change_statuses(request, queryset, TicketStatus.IN_PROGRESS)
+
+    @admin.action(description='Resolver chamados selecionados', permissions=['change_status'])
+    def resolve(self, request, queryset):
+        self._change_statuses(request, queryset, TicketStatus.RESOLVED)
+
+    @admin.action(description='Cancelar chamados selecionados', permissions=['change_status'])
+    def cancel(self, request, queryset):
+        self._change_statuses(request, queryset, TicketStatus.CANCELED)
+
+    @admin.action(description='Reabrir chamados cancelados selecionados', permissions=['change_status'])
+    def reopen(self, request, queryset):
+        self._change_statuses(request, queryset, TicketStatus.OPEN)
+
+    def _change_statuses(self, request, queryset, new_status):
+        groups = {}
+        invalid = {}
+        with transaction.atomic():
+            rows = queryset.select_for_update().order_by().values_list('id', 'status')
+            for ticket_id, current_status in rows:
+                if is_valid_transition(current_status, new_status):
+                    groups.setdefault(current_status, []).append(ticket_id)
+                else:
+                    invalid[current_status] = invalid.get(current_status, 0) + 1
+            conflicts = change_statuses(groups, new_status, request.user)
+
+        label = TicketStatus(new_status).label
+        updated = sum(len(ticket_ids) for ticket_ids in groups.values()) - len(conflicts)
+        if updated:
+            messages.success(request, f'{updated} chamado(s) alterado(s) para "{label}".')
+        for current_status, count in invalid.items():
+            messages.warning(
+                request,
+                f'{count} chamado(s) ignorado(s): transição de "{TicketStatus(current_status).label}" '
+                f'para "{label}" não é permitida.'
+            )
+        if conflicts:
+            messages.warning(request, f'{len(conflicts)} chamado(s) ignorado(s): status alterado por outra requisição.')
+
+    def has_change_status_permission(self, request):
+        if request.user.is_superuser:
+            return True
+        return self.has_change_permission(request) and not (
+            hasattr(request.user, 'profile') and request.user.profile == 'attendant'
+        )
+
     def get_queryset(self, request):
         qs = super().get_queryset(request)
+        qs = ChangelistQuerySet(model=qs.model, query=qs.query, using=qs._db)
         if request.user.is_superuser:
             return qs
         return qs.filter(attendant=request.user)
 
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return search_tickets(queryset, search_term, rank=False), False
+
     def has_add_permission(self, request):
         return request.user and request.user.is_authenticated
 
@@ -0,0 +1,92 @@
+import time
+from datetime import timedelta
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .counters import record_created, ticket_state
+from .list_cache import bump_generation
+from .models import Ticket, TicketArchive, TicketStatus, TicketTombstone
+from .transitions import change_status
+
+CLOSED_STATUSES = (TicketStatus.RESOLVED, TicketStatus.CANCELED)
+TICKET_FIELDS = [field.attname for field in TicketArchive._meta.concrete_fields if field.name != 'archived_at']
+
+
+def archivable_tickets(older_than):
+    cutoff = timezone.now() - timedelta(days=older_than)
+    return Ticket.objects.filter(status__in=CLOSED_STATUSES, status_changed_at__lt=cutoff)
+
+
+def archive_batch(older_than, batch_size):
+    with transaction.atomic():
+        ids = list(
+            archivable_tickets(older_than)
+            .select_for_update()
+            .order_by()
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        rows = list(Ticket.objects.filter(id__in=ids).values(*TICKET_FIELDS))
+        TicketArchive.objects.bulk_create([TicketArchive(**row) for row in rows])
+        TicketTombstone.objects.bulk_create([
+            TicketTombstone(ticket_id=row['id'], attendant_id=row['attendant_id']) for row in rows
+        ])
+        _delete_archived_rows(ids)
+        bump_generation()
+    return len(rows)
+
+
+def _delete_archived_rows(ids):
+    # DELETE direto, sem passar pelos sinais de Ticket: o chamado continua existindo em
+    # TicketArchive, então contadores e lápides (já gravadas acima) não devem mudar.
+    connection = connections[Ticket.objects.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {connection.ops.quote_name(Ticket._meta.db_table)} '
+            f'WHERE id IN ({", ".join(["%s"] * len(ids))})',
+            ids
+        )
+
+
+def archive_closed_tickets(older_than, batch_size, pause=0, on_batch=None):
+    archived = 0
+    while True:
+        count = archive_batch(older_than, batch_size)
+        if not count:
+            return archived
+        archived += count
+        if on_batch:
+            on_batch(archived)
+        if pause:
+            time.sleep(pause)
+
+
+def restore_ticket(archived):
+    with transaction.atomic():
+        deleted, _ = TicketArchive.objects.filter(pk=archived.pk).delete()
+        if not deleted:
+            return None
+
+        ticket = Ticket(**{field: getattr(archived, field) for field in TICKET_FIELDS})
+        Ticket.objects.bulk_create([ticket])
+        record_created([ticket_state(ticket)])
+        Ticket.objects.filter(pk=ticket.pk).update(
+            created_at=archived.created_at, updated_at=archived.updated_at
+        )
+        ticket.created_at = archived.created_at
+        ticket.updated_at = archived.updated_at
+        TicketTombstone.objects.filter(ticket_id=ticket.pk).delete()
+        bump_generation()
+    return ticket
+
+
+def reopen_archived(archived, new_status, changed_by=None):
+    with transaction.atomic():
+        ticket = restore_ticket(archived)
+        if ticket is None:
+            return None
+        change_status(ticket, new_status, expected_status=archived.status, changed_by=changed_by)
+    return ticket
@@ -0,0 +1,263 @@
+import asyncio
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Count, Max
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from authentication.authentication import ClaimsJWTAuthentication, ClaimsUser
+from authentication.tokens import USER_CLAIMS
+from config.db_router import is_pinned
+from config.profiling import serialization
+
+from .events import format_event, format_reset, get_broker, visibility_filter
+from .list_cache import aget_cached_list, alist_cache_key, aset_cached_list, list_cache_enabled
+from .serializers import TicketListSerializer, TicketSerializer
+from .views import TicketViewSet
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    with serialization():
+        content = JSONRenderer().render(data)
+    return HttpResponse(
+        content,
+        status=status_code,
+        content_type='application/json'
+    )
+
+
+def api_errors(view_func):
+    @wraps(view_func)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            return await view_func(request, *args, **kwargs)
+        except APIException as error:
+            detail = error.detail if isinstance(error.detail, (dict, list)) else {'detail': error.detail}
+            return json_response(detail, error.status_code)
+    return wrapper
+
+
+async def authenticate(request, query_token=False):
+    authenticator = ClaimsJWTAuthentication()
+    drf_request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+
+    header = authenticator.get_header(drf_request)
+    raw_token = authenticator.get_raw_token(header) if header else None
+    if raw_token is None and query_token and request.GET.get('access_token'):
+        raw_token = request.GET['access_token'].encode()
+    if raw_token is None:
+        return drf_request, None
+
+    validated_token = authenticator.get_validated_token(raw_token)
+    if all(claim in validated_token for claim in USER_CLAIMS):
+        user = ClaimsUser(validated_token)
+    else:
+        user = await sync_to_async(authenticator.get_user)(validated_token)
+
+    drf_request.user = user
+    drf_request.auth = validated_token
+    return drf_request, user
+
+
+async def prepare(request, action, query_token=False, **kwargs):
+    drf_request, user = await authenticate(request, query_token)
+
+    if user is None:
+        return None, json_response(
+            {'detail': 'As credenciais de autenticação não foram fornecidas.'},
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    view = TicketViewSet(
+        request=drf_request, action=action, format_kwarg=None, args=(), kwargs=kwargs
+    )
+    return view, None
+
+
+def page_links(request, page_number, page_size, total):
+    url = request.build_absolute_uri()
+    next_link = None
+    if page_number * page_size < total:
+        next_link = replace_query_param(url, 'page', page_number + 1)
+
+    previous_link = None
+    if page_number > 1:
+        previous_link = (
+            remove_query_param(url, 'page') if page_number == 2
+            else replace_query_param(url, 'page', page_number - 1)
+        )
+    return next_link, previous_link
+
+
+async def get_ticket(view, pk):
+    ticket = await view.get_queryset().filter(pk=pk).afirst()
+    if ticket is None:
+        ticket = await view.get_archive_queryset().filter(pk=pk).afirst()
+    return ticket
+
+
+@api_errors
+async def ticket_list(request):
+    view, error = await prepare(request, 'list')
+    if error:
+        return error
+    drf_request = view.request
+
+    if view._wants_keyset_pagination():
+        return json_response(
+            {'error': 'Paginação por cursor não é suportada neste endpoint; use /api/tickets/.'},
+            status.HTTP_400_BAD_REQUEST
+        )
+
+    cache_key = None if is_pinned() or not list_cache_enabled() else await alist_cache_key(view._visibility_scope(drf_request.user), drf_request)
+    cached = await aget_cached_list(cache_key) if cache_key else None
+    if cached is not None:
+        data, etag, last_modified = cached
+        not_modified = view._conditional_response(drf_request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return view._with_validators(json_response(data), etag, last_modified)
+
+    querysets = view.filter_list_querysets()
+
+    summary = view.list_summary([
+        await queryset.order_by().aaggregate(last_modified=Max('updated_at'), total=Count('id'))
+        for queryset in querysets
+    ])
+    etag = view._etag(drf_request, summary['total'], summary['last_modified'])
+    not_modified = view._conditional_response(drf_request, etag, summary['last_modified'])
+    if not_modified is not None:
+        return not_modified
+
+    page_size = api_settings.PAGE_SIZE
+    try:
+        page_number = int(drf_request.query_params.get('page', 1))
+    except ValueError:
+        page_number = 0
+    if page_number < 1 or (page_number > 1 and (page_number - 1) * page_size >= summary['total']):
+        return json_response({'detail': 'Página inválida.'}, status.HTTP_404_NOT_FOUND)
+
+    offset = (page_number - 1) * page_size
+    rows = view.list_rows(querysets)
+    serializer = TicketListSerializer()
+    with serialization():
+        results = [
+            serializer.to_representation(row)
+            async for row in rows[offset:offset + page_size]
+        ]
+
+    next_link, previous_link = page_links(drf_request, page_number, page_size, summary['total'])
+    data = {
+        'count': summary['total'],
+        'next': next_link,
+        'previous': previous_link,
+        'results': results,
+    }
+
+    if cache_key:
+        await aset_cached_list(cache_key, (data, etag, summary['last_modified']))
+    return view._with_validators(json_response(data), etag, summary['last_modified'])
+
+
+@api_errors
+async def ticket_detail(request, pk):
+    view, error = await prepare(request, 'retrieve', pk=pk)
+    if error:
+        return error
+
+    ticket = await get_ticket(view, pk)
+    if ticket is None:
+        return json_response({'detail': 'Não encontrado.'}, status.HTTP_404_NOT_FOUND)
+
+    etag = view._etag(view.request, ticket.pk, ticket.updated_at)
+    not_modified = view._conditional_response(view.request, etag, ticket.updated_at)
+    if not_modified is not None:
+        return not_modified
+
+    with serialization():
+        data = TicketSerializer(ticket).data
+    return view._with_validators(json_response(data), etag, ticket.updated_at)
+
+
+@api_errors
+async def ticket_update_status(request, pk):
+    if request.method != 'PATCH':
+        return json_response(
+            {'detail': f'Método "{request.method}" não permitido.'},
+            status.HTTP_405_METHOD_NOT_ALLOWED
+        )
+
+    view, error = await prepare(request, 'update_status', pk=pk)
+    if error:
+        return error
+
+    ticket = await get_ticket(view, pk)
+    if ticket is None:
+        return json_response({'detail': 'Não encontrado.'}, status.HTTP_404_NOT_FOUND)
+
+    data, status_code = await sync_to_async(view._update_status)(
+        ticket, view.request.user, view.request.data
+    )
+    return json_response(data, status_code)
+
+
+async def event_stream(broker, subscription, missed, deadline):
+    try:
+        yield f'retry: {settings.TICKET_EVENTS_RETRY}\n\n'
+        if missed is None:
+            yield format_reset(await broker.alast_event_id())
+        else:
+            for event in missed:
+                if subscription.accepts(event):
+                    yield format_event(event)
+
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), min(settings.TICKET_EVENTS_HEARTBEAT, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ': ping\n\n'
+                continue
+            yield format_reset(await broker.alast_event_id()) if event is None else format_event(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@api_errors
+async def ticket_events(request):
+    if not isinstance(request, ASGIRequest):
+        return json_response(
+            {'error': 'O stream de eventos exige o servidor ASGI.'},
+            status.HTTP_501_NOT_IMPLEMENTED
+        )
+
+    view, error = await prepare(request, 'events', query_token=True)
+    if error:
+        return error
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    broker = get_broker()
+    subscription, missed = await broker.subscribe(
+        visibility_filter(view._visibility_scope(view.request.user)), last_event_id
+    )
+
+    response = StreamingHttpResponse(
+        event_stream(broker, subscription, missed, view.request.auth['exp']),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
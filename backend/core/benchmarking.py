@@ -0,0 +1,34 @@
+import json
+import urllib.error
+import urllib.request
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+def http_json(method, url, body=None, token=None, timeout=60):
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method)
+    request.add_header('Content-Type', 'application/json')
+    if token:
+        request.add_header('Authorization', f'Bearer {token}')
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read() or b'null')
+    except urllib.error.HTTPError as error:
+        return error.code, None
+    except OSError:
+        return 0, None
+
+
+def latency_summary(latencies):
+    return (
+        f'p50={percentile(latencies, 0.50):.1f}ms '
+        f'p95={percentile(latencies, 0.95):.1f}ms '
+        f'p99={percentile(latencies, 0.99):.1f}ms'
+    )
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+from django.utils.module_loading import import_string
+
+from .events import CacheBroker
+from .list_cache import is_shared_cache
+
+
+@register()
+def check_ticket_events(app_configs, **kwargs):
+    if settings.WEB_CONCURRENCY <= 1:
+        return []
+
+    broker = import_string(settings.TICKET_EVENTS_BACKEND)
+    if not issubclass(broker, CacheBroker):
+        return [Error(
+            f'{settings.TICKET_EVENTS_BACKEND} só entrega eventos às conexões do próprio processo, '
+            f'mas WEB_CONCURRENCY={settings.WEB_CONCURRENCY}.',
+            hint='Use TICKET_EVENTS_BACKEND=core.events.CacheBroker com um cache compartilhado.',
+            id='core.E001',
+        )]
+    if not is_shared_cache(settings.TICKET_EVENTS_CACHE_ALIAS):
+        return [Error(
+            f'O cache "{settings.TICKET_EVENTS_CACHE_ALIAS}" do CacheBroker é local ao processo, '
+            f'mas WEB_CONCURRENCY={settings.WEB_CONCURRENCY}.',
+            hint='Configure CACHE_BACKEND com um backend compartilhado (Redis, Memcached ou banco).',
+            id='core.E002',
+        )]
+    return []
+
+
+@register()
+def check_ticket_list_cache(app_configs, **kwargs):
+    if (
+        settings.TICKET_LIST_CACHE_TIMEOUT <= 0 or settings.WEB_CONCURRENCY <= 1
+        or is_shared_cache(settings.TICKET_LIST_CACHE_ALIAS)
+    ):
+        return []
+    return [Warning(
+        f'O cache de listas de chamados está desativado: com WEB_CONCURRENCY={settings.WEB_CONCURRENCY}, '
+        f'o cache "{settings.TICKET_LIST_CACHE_ALIAS}" é local ao processo e não seria invalidado entre workers.',
+        hint='Configure CACHE_BACKEND com um backend compartilhado (Redis, Memcached ou banco).',
+        id='core.W001',
+    )]
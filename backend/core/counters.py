@@ -0,0 +1,166 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import CounterDimension, Ticket, TicketArchive, TicketCounter
+
+TRACKED_FIELDS = ('status', 'priority', 'attendant_id')
+
+
+def ticket_state(ticket):
+    return {field: ticket.__dict__.get(field) for field in TRACKED_FIELDS}
+
+
+def _keys(state):
+    return [
+        (CounterDimension.STATUS, state['status']),
+        (CounterDimension.PRIORITY, state['priority']),
+        (CounterDimension.ATTENDANT, str(state['attendant_id'])),
+    ]
+
+
+def apply_deltas(deltas):
+    for (dimension, key), delta in deltas.items():
+        if not delta:
+            continue
+        updated = TicketCounter.objects.filter(dimension=dimension, key=key).update(
+            count=F('count') + delta
+        )
+        if updated:
+            continue
+        try:
+            with transaction.atomic():
+                TicketCounter.objects.create(dimension=dimension, key=key, count=delta)
+        except IntegrityError:
+            TicketCounter.objects.filter(dimension=dimension, key=key).update(
+                count=F('count') + delta
+            )
+
+
+def record_created(states):
+    deltas = Counter()
+    for state in states:
+        for key in _keys(state):
+            deltas[key] += 1
+    apply_deltas(deltas)
+
+
+def record_deleted(states):
+    deltas = Counter()
+    for state in states:
+        for key in _keys(state):
+            deltas[key] -= 1
+    apply_deltas(deltas)
+
+
+def record_changed(before, after):
+    deltas = Counter()
+    for key in _keys(before):
+        deltas[key] -= 1
+    for key in _keys(after):
+        deltas[key] += 1
+    apply_deltas(deltas)
+
+
+def record_status_moved(moved, new_status):
+    deltas = Counter()
+    for old_status, count in moved.items():
+        deltas[(CounterDimension.STATUS, old_status)] -= count
+        deltas[(CounterDimension.STATUS, new_status)] += count
+    apply_deltas(deltas)
+
+
+def get_stats():
+    stats = {
+        'total': 0,
+        'by_status': {},
+        'by_priority': {},
+        'by_attendant': {},
+    }
+    for dimension, key, count in TicketCounter.objects.values_list('dimension', 'key', 'count'):
+        if not count:
+            continue
+        stats[f'by_{dimension}'][key] = count
+        if dimension == CounterDimension.STATUS:
+            stats['total'] += count
+    return stats
+
+
+def compute_counts():
+    counts = Counter()
+    for model in (Ticket, TicketArchive):
+        for field, dimension in (
+            ('status', CounterDimension.STATUS),
+            ('priority', CounterDimension.PRIORITY),
+            ('attendant_id', CounterDimension.ATTENDANT),
+        ):
+            rows = model.objects.order_by().values_list(field).annotate(total=Count('id'))
+            for key, total in rows:
+                counts[(dimension, str(key))] += total
+    return counts
+
+
+def reconcile(dry_run=False):
+    with transaction.atomic():
+        expected = compute_counts()
+        current = {
+            (dimension, key): count
+            for dimension, key, count in (
+                TicketCounter.objects.select_for_update().values_list('dimension', 'key', 'count')
+            )
+        }
+
+        drift = {
+            key: (current.get(key, 0), expected.get(key, 0))
+            for key in set(current) | set(expected)
+            if current.get(key, 0) != expected.get(key, 0)
+        }
+
+        if not dry_run:
+            TicketCounter.objects.all().delete()
+            TicketCounter.objects.bulk_create([
+                TicketCounter(dimension=dimension, key=key, count=count)
+                for (dimension, key), count in expected.items()
+            ])
+
+    return drift
+
+
+@receiver(post_init, sender=Ticket)
+def remember_ticket_state(sender, instance, **kwargs):
+    instance._counter_state = ticket_state(instance)
+
+
+@receiver(pre_save, sender=Ticket)
+def load_ticket_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        return
+    if None in instance._counter_state.values():
+        stored = Ticket.objects.filter(pk=instance.pk).values(*TRACKED_FIELDS).first()
+        if stored:
+            instance._counter_state = stored
+
+
+@receiver(post_save, sender=Ticket)
+def count_saved_ticket(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    state = ticket_state(instance)
+    if created:
+        record_created([state])
+    elif state != instance._counter_state:
+        record_changed(instance._counter_state, state)
+    instance._counter_state = state
+
+
+@receiver(post_delete, sender=Ticket)
+def count_deleted_ticket(sender, instance, **kwargs):
+    record_deleted([ticket_state(instance)])
+
+
+@receiver(post_delete, sender=TicketArchive)
+def count_deleted_archive(sender, instance, **kwargs):
+    record_deleted([ticket_state(instance)])
@@ -0,0 +1,315 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .models import Ticket
+from .serializers import TicketListSerializer
+
+TICKET_CREATED = 'ticket_created'
+TICKET_STATUS_CHANGED = 'ticket_status_changed'
+RESET = 'reset'
+PUBLISH_BATCH_SIZE = 500
+
+
+class Subscription:
+    def __init__(self, loop, accepts, queue_size):
+        self.loop = loop
+        self.accepts = accepts
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+        self.after = 0
+
+    def deliver(self, event):
+        if self.overflowed or not self.accepts(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self):
+        if self.overflowed:
+            self._drain()
+            return None
+        event = await self.queue.get()
+        if self.overflowed:
+            self._drain()
+            return None
+        return event
+
+    def reset(self):
+        self._drain()
+        self.queue.put_nowait(None)
+
+    def _drain(self):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.overflowed = False
+
+
+class InProcessBroker:
+    def __init__(self):
+        self.epoch = format(time.time_ns(), 'x')
+        self.sequence = 0
+        self.history = deque(maxlen=settings.TICKET_EVENTS_HISTORY)
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    @property
+    def last_event_id(self):
+        return self._format_id(self.sequence)
+
+    def publish(self, events):
+        with self.lock:
+            published = []
+            for event in events:
+                self.sequence += 1
+                published.append(dict(event, id=self._format_id(self.sequence)))
+            self.history.extend(published)
+            targets = self._targets()
+        self._fan_out(targets, published)
+        return published
+
+    async def alast_event_id(self):
+        return self.last_event_id
+
+    async def subscribe(self, accepts, last_event_id=None):
+        subscription = self._subscription(accepts)
+        with self.lock:
+            missed = self._since(last_event_id)
+            self.subscribers.setdefault(subscription.loop, set()).add(subscription)
+        return subscription, missed
+
+    def _subscription(self, accepts):
+        return Subscription(asyncio.get_running_loop(), accepts, settings.TICKET_EVENTS_QUEUE_SIZE)
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscribers.get(subscription.loop)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self.subscribers[subscription.loop]
+
+    def _targets(self):
+        return [(loop, list(subscriptions)) for loop, subscriptions in self.subscribers.items()]
+
+    def _fan_out(self, targets, events):
+        if not events:
+            return
+        for loop, subscriptions in targets:
+            try:
+                loop.call_soon_threadsafe(self._deliver, subscriptions, events)
+            except RuntimeError:
+                with self.lock:
+                    self.subscribers.pop(loop, None)
+
+    def _deliver(self, subscriptions, events):
+        for subscription in subscriptions:
+            for event in events:
+                subscription.deliver(event)
+
+    def _since(self, last_event_id):
+        if not last_event_id:
+            return []
+        sequence = self._parse_id(last_event_id)
+        if sequence is None or sequence > self.sequence:
+            return None
+        if self.history and sequence < self._parse_id(self.history[0]['id']) - 1:
+            return None
+        return [event for event in self.history if self._parse_id(event['id']) > sequence]
+
+    def _format_id(self, sequence):
+        return f'{self.epoch}-{sequence}'
+
+    def _parse_id(self, event_id):
+        epoch, _, sequence = str(event_id).partition('-')
+        if epoch != self.epoch or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+
+class CacheBroker(InProcessBroker):
+    sequence_key = 'tickets:events:sequence'
+
+    def __init__(self):
+        super().__init__()
+        self.cache = caches[settings.TICKET_EVENTS_CACHE_ALIAS]
+        self.timeout = settings.TICKET_EVENTS_CACHE_TIMEOUT
+        self.pollers = {}
+
+    @property
+    def last_event_id(self):
+        return self._format_id(self.cache.get(self.sequence_key) or 0)
+
+    async def alast_event_id(self):
+        return self._format_id(await self._current_sequence())
+
+    def publish(self, events):
+        published = []
+        sequence = self.cache.get(self.sequence_key) or 0
+        for event in events:
+            # add() só grava se a chave ainda não existe: reserva o id e grava o evento de uma
+            # vez, antes de a sequência anunciá-lo. Assim todo id até a sequência já está no cache.
+            while True:
+                sequence += 1
+                event = dict(event, id=self._format_id(sequence))
+                if self.cache.add(self._event_key(event['id']), event, timeout=self.timeout):
+                    break
+            published.append(event)
+        if published:
+            self.cache.add(self.sequence_key, 0, timeout=None)
+            self.cache.incr(self.sequence_key, len(published))
+        return published
+
+    async def subscribe(self, accepts, last_event_id=None):
+        subscription = self._subscription(accepts)
+        current = await self._current_sequence()
+        subscription.after = current
+        with self.lock:
+            self.subscribers.setdefault(subscription.loop, set()).add(subscription)
+        self._ensure_poller(subscription.loop, current)
+        return subscription, await self._since(last_event_id, current)
+
+    def _ensure_poller(self, loop, sequence):
+        with self.lock:
+            poller = self.pollers.get(loop)
+            if poller is None or poller.done():
+                self.pollers[loop] = loop.create_task(self._poll(loop, sequence))
+
+    async def _poll(self, loop, sequence):
+        missing = None
+        while True:
+            with self.lock:
+                if not self.subscribers.get(loop):
+                    self.pollers.pop(loop, None)
+                    return
+            await asyncio.sleep(settings.TICKET_EVENTS_POLL_INTERVAL)
+            current = await self._current_sequence()
+            if current <= sequence:
+                continue
+            events = await self._fetch(sequence, current)
+            sequence += len(events)
+            # Nunca avança além do primeiro evento ausente: tenta de novo na próxima volta e, se
+            # ele continuar faltando (removido do cache), pula-o e manda os clientes recarregarem.
+            lost = sequence < current and missing == sequence + 1
+            missing = sequence + 1 if sequence < current and not lost else None
+            if lost:
+                sequence += 1
+            with self.lock:
+                subscriptions = list(self.subscribers.get(loop, ()))
+            self._deliver(subscriptions, events)
+            if lost:
+                for subscription in subscriptions:
+                    subscription.reset()
+
+    def _deliver(self, subscriptions, events):
+        for subscription in subscriptions:
+            for event in events:
+                if self._parse_id(event['id']) > subscription.after:
+                    subscription.deliver(event)
+
+    async def _since(self, last_event_id, current):
+        if not last_event_id:
+            return []
+        sequence = self._parse_id(last_event_id)
+        if sequence is None or sequence > current or current - sequence > self.history.maxlen:
+            return None
+        events = await self._fetch(sequence, current)
+        if len(events) != current - sequence:
+            return None
+        return events
+
+    async def _fetch(self, after, until):
+        keys = [self._event_key(self._format_id(sequence)) for sequence in range(after + 1, until + 1)]
+        found = await self.cache.aget_many(keys)
+        events = []
+        for key in keys:
+            if key not in found:
+                break
+            events.append(found[key])
+        return events
+
+    async def _current_sequence(self):
+        return await self.cache.aget(self.sequence_key) or 0
+
+    def _event_key(self, event_id):
+        return f'tickets:events:{event_id}'
+
+    def _format_id(self, sequence):
+        return str(sequence)
+
+    def _parse_id(self, event_id):
+        event_id = str(event_id)
+        return int(event_id) if event_id.isdigit() else None
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(settings.TICKET_EVENTS_BACKEND)()
+
+
+def visibility_filter(scope):
+    if scope in ('superuser', 'technician'):
+        return lambda event: True
+    return lambda event: f"attendant:{event['ticket']['attendant']['id']}" == scope
+
+
+def format_event(event):
+    data = json.dumps(event['ticket'], separators=(',', ':'), ensure_ascii=False)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+def format_reset(last_event_id):
+    return f'id: {last_event_id}\nevent: {RESET}\ndata: {{}}\n\n'
+
+
+def publish_ticket_events(event_type, ticket_ids):
+    ticket_ids = list(ticket_ids)
+    if ticket_ids:
+        transaction.on_commit(lambda: _publish(event_type, ticket_ids), robust=True)
+
+
+def batched(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _publish(event_type, ticket_ids):
+    serializer = TicketListSerializer()
+    rows = (
+        row
+        for batch in batched(sorted(ticket_ids), PUBLISH_BATCH_SIZE)
+        for row in Ticket.objects.filter(id__in=batch).order_by('id').values(*TicketListSerializer.values_fields)
+    )
+    get_broker().publish(
+        {'type': event_type, 'ticket': serializer.to_representation(row)} for row in rows
+    )
+
+
+@receiver(pre_save, sender=Ticket)
+def remember_published_status(sender, instance, raw=False, **kwargs):
+    if not raw:
+        instance._status_before_save = instance._counter_state['status']
+
+
+@receiver(post_save, sender=Ticket)
+def publish_saved_ticket(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        publish_ticket_events(TICKET_CREATED, [instance.pk])
+    elif instance.status != getattr(instance, '_status_before_save', instance.status):
+        publish_ticket_events(TICKET_STATUS_CHANGED, [instance.pk])
@@ -0,0 +1,61 @@
+import csv
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+from .serializers import TicketListSerializer
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+
+CSV_COLUMNS = [
+    'id', 'title', 'description', 'priority', 'priority_display', 'status', 'status_display',
+    'attendant_id', 'attendant_email', 'attendant_profile', 'created_at', 'updated_at',
+]
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def export_rows(rows, chunk_size=2000):
+    serializer = TicketListSerializer()
+    for row in rows.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(row)
+
+
+def iter_csv(tickets):
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for ticket in tickets:
+        attendant = ticket.pop('attendant')
+        ticket['attendant_id'] = attendant['id']
+        ticket['attendant_email'] = attendant['email']
+        ticket['attendant_profile'] = attendant['profile']
+        yield writer.writerow([ticket[column] for column in CSV_COLUMNS])
+
+
+def iter_ndjson(tickets):
+    for ticket in tickets:
+        yield json.dumps(ticket, ensure_ascii=False) + '\n'
+
+
+def iter_export(rows, export_format, chunk_size=2000):
+    tickets = export_rows(rows, chunk_size=chunk_size)
+    if export_format == 'csv':
+        return iter_csv(tickets)
+    return iter_ndjson(tickets)
+
+
+async def aiter_export(rows, export_format, chunk_size=2000):
+    # No ASGI o Django leria um iterador síncrono inteiro com list() antes do primeiro byte:
+    # aqui cada lote é gerado numa thread e enviado antes de o próximo ser lido.
+    chunks = iter_export(rows, export_format, chunk_size=chunk_size)
+    next_batch = sync_to_async(lambda: list(islice(chunks, chunk_size)))
+    while batch := await next_batch():
+        for chunk in batch:
+            yield chunk
@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+from django.db.models import Case, Count, DurationField, F, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Ticket, TicketStatus, TicketStatusEvent
+
+TIME_FIELDS = {
+    TicketStatus.OPEN: 'time_open',
+    TicketStatus.IN_PROGRESS: 'time_in_progress',
+    TicketStatus.RESOLVED: 'time_resolved',
+    TicketStatus.CANCELED: 'time_canceled',
+}
+
+
+def is_reopen(from_status, to_status):
+    return from_status == TicketStatus.RESOLVED and to_status == TicketStatus.IN_PROGRESS
+
+
+def rollup_updates(from_status, to_status, now):
+    time_field = TIME_FIELDS[from_status]
+    updates = {
+        'status_changed_at': now,
+        time_field: F(time_field) + (Value(now) - F('status_changed_at')),
+    }
+    if is_reopen(from_status, to_status):
+        updates['reopen_count'] = F('reopen_count') + 1
+    return updates
+
+
+def expire_rollups(ticket, now):
+    ticket.status_changed_at = now
+    for field in ('reopen_count', *TIME_FIELDS.values()):
+        ticket.__dict__.pop(field, None)
+
+
+def record_transitions(ticket_ids, from_status, to_status, now, changed_by=None):
+    TicketStatusEvent.objects.bulk_create([
+        TicketStatusEvent(
+            ticket_id=ticket_id,
+            from_status=from_status,
+            to_status=to_status,
+            changed_by_id=changed_by.pk if changed_by else None,
+            created_at=now
+        )
+        for ticket_id in ticket_ids
+    ])
+
+
+def record_initial_statuses(tickets, changed_by=None):
+    TicketStatusEvent.objects.bulk_create([
+        TicketStatusEvent(
+            ticket_id=ticket.pk,
+            to_status=ticket.status,
+            changed_by_id=changed_by.pk if changed_by else None,
+            created_at=ticket.status_changed_at
+        )
+        for ticket in tickets
+    ])
+
+
+def sla_report(*querysets, now=None):
+    now = now or timezone.now()
+    aggregates = {
+        'total': Count('id'),
+        'reopened': Count('id', filter=Q(reopen_count__gt=0)),
+        'reopens': Coalesce(Sum('reopen_count'), 0),
+    }
+    for ticket_status, time_field in TIME_FIELDS.items():
+        current = Case(
+            When(status=ticket_status, then=Value(now) - F('status_changed_at')),
+            default=Value(timedelta()),
+            output_field=DurationField()
+        )
+        aggregates[ticket_status] = Coalesce(
+            Sum(F(time_field) + current, output_field=DurationField()),
+            Value(timedelta()),
+            output_field=DurationField()
+        )
+
+    totals = {}
+    for queryset in querysets:
+        for key, value in queryset.order_by().aggregate(**aggregates).items():
+            totals[key] = totals[key] + value if key in totals else value
+    total = totals['total']
+    return {
+        'total': total,
+        'reopened': totals['reopened'],
+        'reopens': totals['reopens'],
+        'seconds': {
+            ticket_status: {
+                'total': totals[ticket_status].total_seconds(),
+                'average': totals[ticket_status].total_seconds() / total if total else 0,
+            }
+            for ticket_status in TIME_FIELDS
+        },
+    }
+
+
+@receiver(pre_save, sender=Ticket)
+def remember_history_status(sender, instance, raw=False, **kwargs):
+    if not raw:
+        instance._status_before_history = instance._counter_state['status']
+
+
+@receiver(post_save, sender=Ticket)
+def record_saved_status(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        record_initial_statuses([instance])
+        return
+
+    from_status = instance._status_before_history
+    if from_status is None or from_status == instance.status:
+        return
+
+    now = timezone.now()
+    Ticket.objects.filter(pk=instance.pk).update(**rollup_updates(from_status, instance.status, now))
+    record_transitions([instance.pk], from_status, instance.status, now)
+    expire_rollups(instance, now)
@@ -0,0 +1,159 @@
+import csv
+import json
+
+from django.db import transaction
+
+from authentication.models import User
+
+from .counters import record_created, ticket_state
+from .events import TICKET_CREATED, publish_ticket_events
+from .history import record_initial_statuses
+from .list_cache import bump_generation
+from .models import Ticket
+from .serializers import TicketImportSerializer
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+def detect_format(name, requested=None):
+    if requested:
+        return requested if requested in IMPORT_FORMATS else None
+    name = (name or '').lower()
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if name.endswith('.csv'):
+        return 'csv'
+    return None
+
+
+def _decoded_lines(stream, decode_errors):
+    # Decodifica linha a linha: um byte inválido invalida só o registro que o contém.
+    for line_number, line in enumerate(stream, start=1):
+        encoding = 'utf-8-sig' if line_number == 1 else 'utf-8'
+        try:
+            yield line.decode(encoding)
+        except UnicodeDecodeError as error:
+            decode_errors.append(error)
+            yield line.decode(encoding, errors='replace')
+
+
+def iter_csv_rows(stream):
+    decode_errors = []
+    reader = csv.DictReader(_decoded_lines(stream, decode_errors))
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as error:
+            # O leitor recomeça no registro seguinte; só a linha defeituosa é descartada.
+            decode_errors.clear()
+            yield reader.reader.line_num, None, f'Linha inválida: {error}'
+            continue
+
+        if decode_errors:
+            error = decode_errors[0]
+            decode_errors.clear()
+            yield reader.line_num, None, f'Linha inválida: {error}'
+            continue
+        yield reader.line_num, row, None
+
+
+def iter_ndjson_rows(stream):
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except (ValueError, UnicodeDecodeError) as error:
+            yield line_number, None, f'JSON inválido: {error}'
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, 'Cada linha deve ser um objeto JSON.'
+            continue
+        yield line_number, row, None
+
+
+def iter_rows(stream, file_format):
+    if file_format == 'csv':
+        return iter_csv_rows(stream)
+    return iter_ndjson_rows(stream)
+
+
+class TicketImporter:
+    def __init__(self, default_attendant, batch_size=500, max_errors=1000):
+        self.default_attendant = default_attendant
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def run(self, rows, on_error=None):
+        self.on_error = on_error
+        batch = []
+
+        for row_number, data, error in rows:
+            if error:
+                self._fail(row_number, {'non_field_errors': [error]})
+                continue
+
+            serializer = TicketImportSerializer(data=self._clean(data))
+            if not serializer.is_valid():
+                self._fail(row_number, serializer.errors)
+                continue
+
+            batch.append((row_number, serializer.validated_data))
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+        if batch:
+            self._flush(batch)
+
+        return self.report()
+
+    def report(self):
+        return {
+            'created': self.created,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+    def _clean(self, data):
+        return {
+            key: value for key, value in data.items()
+            if key and not (isinstance(value, str) and value == '')
+        }
+
+    def _flush(self, batch):
+        attendant_ids = {data['attendant'] for _, data in batch if 'attendant' in data}
+        existing = set(
+            User.objects.filter(id__in=attendant_ids).values_list('id', flat=True)
+        ) if attendant_ids else set()
+
+        tickets = []
+        for row_number, data in batch:
+            data = dict(data)
+            attendant_id = data.pop('attendant', self.default_attendant.pk)
+            if attendant_id not in existing and attendant_id != self.default_attendant.pk:
+                self._fail(row_number, {'attendant': ['Atendente não encontrado.']})
+                continue
+            tickets.append(Ticket(attendant_id=attendant_id, **data))
+
+        with transaction.atomic():
+            Ticket.objects.bulk_create(tickets, batch_size=self.batch_size)
+            record_created(ticket_state(ticket) for ticket in tickets)
+            record_initial_statuses(tickets, self.default_attendant)
+            bump_generation()
+            publish_ticket_events(TICKET_CREATED, (ticket.pk for ticket in tickets))
+        self.created += len(tickets)
+
+    def _fail(self, row_number, errors):
+        self.failed += 1
+        error = {'row': row_number, 'errors': errors}
+        if len(self.errors) < self.max_errors:
+            self.errors.append(error)
+        if self.on_error:
+            self.on_error(error)
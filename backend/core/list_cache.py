@@ -0,0 +1,102 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.http import urlencode
+
+from authentication.models import User
+
+from .models import Ticket
+
+GENERATION_KEY = 'tickets:list:generation'
+
+
+def is_shared_cache(alias):
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def get_cache():
+    return caches[settings.TICKET_LIST_CACHE_ALIAS]
+
+
+def list_cache_enabled():
+    # A geração fica no próprio cache: com vários workers e um cache local ao processo, uma
+    # escrita atendida por um deles não invalidaria as listas guardadas pelos outros.
+    return settings.TICKET_LIST_CACHE_TIMEOUT > 0 and (
+        settings.WEB_CONCURRENCY <= 1 or is_shared_cache(settings.TICKET_LIST_CACHE_ALIAS)
+    )
+
+
+def get_generation():
+    cache = get_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(GENERATION_KEY, 1)
+    return generation
+
+
+async def aget_generation():
+    cache = get_cache()
+    generation = await cache.aget(GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(GENERATION_KEY, 1, timeout=None)
+        generation = await cache.aget(GENERATION_KEY, 1)
+    return generation
+
+
+def _increment():
+    cache = get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+
+
+def bump_generation():
+    _increment()
+    transaction.on_commit(_increment)
+
+
+def _list_cache_key(generation, scope, request):
+    params = sorted((key, sorted(values)) for key, values in request.query_params.lists())
+    raw = f'{request.get_host()}|{request.path}|{urlencode(params, doseq=True)}'
+    digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+    return f'tickets:list:{generation}:{scope}:{digest}'
+
+
+def list_cache_key(scope, request):
+    return _list_cache_key(get_generation(), scope, request)
+
+
+async def alist_cache_key(scope, request):
+    return _list_cache_key(await aget_generation(), scope, request)
+
+
+def get_cached_list(key):
+    return get_cache().get(key)
+
+
+async def aget_cached_list(key):
+    return await get_cache().aget(key)
+
+
+def set_cached_list(key, value):
+    get_cache().set(key, value, timeout=settings.TICKET_LIST_CACHE_TIMEOUT)
+
+
+async def aset_cached_list(key, value):
+    await get_cache().aset(key, value, timeout=settings.TICKET_LIST_CACHE_TIMEOUT)
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_ticket_lists(sender, **kwargs):
+    bump_generation()
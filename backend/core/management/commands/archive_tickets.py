@@ -0,0 +1,43 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.archive import archivable_tickets, archive_closed_tickets
+
+
+class Command(BaseCommand):
+    help = (
+        'Move chamados resolvidos ou cancelados há mais de N dias para a tabela de arquivo, '
+        'em lotes pequenos (uma transação curta por lote).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.TICKET_ARCHIVE_AFTER_DAYS)
+        parser.add_argument('--batch-size', type=int, default=settings.TICKET_ARCHIVE_BATCH_SIZE)
+        parser.add_argument(
+            '--pause', type=float, default=0,
+            help='Segundos de espera entre lotes, para ceder o banco às requisições.'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help='Apenas conta os chamados que seriam arquivados.'
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            total = archivable_tickets(options['days']).count()
+            self.stdout.write(f'{total} chamados seriam arquivados.')
+            return
+
+        started = time.perf_counter()
+        archived = archive_closed_tickets(
+            options['days'],
+            options['batch_size'],
+            pause=options['pause'],
+            on_batch=lambda total: self.stdout.write(f'{total} chamados arquivados...')
+        )
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{archived} chamados arquivados em {elapsed:.1f}s.'
+        ))
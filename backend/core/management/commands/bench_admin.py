@@ -0,0 +1,141 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib import admin
+from django.contrib.admin import ModelAdmin
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from authentication.models import User
+from core.admin import TicketAdmin
+from core.benchmarking import latency_summary
+from core.models import Priority, Ticket, TicketStatus
+
+BENCH_PREFIX = 'bench-admin'
+BACKDATE_BUCKETS = 100
+WORDS = ['impressora', 'rede', 'senha', 'acesso', 'cancela', 'pagamento', 'sistema', 'lento', 'erro']
+
+
+class LegacyTicketAdmin(TicketAdmin):
+    list_select_related = False
+    paginator = Paginator
+    show_full_result_count = True
+
+    def get_queryset(self, request):
+        return ModelAdmin.get_queryset(self, request)
+
+    def get_search_results(self, request, queryset, search_term):
+        return ModelAdmin.get_search_results(self, request, queryset, search_term)
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede o tempo de renderização do changelist do admin de chamados com volumes crescentes. '
+        'Insere chamados de teste no banco configurado; use um banco descartável '
+        '(SQLITE_PATH=/tmp/bench.sqlite3 python manage.py migrate).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--legacy', action='store_true', help='Mede também a configuração anterior do admin.')
+        parser.add_argument('--keep', action='store_true', help='Não remove os chamados criados.')
+
+    def handle(self, *args, **options):
+        superuser = User.objects.filter(is_superuser=True).first()
+        if superuser is None:
+            raise CommandError('É necessário um superusuário (createsuperuser).')
+        attendants = list(User.objects.values_list('id', flat=True)[:50])
+
+        admins = {'atual': TicketAdmin(Ticket, admin.site)}
+        if options['legacy']:
+            admins['anterior'] = LegacyTicketAdmin(Ticket, admin.site)
+
+        year = timezone.localtime().year
+        scenarios = {
+            'lista': {},
+            'busca': {'q': 'impressora'},
+            'status': {'status__exact': TicketStatus.OPEN},
+            'ano': {'created_at__year': str(year)},
+        }
+
+        try:
+            for size in sorted(options['sizes']):
+                self._seed(size, attendants)
+                self.stdout.write(f'{size} chamados de teste:')
+                for label, model_admin in admins.items():
+                    for name, params in scenarios.items():
+                        self._measure(model_admin, superuser, label, name, params, options['repeat'])
+        finally:
+            if not options['keep']:
+                self._cleanup()
+
+    def _cleanup(self):
+        # DELETE direto, sem sinais: a carga usa bulk_create, que também não passa pelos
+        # contadores, e o delete() do ORM carregaria milhões de chamados na memória.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {connection.ops.quote_name(Ticket._meta.db_table)} WHERE title LIKE %s',
+                [f'{BENCH_PREFIX}%']
+            )
+
+    def _seed(self, size, attendants):
+        missing = size - Ticket.objects.filter(title__startswith=BENCH_PREFIX).count()
+        if missing <= 0:
+            return
+
+        started = time.perf_counter()
+        now = timezone.now()
+        while missing > 0:
+            batch = min(missing, 5000)
+            tickets = Ticket.objects.bulk_create([
+                Ticket(
+                    title=f'{BENCH_PREFIX} {" ".join(random.sample(WORDS, 2))}',
+                    description=' '.join(random.choices(WORDS, k=8)),
+                    priority=random.choice(Priority.values),
+                    status=random.choice(TicketStatus.values),
+                    attendant_id=random.choice(attendants),
+                )
+                for _ in range(batch)
+            ])
+            self._backdate(tickets, now)
+            missing -= batch
+        self.stdout.write(f'  (carga em {time.perf_counter() - started:.1f}s)')
+
+    def _backdate(self, tickets, now):
+        # created_at é auto_now_add: as datas espalhadas por três anos entram depois, com update().
+        buckets = {}
+        for ticket in tickets:
+            buckets.setdefault(random.randrange(BACKDATE_BUCKETS), []).append(ticket.pk)
+        for ticket_ids in buckets.values():
+            Ticket.objects.filter(id__in=ticket_ids).update(
+                created_at=now - timedelta(minutes=random.randrange(3 * 365 * 24 * 60))
+            )
+
+    def _request(self, superuser, params):
+        request = RequestFactory().get('/admin/core/ticket/', params)
+        request.user = superuser
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def _measure(self, model_admin, superuser, label, name, params, repeat):
+        with CaptureQueriesContext(connection) as queries:
+            model_admin.changelist_view(self._request(superuser, params)).render()
+
+        latencies = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            model_admin.changelist_view(self._request(superuser, params)).render()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        self.stdout.write(
+            f'  {label:8} {name:7} {len(queries.captured_queries):3} consultas '
+            f'{latency_summary(latencies)}'
+        )
@@ -0,0 +1,152 @@
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+
+from authentication.models import User, UserProfile
+from core.benchmarking import latency_summary
+from core.models import Ticket, TicketStatus, TicketStatusEvent, TicketTombstone
+from core.views import TicketViewSet
+
+BENCH_PREFIX = 'bench-db-writes'
+NEXT_STATUS = {
+    TicketStatus.IN_PROGRESS: TicketStatus.RESOLVED,
+    TicketStatus.RESOLVED: TicketStatus.IN_PROGRESS,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede escritas concorrentes no banco configurado usando o mesmo caminho do update_status '
+        '(leitura seguida de compare-and-set), com leitores em paralelo. Use --legacy para o caminho '
+        'antigo (leitura + save), que perde atualizações concorrentes. Compare perfis rodando, '
+        'por exemplo, com SQLITE_TUNED=False e SQLITE_TUNED=True em um banco descartável '
+        '(SQLITE_PATH=/tmp/bench.sqlite3 python manage.py migrate).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8)
+        parser.add_argument('--writes', type=int, default=200, help='Escritas por writer.')
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--tickets', type=int, default=50)
+        parser.add_argument('--keep', action='store_true', help='Não remove os chamados criados.')
+        parser.add_argument('--legacy', action='store_true', help='Usa leitura + save sem compare-and-set.')
+
+    def handle(self, *args, **options):
+        technician = User.objects.filter(profile=UserProfile.TECHNICIAN).first()
+        if technician is None:
+            raise CommandError('É necessário um usuário técnico; rode as migrations.')
+
+        ticket_ids = [
+            Ticket.objects.create(
+                title=f'{BENCH_PREFIX} {i}', status=TicketStatus.IN_PROGRESS, attendant=technician
+            ).pk
+            for i in range(options['tickets'])
+        ]
+
+        database = settings.DATABASES['default']
+        self.stdout.write(
+            f"{connection.vendor} {database['NAME']} options={database.get('OPTIONS', {})}"
+        )
+
+        try:
+            self._run(technician, ticket_ids, options)
+        finally:
+            if not options['keep']:
+                Ticket.objects.filter(id__in=ticket_ids).delete()
+                TicketTombstone.objects.filter(ticket_id__in=ticket_ids).delete()
+                TicketStatusEvent.objects.filter(ticket_id__in=ticket_ids).delete()
+
+    def _run(self, technician, ticket_ids, options):
+        latencies = []
+        errors = Counter()
+        conflicts = Counter()
+        moves = Counter()
+        reads = Counter()
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def writer():
+            view = TicketViewSet()
+            try:
+                for _ in range(options['writes']):
+                    started = time.perf_counter()
+                    try:
+                        ticket = Ticket.objects.get(pk=random.choice(ticket_ids))
+                        previous_status = ticket.status
+                        new_status = NEXT_STATUS[previous_status]
+                        if options['legacy']:
+                            with transaction.atomic():
+                                ticket.status = new_status
+                                ticket.save()
+                            status_code = 200
+                        else:
+                            _, status_code = view._update_status(
+                                ticket, technician, {'status': new_status}
+                            )
+                    except DatabaseError as error:
+                        with lock:
+                            errors[str(error)] += 1
+                        continue
+                    elapsed = (time.perf_counter() - started) * 1000
+                    with lock:
+                        latencies.append(elapsed)
+                        if status_code == 200:
+                            moves[ticket.pk, previous_status] += 1
+                        else:
+                            conflicts[status_code] += 1
+            finally:
+                connection.close()
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    try:
+                        list(Ticket.objects.filter(id__in=ticket_ids).values('id', 'status')[:20])
+                        outcome = 'ok'
+                    except DatabaseError as error:
+                        outcome = str(error)
+                    with lock:
+                        reads[outcome] += 1
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['writers'] + options['readers']) as executor:
+            readers = [executor.submit(reader) for _ in range(options['readers'])]
+            writers = [executor.submit(writer) for _ in range(options['writers'])]
+            for future in writers:
+                future.result()
+            elapsed = time.perf_counter() - started
+            stop.set()
+            for future in readers:
+                future.result()
+
+        self.stdout.write(
+            f"Escritas: {len(latencies)} ok em {elapsed:.1f}s ({len(latencies) / elapsed:.0f}/s), "
+            f"{latency_summary(latencies)}"
+        )
+        self.stdout.write(
+            f"Leituras concorrentes: {reads.pop('ok', 0) / elapsed:.0f}/s"
+            + (f", erros: {dict(reads)}" if reads else '')
+        )
+        self.stdout.write(
+            f"Conflitos (409): {conflicts.pop(409, 0)}, "
+            f"chamados com atualizações perdidas: {self._lost_updates(ticket_ids, moves)}"
+        )
+        if errors:
+            self.stdout.write(self.style.ERROR(f'Erros de escrita: {dict(errors)}'))
+
+    def _lost_updates(self, ticket_ids, moves):
+        final_status = dict(Ticket.objects.filter(id__in=ticket_ids).values_list('id', 'status'))
+        lost = 0
+        for ticket_id in ticket_ids:
+            forward = moves[ticket_id, TicketStatus.IN_PROGRESS] - moves[ticket_id, TicketStatus.RESOLVED]
+            if forward != int(final_status[ticket_id] == TicketStatus.RESOLVED):
+                lost += 1
+        return lost
@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarking import http_json, latency_summary
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara vazão e latência de cauda de endpoints de servidores em execução, '
+        'ex.: --target wsgi=http://127.0.0.1:8000/api/tickets/ '
+        '--target asgi=http://127.0.0.1:8001/api/async/tickets/'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target', action='append', required=True,
+            help='label=url; pode ser repetido.'
+        )
+        parser.add_argument('--login-url', help='URL de login usada para obter o token (padrão: do primeiro alvo).')
+        parser.add_argument('--email', default='tecnico@cloudpark.com')
+        parser.add_argument('--password', default='tecnico123')
+        parser.add_argument('--concurrency', type=int, action='append')
+        parser.add_argument('--requests', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options['target']:
+            label, _, url = target.partition('=')
+            if not url:
+                raise CommandError(f'Alvo inválido "{target}", use label=url.')
+            targets.append((label, url))
+
+        login_url = options['login_url'] or self._login_url(targets[0][1])
+        code, body = http_json(
+            'POST', login_url, {'email': options['email'], 'password': options['password']}
+        )
+        if code != 200:
+            raise CommandError(f'Falha no login em {login_url} (HTTP {code}).')
+        token = body['access_token']
+
+        for concurrency in options['concurrency'] or [1, 10, 50]:
+            for label, url in targets:
+                self._run(label, url, token, concurrency, options['requests'])
+
+    def _login_url(self, url):
+        base = url.split('/api/', 1)[0]
+        return f'{base}/api/auth/login/'
+
+    def _run(self, label, url, token, concurrency, total):
+        latencies = []
+        statuses = Counter()
+        lock = threading.Lock()
+        remaining = iter(range(total))
+
+        def worker():
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                started = time.perf_counter()
+                code, _ = http_json('GET', url, token=token)
+                elapsed = (time.perf_counter() - started) * 1000
+                with lock:
+                    latencies.append(elapsed)
+                    statuses[code] += 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(worker)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{label} c={concurrency}: {total / elapsed:.0f} req/s, {latency_summary(latencies)} '
+            f'({", ".join(f"{code}={count}" for code, count in sorted(statuses.items()))})'
+        )
@@ -0,0 +1,49 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+from core.imports import IMPORT_FORMATS, TicketImporter, detect_format, iter_rows
+
+
+class Command(BaseCommand):
+    help = 'Importa tickets de um arquivo CSV ou NDJSON em lotes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=IMPORT_FORMATS)
+        parser.add_argument(
+            '--attendant', required=True,
+            help='E-mail do atendente usado quando a linha não informa "attendant".'
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        file_format = detect_format(options['path'], options['format'])
+        if file_format is None:
+            raise CommandError('Formato inválido. Use --format csv ou ndjson.')
+
+        try:
+            attendant = User.objects.get(email=options['attendant'])
+        except User.DoesNotExist:
+            raise CommandError(f'Usuário {options["attendant"]} não encontrado.')
+
+        importer = TicketImporter(
+            default_attendant=attendant,
+            batch_size=options['batch_size'],
+            max_errors=0
+        )
+
+        started = time.perf_counter()
+        with open(options['path'], 'rb') as stream:
+            report = importer.run(
+                iter_rows(stream, file_format),
+                on_error=lambda error: self.stderr.write(json.dumps(error, ensure_ascii=False))
+            )
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{report["created"]} tickets importados, {report["failed"]} com erro '
+            f'em {elapsed:.1f}s.'
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from core.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recalcula os contadores de chamados a partir da tabela e informa divergências.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Apenas informa as divergências, sem reescrever os contadores.'
+        )
+
+    def handle(self, *args, **options):
+        drift = reconcile(dry_run=options['dry_run'])
+
+        for (dimension, key), (current, expected) in sorted(drift.items()):
+            self.stdout.write(f'{dimension}:{key} contador={current} real={expected}')
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Contadores consistentes.'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drift)} divergências encontradas.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{len(drift)} divergências corrigidas.'))
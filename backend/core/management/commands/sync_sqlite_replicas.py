@@ -0,0 +1,42 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = (
+        'Copia o banco SQLite primário para as réplicas de SQLITE_REPLICA_PATHS, simulando a '
+        'replicação em desenvolvimento. Com --interval repete a cópia, o que reproduz o atraso '
+        'de uma réplica real.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='Segundos entre cópias (roda até ser interrompido).')
+
+    def handle(self, *args, **options):
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise CommandError('Disponível apenas para SQLite; no PostgreSQL use a replicação do servidor.')
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError('Nenhuma réplica configurada (SQLITE_REPLICA_PATHS).')
+
+        while True:
+            self._copy()
+            if not options['interval']:
+                return
+            time.sleep(options['interval'])
+
+    def _copy(self):
+        source = sqlite3.connect(settings.DATABASES[DEFAULT_DB_ALIAS]['NAME'])
+        try:
+            for alias in settings.DATABASE_REPLICAS:
+                target = sqlite3.connect(settings.DATABASES[alias]['NAME'])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(f"{alias}: copiado para {settings.DATABASES[alias]['NAME']}")
+        finally:
+            source.close()
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from core.search import install_search_index, uninstall_search_index
+
+
+def install(apps, schema_editor):
+    install_search_index(schema_editor.connection, rebuild=True)
+
+
+def uninstall(apps, schema_editor):
+    uninstall_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_ticket_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
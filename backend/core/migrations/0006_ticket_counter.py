@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-17 19:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    Ticket = apps.get_model('core', 'Ticket')
+    TicketCounter = apps.get_model('core', 'TicketCounter')
+
+    counters = []
+    for field, dimension in (('status', 'status'), ('priority', 'priority'), ('attendant_id', 'attendant')):
+        rows = Ticket.objects.order_by().values_list(field).annotate(total=Count('id'))
+        counters.extend(
+            TicketCounter(dimension=dimension, key=str(key), count=total)
+            for key, total in rows
+        )
+    TicketCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_ticket_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('status', 'Status'), ('priority', 'Prioridade'), ('attendant', 'Atendente')], max_length=20, verbose_name='Dimensão')),
+                ('key', models.CharField(max_length=64, verbose_name='Chave')),
+                ('count', models.BigIntegerField(default=0, verbose_name='Quantidade')),
+            ],
+            options={
+                'verbose_name': 'Contador de chamados',
+                'verbose_name_plural': 'Contadores de chamados',
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'key'), name='ticket_counter_unique')],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
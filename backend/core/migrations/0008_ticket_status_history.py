@@ -0,0 +1,81 @@
+# Generated by Django 5.2 on 2026-10-17 20:12
+
+import datetime
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def seed_history(apps, schema_editor):
+    Ticket = apps.get_model('core', 'Ticket')
+    TicketStatusEvent = apps.get_model('core', 'TicketStatusEvent')
+
+    Ticket.objects.update(status_changed_at=F('updated_at'))
+    rows = Ticket.objects.order_by('id').values_list('id', 'status', 'updated_at')
+    TicketStatusEvent.objects.bulk_create(
+        (
+            TicketStatusEvent(ticket_id=ticket_id, to_status=status, created_at=updated_at)
+            for ticket_id, status, updated_at in rows.iterator(chunk_size=1000)
+        ),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_ticket_sync'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='reopen_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Reaberturas'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='status_changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Status alterado em'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='time_canceled',
+            field=models.DurationField(default=datetime.timedelta, verbose_name='Tempo cancelado'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='time_in_progress',
+            field=models.DurationField(default=datetime.timedelta, verbose_name='Tempo em atendimento'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='time_open',
+            field=models.DurationField(default=datetime.timedelta, verbose_name='Tempo aberto'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='time_resolved',
+            field=models.DurationField(default=datetime.timedelta, verbose_name='Tempo resolvido'),
+        ),
+        migrations.CreateModel(
+            name='TicketStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('open', 'Aberto'), ('in_progress', 'Em Atendimento'), ('resolved', 'Resolvido'), ('canceled', 'Cancelado')], max_length=20, null=True, verbose_name='Status anterior')),
+                ('to_status', models.CharField(choices=[('open', 'Aberto'), ('in_progress', 'Em Atendimento'), ('resolved', 'Resolvido'), ('canceled', 'Cancelado')], max_length=20, verbose_name='Novo status')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Criado em')),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Alterado por')),
+                ('ticket', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='status_events', to='core.ticket', verbose_name='Chamado')),
+            ],
+            options={
+                'verbose_name': 'Histórico de status',
+                'verbose_name_plural': 'Históricos de status',
+                'indexes': [models.Index(fields=['ticket', 'created_at'], name='status_event_ticket_idx')],
+            },
+        ),
+        migrations.RunPython(seed_history, migrations.RunPython.noop),
+    ]
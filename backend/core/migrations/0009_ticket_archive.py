@@ -0,0 +1,63 @@
+# Generated by Django 5.2 on 2026-10-17 20:19
+
+import datetime
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_ticket_status_history'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketArchive',
+            fields=[
+                ('title', models.CharField(max_length=255, verbose_name='Título')),
+                ('priority', models.CharField(choices=[('low', 'Baixa'), ('medium', 'Média'), ('high', 'Alta'), ('critical', 'Crítica')], default='medium', max_length=10, verbose_name='Prioridade')),
+                ('status', models.CharField(choices=[('open', 'Aberto'), ('in_progress', 'Em Atendimento'), ('resolved', 'Resolvido'), ('canceled', 'Cancelado')], default='open', max_length=20, verbose_name='Status')),
+                ('description', models.TextField(blank=True, default=None, null=True, verbose_name='Descrição')),
+                ('status_changed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Status alterado em')),
+                ('time_open', models.DurationField(default=datetime.timedelta, verbose_name='Tempo aberto')),
+                ('time_in_progress', models.DurationField(default=datetime.timedelta, verbose_name='Tempo em atendimento')),
+                ('time_resolved', models.DurationField(default=datetime.timedelta, verbose_name='Tempo resolvido')),
+                ('time_canceled', models.DurationField(default=datetime.timedelta, verbose_name='Tempo cancelado')),
+                ('reopen_count', models.PositiveIntegerField(default=0, verbose_name='Reaberturas')),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(verbose_name='Criado em')),
+                ('updated_at', models.DateTimeField(verbose_name='Atualizado em')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Arquivado em')),
+            ],
+            options={
+                'verbose_name': 'Chamado arquivado',
+                'verbose_name_plural': 'Chamados arquivados',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'status_changed_at'], name='ticket_status_changed_idx'),
+        ),
+        migrations.AddField(
+            model_name='ticketarchive',
+            name='attendant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Atendente'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketarchive',
+            index=models.Index(fields=['-created_at'], name='archive_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketarchive',
+            index=models.Index(fields=['attendant', '-created_at'], name='archive_attendant_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketarchive',
+            index=models.Index(fields=['archived_at'], name='archive_archived_idx'),
+        ),
+    ]
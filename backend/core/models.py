@@ -1,4 +1,7 @@
+from datetime import timedelta
+
 from django.db import models
+from django.utils import timezone
 
 from authentication.models import User
 
@@ -25,7 +28,7 @@ class TicketStatus(models.TextChoices):
     CANCELED = 'canceled', 'Cancelado'
 
 
-class Ticket(BaseEntity):
+class TicketContent(models.Model):
     title = models.CharField(verbose_name='Título', max_length=255)
     priority = models.CharField(
         verbose_name='Prioridade',
@@ -41,11 +44,127 @@ class Ticket(BaseEntity):
     )
     description = models.TextField(verbose_name='Descrição', blank=True, null=True, default=None)
     attendant = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name='Atendente')
+    status_changed_at = models.DateTimeField(verbose_name='Status alterado em', default=timezone.now)
+    time_open = models.DurationField(verbose_name='Tempo aberto', default=timedelta)
+    time_in_progress = models.DurationField(verbose_name='Tempo em atendimento', default=timedelta)
+    time_resolved = models.DurationField(verbose_name='Tempo resolvido', default=timedelta)
+    time_canceled = models.DurationField(verbose_name='Tempo cancelado', default=timedelta)
+    reopen_count = models.PositiveIntegerField(verbose_name='Reaberturas', default=0)
 
     def __str__(self):
         return self.title
 
+    class Meta:
+        abstract = True
+
+
+class Ticket(BaseEntity, TicketContent):
     class Meta:
         verbose_name = "Chamado"
         verbose_name_plural = "Chamados"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='ticket_created_idx'),
+            models.Index(fields=['attendant', '-created_at'], name='ticket_attendant_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='ticket_status_created_idx'),
+            models.Index(fields=['priority', '-created_at'], name='ticket_priority_created_idx'),
+            models.Index(
+                fields=['status', 'priority', '-created_at'],
+                name='ticket_status_prio_created_idx'
+            ),
+            models.Index(fields=['updated_at', 'id'], name='ticket_updated_idx'),
+            models.Index(fields=['attendant', 'updated_at', 'id'], name='ticket_attendant_updated_idx'),
+            models.Index(fields=['status', 'status_changed_at'], name='ticket_status_changed_idx'),
+        ]
+
+
+class TicketArchive(TicketContent):
+    id = models.BigIntegerField(primary_key=True)
+    created_at = models.DateTimeField(verbose_name='Criado em')
+    updated_at = models.DateTimeField(verbose_name='Atualizado em')
+    archived_at = models.DateTimeField(verbose_name='Arquivado em', auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Chamado arquivado"
+        verbose_name_plural = "Chamados arquivados"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='archive_created_idx'),
+            models.Index(fields=['attendant', '-created_at'], name='archive_attendant_created_idx'),
+            models.Index(fields=['archived_at'], name='archive_archived_idx'),
+        ]
+
+
+class TicketTombstone(models.Model):
+    ticket_id = models.BigIntegerField(verbose_name='Chamado')
+    attendant_id = models.BigIntegerField(verbose_name='Atendente', null=True)
+    deleted_at = models.DateTimeField(verbose_name='Excluído em', auto_now_add=True)
+
+    def __str__(self):
+        return f'{self.ticket_id} ({self.deleted_at})'
+
+    class Meta:
+        verbose_name = "Chamado excluído"
+        verbose_name_plural = "Chamados excluídos"
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_idx'),
+            models.Index(fields=['attendant_id', 'deleted_at', 'id'], name='tombstone_attendant_idx'),
+        ]
+
+
+class TicketStatusEvent(models.Model):
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='status_events',
+        verbose_name='Chamado'
+    )
+    from_status = models.CharField(
+        verbose_name='Status anterior',
+        max_length=20,
+        choices=TicketStatus.choices,
+        null=True,
+        blank=True
+    )
+    to_status = models.CharField(verbose_name='Novo status', max_length=20, choices=TicketStatus.choices)
+    changed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name='Alterado por'
+    )
+    created_at = models.DateTimeField(verbose_name='Criado em', default=timezone.now)
+
+    def __str__(self):
+        return f'{self.ticket_id}: {self.from_status} -> {self.to_status}'
+
+    class Meta:
+        verbose_name = "Histórico de status"
+        verbose_name_plural = "Históricos de status"
+        indexes = [
+            models.Index(fields=['ticket', 'created_at'], name='status_event_ticket_idx'),
+        ]
+
+
+class CounterDimension(models.TextChoices):
+    STATUS = 'status', 'Status'
+    PRIORITY = 'priority', 'Prioridade'
+    ATTENDANT = 'attendant', 'Atendente'
+
+
+class TicketCounter(models.Model):
+    dimension = models.CharField(verbose_name='Dimensão', max_length=20, choices=CounterDimension.choices)
+    key = models.CharField(verbose_name='Chave', max_length=64)
+    count = models.BigIntegerField(verbose_name='Quantidade', default=0)
+
+    def __str__(self):
+        return f'{self.dimension}:{self.key} = {self.count}'
+
+    class Meta:
+        verbose_name = "Contador de chamados"
+        verbose_name_plural = "Contadores de chamados"
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'key'], name='ticket_counter_unique'),
+        ]
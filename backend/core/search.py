@@ -0,0 +1,130 @@
+import re
+
+from django.db import connection, connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_RANK = 'search_rank'
+
+FTS_TABLE = 'core_ticket_fts'
+PG_CONFIG = 'portuguese'
+PG_INDEX = 'ticket_search_gin_idx'
+PG_DOCUMENT = (
+    "to_tsvector('{config}'::regconfig, "
+    "COALESCE(title, '') || ' ' || COALESCE(description, ''))"
+).format(config=PG_CONFIG)
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='core_ticket', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS core_ticket_fts_ai AFTER INSERT ON core_ticket BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS core_ticket_fts_ad AFTER DELETE ON core_ticket BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS core_ticket_fts_au AFTER UPDATE OF title, description ON core_ticket BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS core_ticket_fts_ai',
+    'DROP TRIGGER IF EXISTS core_ticket_fts_ad',
+    'DROP TRIGGER IF EXISTS core_ticket_fts_au',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+
+def install_search_index(db_connection, rebuild=False):
+    with db_connection.cursor() as cursor:
+        if db_connection.vendor == 'sqlite':
+            for statement in SQLITE_INSTALL:
+                cursor.execute(statement)
+            if rebuild:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        elif db_connection.vendor == 'postgresql':
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {PG_INDEX} ON core_ticket USING GIN (({PG_DOCUMENT}))'
+            )
+
+
+def ensure_search_index(sender, using='default', **kwargs):
+    db_connection = connections[using]
+    if db_connection.vendor != 'sqlite':
+        return
+
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN (%s, 'core_ticket_fts_ai')",
+            [FTS_TABLE]
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
+    if FTS_TABLE in existing and 'core_ticket_fts_ai' not in existing:
+        install_search_index(db_connection, rebuild=True)
+
+
+def uninstall_search_index(db_connection):
+    with db_connection.cursor() as cursor:
+        if db_connection.vendor == 'sqlite':
+            for statement in SQLITE_UNINSTALL:
+                cursor.execute(statement)
+        elif db_connection.vendor == 'postgresql':
+            cursor.execute(f'DROP INDEX IF EXISTS {PG_INDEX}')
+
+
+def search_terms(value):
+    return re.findall(r'\w+', value or '')
+
+
+def search_tickets(queryset, value, rank=True):
+    terms = search_terms(value)
+    vendor = connection.vendor
+
+    if not terms or vendor not in ('sqlite', 'postgresql') or queryset.model._meta.db_table != 'core_ticket':
+        return queryset.filter(Q(title__icontains=value) | Q(description__icontains=value))
+
+    if vendor == 'sqlite':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        # Junta a tabela FTS uma única vez: o bm25() sai da própria varredura do MATCH,
+        # sem uma subconsulta correlacionada por linha do resultado.
+        queryset = queryset.extra(
+            tables=[FTS_TABLE],
+            where=[f'{FTS_TABLE}.rowid = core_ticket.id', f'{FTS_TABLE} MATCH %s'],
+            params=[match],
+        )
+        if rank:
+            queryset = queryset.annotate(**{
+                SEARCH_RANK: RawSQL(f'-bm25({FTS_TABLE})', [], output_field=FloatField())
+            })
+        return queryset
+
+    match = ' & '.join(f'{term}:*' for term in terms)
+    if rank:
+        queryset = queryset.annotate(**{SEARCH_RANK: RawSQL(
+            f"ts_rank({PG_DOCUMENT}, to_tsquery('{PG_CONFIG}', %s))", [match],
+            output_field=FloatField()
+        )})
+    return queryset.annotate(
+        search_match=RawSQL(
+            f"{PG_DOCUMENT} @@ to_tsquery('{PG_CONFIG}', %s)", [match],
+            output_field=BooleanField()
+        )
+    ).filter(search_match=True)
@@ -1,7 +1,7 @@
 from rest_framework import serializers
 from authentication.models import User
 
-from .models import Ticket, TicketStatus
+from .models import Priority, Ticket, TicketStatus, TicketStatusEvent
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -24,5 +24,57 @@ class TicketSerializer(serializers.ModelSerializer):
         read_only_fields = ['attendant', 'created_at', 'updated_at']
 
 
+class TicketListSerializer(serializers.BaseSerializer):
+    values_fields = (
+        'id', 'title', 'description', 'priority', 'status', 'created_at', 'updated_at',
+        'attendant__id', 'attendant__email', 'attendant__profile',
+    )
+    priority_labels = {value: str(label) for value, label in Priority.choices}
+    status_labels = {value: str(label) for value, label in TicketStatus.choices}
+    datetime_field = serializers.DateTimeField()
+
+    def to_representation(self, row):
+        to_datetime = self.datetime_field.to_representation
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'description': row['description'],
+            'priority': row['priority'],
+            'priority_display': self.priority_labels.get(row['priority'], row['priority']),
+            'status': row['status'],
+            'status_display': self.status_labels.get(row['status'], row['status']),
+            'attendant': {
+                'id': row['attendant__id'],
+                'email': row['attendant__email'],
+                'profile': row['attendant__profile'],
+            },
+            'created_at': to_datetime(row['created_at']),
+            'updated_at': to_datetime(row['updated_at']),
+        }
+
+
+class TicketStatusEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TicketStatusEvent
+        fields = ['id', 'from_status', 'to_status', 'changed_by', 'created_at']
+
+
 class TicketStatusUpdateSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=TicketStatus.choices)
+
+
+class TicketBulkStatusUpdateSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=1000
+    )
+    status = serializers.ChoiceField(choices=TicketStatus.choices)
+
+
+class TicketImportSerializer(serializers.ModelSerializer):
+    attendant = serializers.IntegerField(min_value=1, required=False)
+
+    class Meta:
+        model = Ticket
+        fields = ['title', 'description', 'priority', 'status', 'attendant']
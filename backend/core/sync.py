@@ -0,0 +1,105 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+
+from .models import Ticket, TicketTombstone
+from .serializers import TicketListSerializer
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 1000
+INVALID_CURSOR_MESSAGE = 'Cursor inválido.'
+
+
+def encode_cursor(position):
+    payload = {
+        key: [value[0].isoformat(), value[1]] if value else None
+        for key, value in position.items()
+    }
+    return urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+
+
+def decode_cursor(token):
+    if not token:
+        return {'t': None, 'd': None}
+
+    try:
+        payload = json.loads(urlsafe_b64decode(token.encode()).decode())
+        position = {}
+        for key in ('t', 'd'):
+            value = payload[key]
+            if value is None:
+                position[key] = None
+                continue
+            moment = parse_datetime(value[0])
+            if moment is None or timezone.is_naive(moment) or not isinstance(value[1], int):
+                raise ValueError
+            position[key] = (moment, value[1])
+        return position
+    except Exception:
+        raise NotFound(INVALID_CURSOR_MESSAGE)
+
+
+def parse_limit(value):
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_LIMIT
+    return min(max(limit, 1), MAX_LIMIT)
+
+
+def _after(queryset, field, position):
+    if position is None:
+        return queryset
+    moment, pk = position
+    return queryset.filter(
+        Q(**{f'{field}__gte': moment}) & (Q(**{f'{field}__gt': moment}) | Q(id__gt=pk))
+    )
+
+
+def _page(queryset, field, position, horizon, limit):
+    return list(
+        _after(queryset, field, position)
+        .filter(**{f'{field}__lte': horizon})
+        .order_by(field, 'id')[:limit + 1]
+    )
+
+
+def changes_since(tickets, tombstones, cursor=None, limit=None):
+    position = decode_cursor(cursor)
+    limit = parse_limit(limit)
+    horizon = timezone.now() - timedelta(seconds=settings.TICKET_SYNC_SETTLE_SECONDS)
+
+    rows = _page(
+        tickets.values(*TicketListSerializer.values_fields), 'updated_at', position['t'], horizon, limit
+    )
+    deleted = _page(
+        tombstones.values('id', 'ticket_id', 'deleted_at'), 'deleted_at', position['d'], horizon, limit
+    )
+    has_more = len(rows) > limit or len(deleted) > limit
+    rows, deleted = rows[:limit], deleted[:limit]
+
+    if rows:
+        position['t'] = (rows[-1]['updated_at'], rows[-1]['id'])
+    if deleted:
+        position['d'] = (deleted[-1]['deleted_at'], deleted[-1]['id'])
+
+    serializer = TicketListSerializer()
+    return {
+        'results': [serializer.to_representation(row) for row in rows],
+        'deleted': [tombstone['ticket_id'] for tombstone in deleted],
+        'cursor': encode_cursor(position),
+        'has_more': has_more,
+    }
+
+
+@receiver(post_delete, sender=Ticket)
+def record_tombstone(sender, instance, **kwargs):
+    TicketTombstone.objects.create(ticket_id=instance.pk, attendant_id=instance.attendant_id)
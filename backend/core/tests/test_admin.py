@@ -1,4 +1,9 @@
+from datetime import datetime, timezone as dt_timezone
+from unittest.mock import patch
+
+from django.db import connection
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
 from django.contrib.messages.storage.fallback import FallbackStorage
@@ -6,8 +11,9 @@ from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
 
-from core.admin import TicketAdmin
-from core.models import Ticket, TicketStatus, Priority
+from core.admin import CappedCountPaginator, ChangelistQuerySet, TicketAdmin
+from core.counters import get_stats
+from core.models import Ticket, TicketStatus, TicketStatusEvent, Priority
 from authentication.models import UserProfile
 
 User = get_user_model()
@@ -126,6 +132,20 @@ class TicketAdminTest(TestCase):
         request = self._create_request(self.attendant_user)
         self.assertTrue(self.ticket_admin.has_change_permission(request, self.ticket_attendant))
 
+    def test_save_and_delete_model_update_counters(self):
+        request = self._create_request(self.superuser)
+        ticket = Ticket(title='Novo Ticket', priority=Priority.LOW)
+        self.ticket_admin.save_model(request, ticket, None, change=False)
+
+        ticket.status = TicketStatus.CANCELED
+        self.ticket_admin.save_model(request, ticket, None, change=True)
+        self.ticket_admin.delete_model(request, self.ticket_attendant)
+
+        stats = get_stats()
+        self.assertEqual(stats['total'], 1)
+        self.assertEqual(stats['by_status'], {'canceled': 1})
+        self.assertEqual(stats['by_attendant'], {str(self.superuser.pk): 1})
+
     def test_has_change_permission_others_ticket(self):
         request = self._create_request(self.attendant_user)
         other_ticket = Ticket.objects.create(
@@ -229,4 +249,202 @@ class TicketAdminIntegrationTest(TestCase):
         response = self.client.get(
             reverse('admin:core_ticket_change', args=[self.ticket.pk])
         )
-        self.assertEqual(response.status_code, 200) 
\ No newline at end of file
+        self.assertEqual(response.status_code, 200)
+
+    def _post_change(self, **data):
+        self.client.force_login(self.superuser)
+        payload = {
+            'title': self.ticket.title,
+            'priority': self.ticket.priority,
+            'status': TicketStatus.OPEN,
+            'initial-status': TicketStatus.OPEN,
+            'description': self.ticket.description,
+        }
+        payload.update(data)
+        return self.client.post(
+            reverse('admin:core_ticket_change', args=[self.ticket.pk]), payload, follow=True
+        )
+
+    def test_admin_change_status_rejects_stale_form(self):
+        Ticket.objects.filter(pk=self.ticket.pk).update(status=TicketStatus.IN_PROGRESS)
+
+        response = self._post_change(status=TicketStatus.CANCELED)
+
+        self.assertContains(response, 'alterado por outra pessoa')
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, TicketStatus.IN_PROGRESS)
+
+    def test_admin_change_status_uses_compare_and_set(self):
+        response = self._post_change(status=TicketStatus.IN_PROGRESS, title='Novo título')
+
+        self.assertNotContains(response, 'alterado por outra pessoa')
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, TicketStatus.IN_PROGRESS)
+        self.assertEqual(self.ticket.title, 'Novo título')
+        self.assertEqual(get_stats()['by_status'], {'in_progress': 1})
+
+    def test_admin_title_edit_keeps_concurrent_status(self):
+        Ticket.objects.filter(pk=self.ticket.pk).update(status=TicketStatus.CANCELED)
+
+        self._post_change(title='Só o título')
+
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.title, 'Só o título')
+        self.assertEqual(self.ticket.status, TicketStatus.CANCELED)
+
+
+class TicketAdminChangelistTest(TestCase):
+    def setUp(self):
+        self.superuser = User.objects.create_superuser(
+            email='admin@test.com',
+            password='testpass123'
+        )
+        self.url = reverse('admin:core_ticket_changelist')
+        self.client.force_login(self.superuser)
+
+        self._create_tickets(10)
+        moments = [
+            datetime(2024, 3, 10, 12, tzinfo=dt_timezone.utc),
+            datetime(2024, 3, 31, 23, tzinfo=dt_timezone.utc),
+            datetime(2025, 12, 1, 2, tzinfo=dt_timezone.utc),
+        ]
+        for ticket, moment in zip(Ticket.objects.order_by('id'), moments):
+            Ticket.objects.filter(pk=ticket.pk).update(created_at=moment)
+
+    def _create_tickets(self, count):
+        for i in range(count):
+            attendant = User.objects.create_user(
+                email=f'atendente{Ticket.objects.count()}@test.com',
+                password='testpass123',
+                profile=UserProfile.ATTENDANT
+            )
+            Ticket.objects.create(title=f'Ticket {i}', description='Impressora', attendant=attendant)
+
+    def _changelist_queries(self, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries.captured_queries]
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        _, before = self._changelist_queries()
+        self._create_tickets(10)
+        response, after = self._changelist_queries()
+
+        self.assertEqual(len(after), len(before))
+        self.assertEqual(response.context['cl'].result_count, 20)
+        self.assertFalse(any('COUNT(*)' in sql and 'LIMIT' not in sql for sql in after))
+
+    def test_changelist_count_is_capped(self):
+        with patch.object(CappedCountPaginator, 'count_limit', 5):
+            response, _ = self._changelist_queries()
+
+        self.assertEqual(response.context['cl'].result_count, 5)
+        self.assertIsNone(response.context['cl'].full_result_count)
+
+    def test_date_hierarchy_matches_database_truncation(self):
+        for kind in ('year', 'month', 'day'):
+            expected = list(Ticket.objects.datetimes('created_at', kind))
+            queryset = ChangelistQuerySet(model=Ticket)
+            self.assertEqual(queryset.datetimes('created_at', kind), expected, kind)
+            self.assertEqual(
+                queryset.datetimes('created_at', kind, order='DESC'),
+                list(Ticket.objects.datetimes('created_at', kind, order='DESC'))
+            )
+
+    def test_date_hierarchy_drill_down(self):
+        response, _ = self._changelist_queries()
+        self.assertContains(response, '?created_at__year=2024')
+
+        response, _ = self._changelist_queries({'created_at__year': 2024})
+        self.assertContains(response, 'created_at__month=3')
+        self.assertEqual(response.context['cl'].result_count, 2)
+
+    def test_search_uses_search_backend(self):
+        response, queries = self._changelist_queries({'q': 'impressora'})
+
+        self.assertEqual(response.context['cl'].result_count, 10)
+        if connection.vendor == 'sqlite':
+            self.assertFalse(any('LIKE' in sql for sql in queries))
+
+
+class TicketAdminStatusActionsTest(TestCase):
+    def setUp(self):
+        self.superuser = User.objects.create_superuser(
+            email='admin@test.com',
+            password='testpass123'
+        )
+        self.attendant_user = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT,
+            is_staff=True
+        )
+        self.url = reverse('admin:core_ticket_changelist')
+
+    def _create_tickets(self, count, ticket_status):
+        tickets = [
+            Ticket.objects.create(title=f'Ticket {i}', attendant=self.attendant_user)
+            for i in range(count)
+        ]
+        if ticket_status != TicketStatus.OPEN:
+            for ticket in tickets:
+                ticket.status = ticket_status
+                ticket.save()
+        return tickets
+
+    def _run_action(self, action, tickets, user=None):
+        self.client.force_login(user or self.superuser)
+        return self.client.post(self.url, {
+            'action': action,
+            '_selected_action': [ticket.pk for ticket in tickets],
+        }, follow=True)
+
+    def test_resolve_reports_skipped_tickets(self):
+        in_progress = self._create_tickets(3, TicketStatus.IN_PROGRESS)
+        opened = self._create_tickets(2, TicketStatus.OPEN)
+
+        response = self._run_action('resolve', in_progress + opened)
+
+        messages = [str(message) for message in response.context['messages']]
+        self.assertIn('3 chamado(s) alterado(s) para "Resolvido".', messages)
+        self.assertIn(
+            '2 chamado(s) ignorado(s): transição de "Aberto" para "Resolvido" não é permitida.', messages
+        )
+        self.assertEqual(Ticket.objects.filter(status=TicketStatus.RESOLVED).count(), 3)
+        self.assertEqual(get_stats()['by_status'], {'resolved': 3, 'open': 2})
+        self.assertEqual(
+            TicketStatusEvent.objects.filter(to_status=TicketStatus.RESOLVED, changed_by=self.superuser).count(), 3
+        )
+
+    def test_action_queries_do_not_grow_with_selection(self):
+        few = self._create_tickets(2, TicketStatus.OPEN) + self._create_tickets(2, TicketStatus.CANCELED)
+        many = self._create_tickets(10, TicketStatus.OPEN) + self._create_tickets(10, TicketStatus.CANCELED)
+        request = RequestFactory().post(self.url)
+        request.user = self.superuser
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        ticket_admin = TicketAdmin(Ticket, AdminSite())
+
+        counts = []
+        for tickets in (few, many):
+            queryset = Ticket.objects.filter(pk__in=[ticket.pk for ticket in tickets])
+            with CaptureQueriesContext(connection) as queries:
+                ticket_admin.cancel(request, queryset)
+            counts.append(len(queries.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(Ticket.objects.filter(status=TicketStatus.CANCELED).count(), 24)
+
+    def test_attendant_has_no_status_actions(self):
+        tickets = self._create_tickets(1, TicketStatus.IN_PROGRESS)
+        request = RequestFactory().get(self.url)
+        request.user = self.attendant_user
+        actions = TicketAdmin(Ticket, AdminSite()).get_actions(request)
+
+        for action in ('start_progress', 'resolve', 'cancel', 'reopen'):
+            self.assertNotIn(action, actions)
+
+        self._run_action('resolve', tickets, user=self.attendant_user)
+        tickets[0].refresh_from_db()
+        self.assertEqual(tickets[0].status, TicketStatus.IN_PROGRESS)
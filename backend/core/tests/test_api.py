@@ -1,10 +1,29 @@
-from django.test import TestCase
+import csv
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from django.contrib.auth import get_user_model
 from authentication.models import UserProfile
-from core.models import Ticket, TicketStatus, Priority
+from authentication.tokens import ClaimsRefreshToken
+from core.archive import archive_closed_tickets
+from core.checks import check_ticket_list_cache
+from core.models import Ticket, TicketArchive, TicketStatus, TicketStatusEvent, TicketTombstone, Priority
+from core.counters import get_stats, reconcile
+from core.serializers import TicketListSerializer, TicketSerializer
+from core.views import TicketViewSet
 
 User = get_user_model()
 
@@ -115,6 +134,19 @@ class TicketAPITest(APITestCase):
         self.ticket.refresh_from_db()
         self.assertEqual(self.ticket.status, TicketStatus.RESOLVED)
 
+    def test_update_status_conflict_when_status_changed_concurrently(self):
+        view = TicketViewSet()
+        Ticket.objects.filter(pk=self.ticket.pk).update(status=TicketStatus.CANCELED)
+
+        data, status_code = view._update_status(
+            self.ticket, self.technician, {'status': 'in_progress'}
+        )
+
+        self.assertEqual(status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(data, {'error': 'Status alterado por outra requisição.'})
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, TicketStatus.CANCELED)
+
     def test_retrieve_ticket(self):
         self.client.force_authenticate(user=self.technician)
         response = self.client.get(reverse('ticket-detail', args=[self.ticket.pk]))
@@ -122,4 +154,1258 @@ class TicketAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Ticket de Teste')
         self.assertEqual(response.data['status'], 'open')
-        self.assertEqual(response.data['status_display'], 'Aberto') 
\ No newline at end of file
+        self.assertEqual(response.data['status_display'], 'Aberto')
+
+
+class TicketKeysetPaginationTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        priorities = list(Priority.values)
+        Ticket.objects.bulk_create([
+            Ticket(
+                title=f'Ticket {i:02d}',
+                priority=priorities[i % len(priorities)],
+                status=TicketStatus.OPEN if i % 3 else TicketStatus.IN_PROGRESS,
+                attendant=self.attendant
+            )
+            for i in range(45)
+        ])
+
+        self.client.force_authenticate(user=self.technician)
+
+    def _walk(self, params):
+        response = self.client.get(reverse('ticket-list'), {'pagination': 'cursor', **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+
+        ids = [ticket['id'] for ticket in response.data['results']]
+        pages = [response.data]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(ticket['id'] for ticket in response.data['results'])
+            pages.append(response.data)
+        return ids, pages
+
+    def test_default_page_number_pagination_is_kept(self):
+        response = self.client.get(reverse('ticket-list'))
+
+        self.assertEqual(response.data['count'], 45)
+        self.assertEqual(len(response.data['results']), 20)
+
+    def test_walks_every_ticket_once(self):
+        ids, pages = self._walk({})
+
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(len(ids), 45)
+        self.assertEqual(
+            ids,
+            list(Ticket.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        )
+        self.assertIsNone(pages[0]['previous'])
+
+    def test_walks_with_filter_and_ordering(self):
+        params = {'status': 'open', 'ordering': 'priority'}
+        ids, _ = self._walk(params)
+
+        self.assertEqual(len(ids), 30)
+        self.assertEqual(len(set(ids)), 30)
+        self.assertEqual(
+            ids,
+            list(
+                Ticket.objects.filter(status=TicketStatus.OPEN)
+                .order_by('priority', 'id')
+                .values_list('id', flat=True)
+            )
+        )
+
+    def test_previous_cursor_returns_previous_page(self):
+        first = self.client.get(reverse('ticket-list'), {'pagination': 'cursor'}).data
+        second = self.client.get(first['next']).data
+        back = self.client.get(second['previous']).data
+
+        self.assertEqual(
+            [ticket['id'] for ticket in back['results']],
+            [ticket['id'] for ticket in first['results']]
+        )
+
+    def test_cursor_from_other_ordering_is_rejected(self):
+        first = self.client.get(reverse('ticket-list'), {'pagination': 'cursor'}).data
+        cursor = first['next'].split('cursor=')[1]
+
+        response = self.client.get(reverse('ticket-list'), {'cursor': cursor, 'ordering': 'title'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('ticket-list'), {'cursor': 'invalido'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TicketListSerializerTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        attendants = [
+            User.objects.create_user(
+                email=f'atendente{i}@test.com',
+                password='testpass123',
+                profile=UserProfile.ATTENDANT
+            )
+            for i in range(3)
+        ]
+
+        priorities = list(Priority.values)
+        statuses = list(TicketStatus.values)
+        Ticket.objects.bulk_create([
+            Ticket(
+                title=f'Ticket "{i}" ção',
+                description=None if i % 4 == 0 else f'Descrição {i}\n<b>linha</b>',
+                priority=priorities[i % len(priorities)],
+                status=statuses[i % len(statuses)],
+                attendant=attendants[i % len(attendants)]
+            )
+            for i in range(25)
+        ])
+
+    def test_output_is_byte_identical_to_ticket_serializer(self):
+        queryset = Ticket.objects.select_related('attendant').order_by('-created_at', 'id')
+
+        expected = JSONRenderer().render(TicketSerializer(queryset, many=True).data)
+        actual = JSONRenderer().render(
+            TicketListSerializer(queryset.values(*TicketListSerializer.values_fields), many=True).data
+        )
+
+        self.assertEqual(actual, expected)
+
+    def test_list_response_is_byte_identical(self):
+        self.client.force_authenticate(user=self.technician)
+        response = self.client.get(reverse('ticket-list'))
+
+        queryset = Ticket.objects.select_related('attendant').order_by('-created_at')[:20]
+        expected = JSONRenderer().render(TicketSerializer(queryset, many=True).data)
+
+        self.assertEqual(JSONRenderer().render(response.data['results']), expected)
+
+    def test_list_does_not_query_per_row(self):
+        self.client.force_authenticate(user=self.technician)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('ticket-list'))
+
+        self.assertEqual(len(response.data['results']), 20)
+
+
+class TicketSearchTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.barrier = Ticket.objects.create(
+            title='Cancela travada',
+            description='A cancela da entrada não abre',
+            attendant=self.technician
+        )
+        self.printer = Ticket.objects.create(
+            title='Impressora sem papel',
+            description='Trocar bobina da cancela de saída',
+            attendant=self.technician
+        )
+        self.other = Ticket.objects.create(
+            title='Totem desligado',
+            description=None,
+            attendant=self.technician
+        )
+
+        self.client.force_authenticate(user=self.technician)
+
+    def _search(self, value, **params):
+        response = self.client.get(reverse('ticket-list'), {'search': value, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [ticket['id'] for ticket in response.data['results']]
+
+    def test_search_matches_title_and_description(self):
+        self.assertEqual(set(self._search('cancela')), {self.barrier.pk, self.printer.pk})
+
+    def test_search_ranks_by_relevance(self):
+        self.assertEqual(self._search('cancela'), [self.barrier.pk, self.printer.pk])
+
+    def test_search_ignores_accents_and_matches_prefixes(self):
+        self.assertEqual(self._search('saida'), [self.printer.pk])
+        self.assertEqual(self._search('impress'), [self.printer.pk])
+
+    def test_search_with_explicit_ordering(self):
+        self.assertEqual(
+            self._search('cancela', ordering='created_at'),
+            [self.barrier.pk, self.printer.pk]
+        )
+
+    def test_search_follows_ticket_writes(self):
+        self.other.description = 'Cancela quebrada'
+        self.other.save()
+        self.printer.delete()
+
+        self.assertEqual(set(self._search('cancela')), {self.barrier.pk, self.other.pk})
+
+    def test_search_with_punctuation_only(self):
+        self.assertEqual(self._search('"*'), [])
+
+    def test_search_with_keyset_pagination(self):
+        response = self.client.get(
+            reverse('ticket-list'), {'search': 'cancela', 'pagination': 'cursor'}
+        )
+
+        self.assertEqual(
+            [ticket['id'] for ticket in response.data['results']],
+            [self.barrier.pk, self.printer.pk]
+        )
+
+
+class TicketBulkStatusUpdateTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.open_tickets = [
+            Ticket.objects.create(title=f'Aberto {i}', attendant=self.attendant)
+            for i in range(3)
+        ]
+        self.in_progress = Ticket.objects.create(
+            title='Em atendimento',
+            status=TicketStatus.IN_PROGRESS,
+            attendant=self.attendant
+        )
+        self.resolved = Ticket.objects.create(
+            title='Resolvido',
+            status=TicketStatus.RESOLVED,
+            attendant=self.attendant
+        )
+
+        self.url = reverse('ticket-bulk-update-status')
+
+    def test_bulk_update_status_mixed_results(self):
+        self.client.force_authenticate(user=self.technician)
+        ids = [ticket.pk for ticket in self.open_tickets] + [self.in_progress.pk, self.resolved.pk, 9999]
+
+        response = self.client.post(self.url, {'ids': ids, 'status': 'canceled'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 4)
+        self.assertEqual(response.data['failed'], 2)
+
+        results = {result['id']: result for result in response.data['results']}
+        self.assertFalse(results[self.resolved.pk]['success'])
+        self.assertEqual(results[self.resolved.pk]['error'], 'Transição de status inválida.')
+        self.assertEqual(results[9999]['error'], 'Ticket não encontrado.')
+
+        self.assertEqual(
+            Ticket.objects.filter(status=TicketStatus.CANCELED).count(), 4
+        )
+        self.resolved.refresh_from_db()
+        self.assertEqual(self.resolved.status, TicketStatus.RESOLVED)
+
+    def test_bulk_update_status_touches_updated_at(self):
+        self.client.force_authenticate(user=self.technician)
+        before = self.open_tickets[0].updated_at
+
+        self.client.post(
+            self.url, {'ids': [self.open_tickets[0].pk], 'status': 'in_progress'}, format='json'
+        )
+
+        self.open_tickets[0].refresh_from_db()
+        self.assertGreater(self.open_tickets[0].updated_at, before)
+
+    def test_bulk_update_status_groups_updates(self):
+        self.client.force_authenticate(user=self.technician)
+        ids = [ticket.pk for ticket in self.open_tickets] + [self.in_progress.pk]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, {'ids': ids, 'status': 'canceled'}, format='json')
+
+        ticket_updates = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "core_ticket" ')
+        ]
+        self.assertEqual(len(ticket_updates), 2)
+        self.assertEqual(response.data['updated'], 4)
+
+    def test_bulk_update_status_attendant_forbidden(self):
+        self.client.force_authenticate(user=self.attendant)
+
+        response = self.client.post(
+            self.url, {'ids': [self.open_tickets[0].pk], 'status': 'in_progress'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_update_status_invalid_payload(self):
+        self.client.force_authenticate(user=self.technician)
+
+        response = self.client.post(self.url, {'ids': [], 'status': 'in_progress'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TicketImportTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.url = reverse('ticket-import-tickets')
+
+    def _upload(self, name, content):
+        return self.client.post(
+            self.url,
+            {'file': SimpleUploadedFile(name, content.encode())},
+            format='multipart'
+        )
+
+    def test_import_csv(self):
+        self.client.force_authenticate(user=self.technician)
+        content = (
+            'title,description,priority,status,attendant\n'
+            f'Cancela,Não abre,high,open,{self.attendant.pk}\n'
+            'Totem,,,,\n'
+            ',sem título,low,open,\n'
+            'Prioridade,,urgente,open,\n'
+            'Outro,,low,open,9999\n'
+        )
+
+        response = self._upload('tickets.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['failed'], 3)
+        self.assertEqual([error['row'] for error in response.data['errors']], [4, 5, 6])
+        self.assertIn('title', response.data['errors'][0]['errors'])
+        self.assertIn('priority', response.data['errors'][1]['errors'])
+        self.assertIn('attendant', response.data['errors'][2]['errors'])
+
+        ticket = Ticket.objects.get(title='Cancela')
+        self.assertEqual(ticket.attendant, self.attendant)
+        self.assertEqual(ticket.priority, Priority.HIGH)
+
+        default = Ticket.objects.get(title='Totem')
+        self.assertEqual(default.attendant, self.technician)
+        self.assertEqual(default.priority, Priority.MEDIUM)
+        self.assertIsNone(default.description)
+
+    def test_import_csv_skips_malformed_rows(self):
+        self.client.force_authenticate(user=self.technician)
+        content = b''.join([
+            'title,description\n'.encode(),
+            'Cancela,Não abre\n'.encode(),
+            b'Totem,\xff\xfe\n',
+            f'Gigante,{"x" * (csv.field_size_limit() + 1)}\n'.encode(),
+            'Impressora,"Sem\npapel"\n'.encode(),
+        ])
+
+        response = self.client.post(
+            self.url, {'file': SimpleUploadedFile('tickets.csv', content)}, format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['failed'], 2)
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4])
+        self.assertEqual(set(Ticket.objects.values_list('title', flat=True)), {'Cancela', 'Impressora'})
+        self.assertEqual(Ticket.objects.get(title='Impressora').description, 'Sem\npapel')
+
+    def test_import_ndjson(self):
+        self.client.force_authenticate(user=self.technician)
+        content = (
+            '{"title": "Cancela", "status": "in_progress"}\n'
+            '\n'
+            '{"title": \n'
+            '[1, 2]\n'
+        )
+
+        response = self._upload('tickets.ndjson', content)
+
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4])
+        self.assertEqual(Ticket.objects.get().status, TicketStatus.IN_PROGRESS)
+
+    def test_import_invalid_format(self):
+        self.client.force_authenticate(user=self.technician)
+
+        response = self._upload('tickets.txt', 'title\nCancela\n')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_attendant_forbidden(self):
+        self.client.force_authenticate(user=self.attendant)
+
+        response = self._upload('tickets.csv', 'title\nCancela\n')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TicketExportTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        for i in range(30):
+            Ticket.objects.create(
+                title=f'Cancela {i}' if i % 2 else f'Totem {i}',
+                description='Linha 1\nLinha, "2"' if i == 1 else None,
+                status=TicketStatus.OPEN if i % 3 else TicketStatus.IN_PROGRESS,
+                attendant=self.attendant if i < 20 else self.technician
+            )
+
+        self.url = reverse('ticket-export')
+
+    def _content(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_export_csv_applies_filters(self):
+        self.client.force_authenticate(user=self.technician)
+
+        response = self.client.get(self.url, {'status': 'open'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        rows = list(csv.DictReader(self._content(response).splitlines(keepends=True)))
+        self.assertEqual(len(rows), 20)
+        self.assertTrue(all(row['status'] == 'open' for row in rows))
+
+        ticket = next(row for row in rows if row['title'] == 'Cancela 1')
+        self.assertEqual(ticket['description'], 'Linha 1\nLinha, "2"')
+        self.assertEqual(ticket['attendant_email'], 'atendente@test.com')
+        self.assertEqual(ticket['status_display'], 'Aberto')
+
+    def test_export_ndjson_matches_list_representation(self):
+        self.client.force_authenticate(user=self.technician)
+
+        response = self.client.get(self.url, {'export_format': 'ndjson', 'search': 'cancela'})
+        lines = [json.loads(line) for line in self._content(response).splitlines()]
+        listed = self.client.get(reverse('ticket-list'), {'search': 'cancela'}).data['results']
+
+        self.assertEqual(len(lines), 15)
+        self.assertEqual(lines, json.loads(JSONRenderer().render(listed))[:15])
+
+    def test_export_respects_visibility(self):
+        self.client.force_authenticate(user=self.attendant)
+
+        response = self.client.get(self.url, {'export_format': 'ndjson'})
+        lines = [json.loads(line) for line in self._content(response).splitlines()]
+
+        self.assertEqual(len(lines), 20)
+        self.assertTrue(all(line['attendant']['id'] == self.attendant.pk for line in lines))
+
+    def test_export_include_archived(self):
+        Ticket.objects.filter(title__in=['Totem 0', 'Cancela 1']).update(
+            status=TicketStatus.RESOLVED, status_changed_at=timezone.now() - timedelta(days=120)
+        )
+        archive_closed_tickets(older_than=90, batch_size=100)
+        self.client.force_authenticate(user=self.technician)
+
+        hot = self.client.get(self.url, {'export_format': 'ndjson'})
+        response = self.client.get(self.url, {'export_format': 'ndjson', 'include_archived': 'true'})
+        lines = [json.loads(line) for line in self._content(response).splitlines()]
+        listed = self.client.get(
+            reverse('ticket-list'), {'include_archived': 'true', 'page_size': 100}
+        ).data['results']
+
+        self.assertEqual(len(self._content(hot).splitlines()), 28)
+        self.assertEqual(len(lines), 30)
+        self.assertEqual([line['id'] for line in lines][:len(listed)], [ticket['id'] for ticket in listed])
+
+        searched = self.client.get(
+            self.url, {'export_format': 'ndjson', 'include_archived': 'true', 'search': 'cancela'}
+        )
+        self.assertEqual(len(self._content(searched).splitlines()), 15)
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        token = await sync_to_async(lambda: str(ClaimsRefreshToken.for_user(self.technician).access_token))()
+
+        with patch('django.http.response.sync_to_async', side_effect=AssertionError('list() no ASGI')):
+            response = await self.async_client.get(
+                self.url, {'export_format': 'ndjson'}, headers={'Authorization': f'Bearer {token}'}
+            )
+            self.assertTrue(response.is_async)
+            lines = [json.loads(chunk) async for chunk in response.streaming_content]
+
+        self.assertEqual(len(lines), 30)
+
+    def test_export_invalid_format(self):
+        self.client.force_authenticate(user=self.technician)
+
+        response = self.client.get(self.url, {'export_format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TicketStatsTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.tickets = [
+            Ticket.objects.create(
+                title=f'Ticket {i}',
+                priority=Priority.HIGH if i % 2 else Priority.LOW,
+                attendant=self.attendant if i < 3 else self.technician
+            )
+            for i in range(4)
+        ]
+
+        self.url = reverse('ticket-stats')
+
+    def _stats(self):
+        self.client.force_authenticate(user=self.technician)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_stats_counts_created_tickets(self):
+        with self.assertNumQueries(1):
+            stats = get_stats()
+
+        self.assertEqual(stats, self._stats())
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['by_status'], {'open': 4})
+        self.assertEqual(stats['by_priority'], {'low': 2, 'high': 2})
+        self.assertEqual(
+            stats['by_attendant'],
+            {str(self.attendant.pk): 3, str(self.technician.pk): 1}
+        )
+
+    def test_stats_follow_update_status(self):
+        self.client.force_authenticate(user=self.technician)
+        self.client.patch(
+            reverse('ticket-update-status', args=[self.tickets[0].pk]), {'status': 'in_progress'}
+        )
+
+        self.assertEqual(self._stats()['by_status'], {'open': 3, 'in_progress': 1})
+
+    def test_stats_follow_bulk_update_status(self):
+        self.client.force_authenticate(user=self.technician)
+        self.client.post(
+            reverse('ticket-bulk-update-status'),
+            {'ids': [ticket.pk for ticket in self.tickets[:3]], 'status': 'canceled'},
+            format='json'
+        )
+
+        self.assertEqual(self._stats()['by_status'], {'open': 1, 'canceled': 3})
+
+    def test_stats_follow_edits_and_deletes(self):
+        ticket = Ticket.objects.get(pk=self.tickets[1].pk)
+        ticket.priority = Priority.CRITICAL
+        ticket.save()
+        self.tickets[0].delete()
+
+        stats = self._stats()
+        self.assertEqual(stats['total'], 3)
+        self.assertEqual(stats['by_priority'], {'low': 1, 'high': 1, 'critical': 1})
+        self.assertEqual(stats['by_attendant'][str(self.attendant.pk)], 2)
+
+    def test_stats_follow_attendant_cascade(self):
+        self.attendant.delete()
+
+        stats = self._stats()
+        self.assertEqual(stats['total'], 1)
+        self.assertNotIn(str(self.attendant.pk), stats['by_attendant'])
+
+    def test_stats_attendant_forbidden(self):
+        self.client.force_authenticate(user=self.attendant)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TicketStatusHistoryTest(APITestCase):
+    def setUp(self):
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.ticket = Ticket.objects.create(title='Ticket', attendant=self.attendant)
+        self._age(hours=2)
+
+    def _age(self, **delta):
+        Ticket.objects.filter(pk=self.ticket.pk).update(
+            status_changed_at=timezone.now() - timedelta(**delta)
+        )
+
+    def _update_status(self, new_status):
+        self.client.force_authenticate(user=self.technician)
+        response = self.client.patch(
+            reverse('ticket-update-status', args=[self.ticket.pk]), {'status': new_status}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def _events(self):
+        return list(
+            TicketStatusEvent.objects.filter(ticket=self.ticket)
+            .order_by('created_at', 'id')
+            .values_list('from_status', 'to_status', 'changed_by')
+        )
+
+    def test_update_status_appends_event_and_rollup(self):
+        self._update_status('in_progress')
+
+        self.assertEqual(self._events(), [
+            (None, TicketStatus.OPEN, None),
+            (TicketStatus.OPEN, TicketStatus.IN_PROGRESS, self.technician.pk),
+        ])
+        self.ticket.refresh_from_db()
+        self.assertGreaterEqual(self.ticket.time_open, timedelta(hours=2))
+        self.assertLess(self.ticket.time_open, timedelta(hours=2, minutes=1))
+        self.assertEqual(self.ticket.time_in_progress, timedelta())
+        self.assertEqual(self.ticket.reopen_count, 0)
+
+    def test_reopen_from_resolved_is_counted(self):
+        self._update_status('in_progress')
+        self._age(hours=1)
+        self._update_status('resolved')
+        self._age(minutes=30)
+        self._update_status('in_progress')
+
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.reopen_count, 1)
+        self.assertGreaterEqual(self.ticket.time_in_progress, timedelta(hours=1))
+        self.assertGreaterEqual(self.ticket.time_resolved, timedelta(minutes=30))
+        self.assertEqual(len(self._events()), 4)
+
+    def test_bulk_update_status_appends_events_and_rollups(self):
+        other = Ticket.objects.create(title='Outro', attendant=self.attendant)
+        self.client.force_authenticate(user=self.technician)
+        self.client.post(
+            reverse('ticket-bulk-update-status'),
+            {'ids': [self.ticket.pk, other.pk], 'status': 'canceled'},
+            format='json'
+        )
+
+        self.assertEqual(
+            TicketStatusEvent.objects.filter(to_status=TicketStatus.CANCELED, changed_by=self.technician).count(),
+            2
+        )
+        self.ticket.refresh_from_db()
+        self.assertGreaterEqual(self.ticket.time_open, timedelta(hours=2))
+
+    def test_save_with_new_status_updates_history(self):
+        ticket = Ticket.objects.get(pk=self.ticket.pk)
+        ticket.status = TicketStatus.CANCELED
+        ticket.save()
+
+        self.assertEqual(self._events()[-1], (TicketStatus.OPEN, TicketStatus.CANCELED, None))
+        self.assertGreaterEqual(ticket.time_open, timedelta(hours=2))
+
+    def test_history_endpoint(self):
+        self._update_status('in_progress')
+
+        response = self.client.get(reverse('ticket-history', args=[self.ticket.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(event['from_status'], event['to_status']) for event in response.data],
+            [(None, 'open'), ('open', 'in_progress')]
+        )
+
+        other = Ticket.objects.create(title='Outro', attendant=self.technician)
+        self.client.force_authenticate(user=self.attendant)
+        response = self.client.get(reverse('ticket-history', args=[other.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_sla_reads_rollups(self):
+        self._update_status('in_progress')
+        self._age(hours=1)
+
+        with self.assertNumQueries(1):
+            report = self.client.get(reverse('ticket-sla')).data
+
+        self.assertEqual(report['total'], 1)
+        self.assertEqual(report['reopens'], 0)
+        self.assertGreaterEqual(report['seconds']['open']['total'], 2 * 3600)
+        self.assertGreaterEqual(report['seconds']['in_progress']['average'], 3600)
+        self.assertEqual(report['seconds']['resolved']['total'], 0)
+
+        response = self.client.get(reverse('ticket-sla'), {'status': 'resolved'})
+        self.assertEqual(response.data['total'], 0)
+
+    def test_sla_attendant_forbidden(self):
+        self.client.force_authenticate(user=self.attendant)
+        response = self.client.get(reverse('ticket-sla'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TicketArchiveTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.tickets = [
+            Ticket.objects.create(title=f'Ticket {i}', attendant=self.attendant) for i in range(6)
+        ]
+        old = timezone.now() - timedelta(days=120)
+        Ticket.objects.filter(pk__in=[ticket.pk for ticket in self.tickets[:3]]).update(
+            status=TicketStatus.CANCELED, status_changed_at=old
+        )
+        Ticket.objects.filter(pk=self.tickets[3].pk).update(status=TicketStatus.RESOLVED)
+        self.archived_ids = [ticket.pk for ticket in self.tickets[:3]]
+        reconcile()
+
+        self.assertEqual(archive_closed_tickets(older_than=90, batch_size=2), 3)
+
+    def _list(self, params=None, user=None):
+        self.client.force_authenticate(user=user or self.technician)
+        response = self.client.get(reverse('ticket-list'), params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_archiver_moves_only_old_closed_tickets(self):
+        self.assertEqual(
+            sorted(TicketArchive.objects.values_list('id', flat=True)), self.archived_ids
+        )
+        self.assertFalse(Ticket.objects.filter(pk__in=self.archived_ids).exists())
+        self.assertEqual(Ticket.objects.count(), 3)
+        self.assertEqual(
+            sorted(TicketTombstone.objects.values_list('ticket_id', flat=True)), self.archived_ids
+        )
+        self.assertEqual(get_stats()['by_status'], {'open': 2, 'resolved': 1, 'canceled': 3})
+        self.assertEqual(reconcile(dry_run=True), {})
+
+        archived = TicketArchive.objects.get(pk=self.tickets[0].pk)
+        self.assertEqual(archived.created_at, self.tickets[0].created_at)
+        self.assertEqual(archived.title, 'Ticket 0')
+
+    def test_list_excludes_archived_by_default(self):
+        data = self._list()
+        self.assertEqual(data['count'], 3)
+
+        data = self._list({'include_archived': 'true'})
+        self.assertEqual(data['count'], 6)
+        self.assertEqual(
+            [ticket['title'] for ticket in data['results']],
+            [f'Ticket {i}' for i in reversed(range(6))]
+        )
+
+        data = self._list({'include_archived': 'true', 'status': 'canceled', 'ordering': 'title'})
+        self.assertEqual([ticket['id'] for ticket in data['results']], self.archived_ids)
+
+        data = self._list({'include_archived': 'true', 'search': 'Ticket'}, user=self.attendant)
+        self.assertEqual(data['count'], 6)
+
+    def test_include_archived_rejects_cursor_pagination(self):
+        self.client.force_authenticate(user=self.technician)
+        response = self.client.get(
+            reverse('ticket-list'), {'include_archived': 'true', 'pagination': 'cursor'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_retrieve_and_history_fall_back_to_archive(self):
+        self.client.force_authenticate(user=self.attendant)
+        response = self.client.get(reverse('ticket-detail', args=[self.archived_ids[0]]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'canceled')
+
+        response = self.client.get(reverse('ticket-history', args=[self.archived_ids[0]]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['to_status'], 'open')
+
+        other = User.objects.create_user(email='outro@test.com', password='testpass123')
+        self.client.force_authenticate(user=other)
+        response = self.client.get(reverse('ticket-detail', args=[self.archived_ids[0]]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_reopen_restores_ticket_to_hot_table(self):
+        ticket_id = self.archived_ids[0]
+        self.client.force_authenticate(user=self.technician)
+
+        response = self.client.patch(
+            reverse('ticket-update-status', args=[ticket_id]), {'status': 'open'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'open')
+        ticket = Ticket.objects.get(pk=ticket_id)
+        self.assertEqual(ticket.status, TicketStatus.OPEN)
+        self.assertEqual(ticket.created_at, self.tickets[0].created_at)
+        self.assertGreaterEqual(ticket.time_canceled, timedelta(days=120))
+        self.assertFalse(TicketArchive.objects.filter(pk=ticket_id).exists())
+        self.assertFalse(TicketTombstone.objects.filter(ticket_id=ticket_id).exists())
+        self.assertEqual(get_stats()['by_status'], {'open': 3, 'resolved': 1, 'canceled': 2})
+        self.assertEqual(self._list()['count'], 4)
+
+    def test_invalid_transition_keeps_ticket_archived(self):
+        self.client.force_authenticate(user=self.technician)
+        response = self.client.patch(
+            reverse('ticket-update-status', args=[self.archived_ids[0]]), {'status': 'resolved'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(TicketArchive.objects.filter(pk=self.archived_ids[0]).exists())
+
+    def test_bulk_update_restores_archived_tickets(self):
+        self.client.force_authenticate(user=self.technician)
+        response = self.client.post(
+            reverse('ticket-bulk-update-status'),
+            {'ids': [*self.archived_ids[:2], self.tickets[4].pk], 'status': 'open'},
+            format='json'
+        )
+
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(
+            response.data['results'][2],
+            {'id': self.tickets[4].pk, 'success': False, 'error': 'Transição de status inválida.'}
+        )
+        self.assertEqual(
+            set(Ticket.objects.filter(status=TicketStatus.OPEN).values_list('id', flat=True)),
+            {*self.archived_ids[:2], self.tickets[4].pk, self.tickets[5].pk}
+        )
+        self.assertEqual(TicketArchive.objects.count(), 1)
+
+    def test_counters_follow_archive_and_user_deletion(self):
+        self.assertEqual(get_stats()['by_status'], {'open': 2, 'resolved': 1, 'canceled': 3})
+        self.assertEqual(reconcile(dry_run=True), {})
+
+        self.attendant.delete()
+
+        self.assertFalse(TicketArchive.objects.exists())
+        self.assertEqual(get_stats()['total'], 0)
+        self.assertEqual(reconcile(dry_run=True), {})
+
+    def test_sla_includes_archived(self):
+        self.client.force_authenticate(user=self.technician)
+        hot = self.client.get(reverse('ticket-sla')).data
+        everything = self.client.get(reverse('ticket-sla'), {'include_archived': 'true'}).data
+
+        self.assertEqual(hot['total'], 3)
+        self.assertEqual(everything['total'], 6)
+        self.assertGreaterEqual(everything['seconds']['canceled']['total'], 3 * 120 * 86400)
+
+
+class TicketConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.ticket = Ticket.objects.create(title='Ticket de Teste', attendant=self.attendant)
+        self.other = Ticket.objects.create(title='Outro Ticket', attendant=self.technician)
+
+        self.client.force_authenticate(user=self.technician)
+
+    def test_list_not_modified(self):
+        response = self.client.get(reverse('ticket-list'))
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        etag = response['ETag']
+
+        cache.clear()
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('ticket-list'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_list_etag_changes_on_update_and_delete(self):
+        etag = self.client.get(reverse('ticket-list'))['ETag']
+
+        self.ticket.title = 'Alterado'
+        self.ticket.save()
+        updated = self.client.get(reverse('ticket-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
+
+        self.other.delete()
+        deleted = self.client.get(reverse('ticket-list'), HTTP_IF_NONE_MATCH=updated['ETag'])
+        self.assertEqual(deleted.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(deleted['ETag'], updated['ETag'])
+
+    def test_keyset_list_does_not_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('ticket-list'), {'pagination': 'cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries.captured_queries))
+
+    def test_keyset_list_etag_changes_on_update_and_delete(self):
+        params = {'pagination': 'cursor'}
+        etag = self.client.get(reverse('ticket-list'), params)['ETag']
+
+        cache.clear()
+        self.assertEqual(
+            self.client.get(reverse('ticket-list'), params, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.ticket.title = 'Alterado'
+        self.ticket.save()
+        updated = self.client.get(reverse('ticket-list'), params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
+
+        self.other.delete()
+        deleted = self.client.get(reverse('ticket-list'), params, HTTP_IF_NONE_MATCH=updated['ETag'])
+        self.assertEqual(deleted.status_code, status.HTTP_200_OK)
+        self.assertEqual([ticket['id'] for ticket in deleted.data['results']], [self.ticket.pk])
+
+    def test_keyset_list_etag_changes_when_row_leaves_filter(self):
+        params = {'pagination': 'cursor', 'status': 'open'}
+        etag = self.client.get(reverse('ticket-list'), params)['ETag']
+
+        self.client.patch(reverse('ticket-update-status', args=[self.ticket.pk]), {'status': 'in_progress'})
+
+        cache.clear()
+        response = self.client.get(reverse('ticket-list'), params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([ticket['id'] for ticket in response.data['results']], [self.other.pk])
+
+    def test_list_etag_depends_on_filters_and_scope(self):
+        etag = self.client.get(reverse('ticket-list'))['ETag']
+
+        filtered = self.client.get(reverse('ticket-list'), {'status': 'open'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(filtered.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.attendant)
+        scoped = self.client.get(reverse('ticket-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(scoped.status_code, status.HTTP_200_OK)
+
+    def test_list_if_modified_since(self):
+        last_modified = self.client.get(reverse('ticket-list'))['Last-Modified']
+
+        response = self.client.get(reverse('ticket-list'), HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_not_modified(self):
+        url = reverse('ticket-detail', args=[self.ticket.pk])
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.ticket.status = TicketStatus.CANCELED
+        self.ticket.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'canceled')
+
+
+class TicketListCacheTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.other_technician = User.objects.create_user(
+            email='tecnico2@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.ticket = Ticket.objects.create(title='Ticket de Teste', attendant=self.attendant)
+        Ticket.objects.create(title='Outro Ticket', attendant=self.technician)
+
+    def _list(self, user, params=None):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse('ticket-list'), params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_repeated_list_is_served_from_cache(self):
+        first = self._list(self.technician, {'status': 'open', 'page': 1})
+
+        with self.assertNumQueries(0):
+            second = self._list(self.technician, {'page': 1, 'status': 'open'})
+
+        self.assertEqual(second.data, first.data)
+
+    def test_cache_is_shared_by_scope(self):
+        self._list(self.technician)
+
+        with self.assertNumQueries(0):
+            self._list(self.other_technician)
+
+        with self.assertNumQueries(2):
+            response = self._list(self.attendant)
+
+        self.assertEqual(response.data['count'], 1)
+
+    def test_ticket_writes_invalidate_cache(self):
+        self._list(self.technician)
+
+        self.ticket.title = 'Alterado'
+        self.ticket.save()
+        self.assertEqual(self._list(self.technician).data['results'][1]['title'], 'Alterado')
+
+        self.ticket.delete()
+        self.assertEqual(self._list(self.technician).data['count'], 1)
+
+    def test_update_status_invalidates_cache(self):
+        self._list(self.technician, {'status': 'open'})
+
+        self.client.patch(
+            reverse('ticket-update-status', args=[self.ticket.pk]), {'status': 'in_progress'}
+        )
+
+        self.assertEqual(self._list(self.technician, {'status': 'open'}).data['count'], 1)
+
+    @override_settings(WEB_CONCURRENCY=3)
+    def test_process_local_cache_is_bypassed_with_several_workers(self):
+        self._list(self.technician)
+
+        with self.assertNumQueries(2):
+            self._list(self.technician)
+
+        with self.settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache'},
+        }):
+            call_command('createcachetable', verbosity=0)
+            self._list(self.technician)
+            with CaptureQueriesContext(connection) as queries:
+                self._list(self.technician)
+
+        self.assertFalse(any('core_ticket' in query['sql'] for query in queries.captured_queries))
+
+    def test_check_warns_about_process_local_cache_with_several_workers(self):
+        self.assertEqual(check_ticket_list_cache(None), [])
+
+        with self.settings(WEB_CONCURRENCY=3):
+            self.assertEqual([warning.id for warning in check_ticket_list_cache(None)], ['core.W001'])
+
+    def test_bulk_update_status_invalidates_cache(self):
+        self._list(self.technician, {'status': 'open'})
+
+        self.client.post(
+            reverse('ticket-bulk-update-status'),
+            {'ids': [self.ticket.pk], 'status': 'canceled'},
+            format='json'
+        )
+
+        self.assertEqual(self._list(self.technician, {'status': 'open'}).data['count'], 1)
+
+
+@override_settings(TICKET_SYNC_SETTLE_SECONDS=0)
+class TicketChangesTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('ticket-changes')
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        self.tickets = [
+            Ticket.objects.create(
+                title=f'Ticket {i}',
+                attendant=self.attendant if i % 2 else self.technician
+            )
+            for i in range(5)
+        ]
+
+    def _changes(self, user, cursor=None, **params):
+        self.client.force_authenticate(user=user)
+        if cursor:
+            params['cursor'] = cursor
+        return self.client.get(self.url, params)
+
+    def test_initial_sync_returns_everything_visible(self):
+        response = self._changes(self.technician)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['id'] for row in response.data['results']], [t.pk for t in self.tickets])
+        self.assertEqual(response.data['deleted'], [])
+        self.assertFalse(response.data['has_more'])
+
+        again = self._changes(self.technician, response.data['cursor'])
+        self.assertEqual(again.data['results'], [])
+        self.assertEqual(again.data['cursor'], response.data['cursor'])
+
+    def test_returns_only_changes_after_cursor(self):
+        cursor = self._changes(self.technician).data['cursor']
+        self.client.patch(
+            reverse('ticket-update-status', args=[self.tickets[1].pk]), {'status': 'in_progress'}
+        )
+
+        response = self._changes(self.technician, cursor)
+
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], self.tickets[1].pk)
+        self.assertEqual(response.data['results'][0]['status'], 'in_progress')
+
+    def test_pages_in_stable_order(self):
+        Ticket.objects.filter(pk__in=[t.pk for t in self.tickets[:3]]).update(
+            updated_at=self.tickets[0].updated_at
+        )
+
+        seen, cursor = [], None
+        while True:
+            response = self._changes(self.technician, cursor, limit=2)
+            seen.extend(row['id'] for row in response.data['results'])
+            cursor = response.data['cursor']
+            if not response.data['has_more']:
+                break
+
+        expected = list(
+            Ticket.objects.order_by('updated_at', 'id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_attendant_only_sees_own_tickets(self):
+        response = self._changes(self.attendant)
+
+        self.assertEqual(
+            [row['id'] for row in response.data['results']],
+            [t.pk for t in self.tickets if t.attendant_id == self.attendant.pk]
+        )
+
+    def test_deletes_leave_tombstones(self):
+        cursor = self._changes(self.technician).data['cursor']
+        own_id, other_id = self.tickets[1].pk, self.tickets[0].pk
+        self.tickets[1].delete()
+        self.tickets[0].delete()
+
+        response = self._changes(self.technician, cursor)
+        self.assertEqual(response.data['results'], [])
+        self.assertEqual(response.data['deleted'], [own_id, other_id])
+
+        self.assertEqual(self._changes(self.attendant, cursor).data['deleted'], [own_id])
+        self.assertEqual(self._changes(self.technician, response.data['cursor']).data['deleted'], [])
+
+    def test_user_cascade_leaves_tombstones(self):
+        attendant_tickets = sorted(t.pk for t in self.tickets if t.attendant_id == self.attendant.pk)
+        cursor = self._changes(self.technician).data['cursor']
+
+        self.attendant.delete()
+
+        response = self._changes(self.technician, cursor)
+        self.assertEqual(sorted(response.data['deleted']), attendant_tickets)
+        self.assertEqual(TicketTombstone.objects.count(), len(attendant_tickets))
+
+    def test_query_count_is_constant(self):
+        self.client.force_authenticate(user=self.technician)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {'limit': 2})
+
+        self.assertEqual(len(queries), 2)
+
+    def test_invalid_cursor(self):
+        response = self._changes(self.technician, 'invalido')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(TICKET_SYNC_SETTLE_SECONDS=60)
+    def test_recent_changes_wait_for_settle_window(self):
+        response = self._changes(self.technician)
+
+        self.assertEqual(response.data['results'], [])
+        self.assertEqual(response.data['cursor'], self._changes(self.technician).data['cursor'])
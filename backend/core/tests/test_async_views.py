@@ -0,0 +1,181 @@
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from authentication.models import UserProfile
+from authentication.tokens import ClaimsRefreshToken
+from core.archive import archive_closed_tickets
+from core.models import Ticket, TicketStatus, Priority
+
+User = get_user_model()
+
+
+class AsyncTicketViewsTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        for i in range(25):
+            Ticket.objects.create(
+                title=f'Ticket {i}',
+                priority=Priority.HIGH if i % 2 else Priority.LOW,
+                attendant=self.attendant if i % 3 else self.technician
+            )
+        self.ticket = Ticket.objects.filter(attendant=self.attendant).first()
+
+    def _authenticate(self, user):
+        token = ClaimsRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def _json(self, response):
+        return json.loads(response.content)
+
+    def _assert_same_list(self, user, params):
+        self._authenticate(user)
+        sync = self.client.get(reverse('ticket-list'), params)
+        async_ = self.client.get(reverse('async-ticket-list'), params)
+
+        self.assertEqual(async_.status_code, status.HTTP_200_OK)
+        sync_data, async_data = self._json(sync), self._json(async_)
+        self.assertEqual(async_data['results'], sync_data['results'])
+        self.assertEqual(async_data['count'], sync_data['count'])
+        self.assertEqual(async_data['next'] is None, sync_data['next'] is None)
+        self.assertEqual(async_data['previous'] is None, sync_data['previous'] is None)
+        return async_data
+
+    def test_list_matches_sync_view(self):
+        data = self._assert_same_list(self.technician, {})
+        self.assertEqual(len(data['results']), 20)
+
+        self._assert_same_list(self.technician, {'page': 2})
+        self._assert_same_list(self.technician, {'priority': 'high', 'ordering': 'title'})
+        self._assert_same_list(self.attendant, {})
+
+    def test_list_include_archived_matches_sync_view(self):
+        Ticket.objects.filter(pk__in=Ticket.objects.order_by('id').values('id')[:10]).update(
+            status=TicketStatus.CANCELED,
+            status_changed_at=timezone.now() - timedelta(days=200)
+        )
+        archive_closed_tickets(older_than=90, batch_size=4)
+
+        data = self._assert_same_list(self.technician, {'include_archived': 'true', 'page': 2})
+        self.assertEqual(data['count'], 25)
+        self._assert_same_list(self.attendant, {'include_archived': 'true', 'status': 'canceled'})
+
+    def test_list_next_link_walks_pages(self):
+        self._authenticate(self.technician)
+
+        first = self._json(self.client.get(reverse('async-ticket-list')))
+        second = self._json(self.client.get(first['next']))
+
+        self.assertEqual(len(second['results']), 5)
+        self.assertIsNone(second['next'])
+        self.assertEqual(self._json(self.client.get(second['previous']))['results'], first['results'])
+
+    def test_list_invalid_page_and_filter(self):
+        self._authenticate(self.technician)
+
+        self.assertEqual(
+            self.client.get(reverse('async-ticket-list'), {'page': 9}).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(
+            self.client.get(reverse('async-ticket-list'), {'status': 'x'}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_list_rejects_cursor_pagination(self):
+        self._authenticate(self.technician)
+
+        for params in ({'pagination': 'cursor'}, {'cursor': 'abc'}):
+            response = self.client.get(reverse('async-ticket-list'), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('cursor', self._json(response)['error'])
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache'},
+    })
+    def test_list_uses_async_cache_calls(self):
+        call_command('createcachetable', verbosity=0)
+        self._authenticate(self.technician)
+
+        first = self.client.get(reverse('async-ticket-list'))
+        with self.assertNumQueries(2):
+            second = self.client.get(reverse('async-ticket-list'))
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._json(second), self._json(first))
+
+    def test_list_requires_authentication(self):
+        response = self.client.get(reverse('async-ticket-list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalido')
+        response = self.client.get(reverse('async-ticket-list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_retrieve_matches_sync_view(self):
+        self._authenticate(self.technician)
+        url = reverse('async-ticket-detail', args=[self.ticket.pk])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.content,
+            self.client.get(reverse('ticket-detail', args=[self.ticket.pk])).content
+        )
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+    def test_retrieve_respects_visibility(self):
+        self._authenticate(self.attendant)
+        other = Ticket.objects.filter(attendant=self.technician).first()
+
+        response = self.client.get(reverse('async-ticket-detail', args=[other.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_update_status(self):
+        self._authenticate(self.technician)
+        url = reverse('async-ticket-update-status', args=[self.ticket.pk])
+
+        response = self.client.patch(url, {'status': 'in_progress'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._json(response)['status'], 'in_progress')
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, TicketStatus.IN_PROGRESS)
+
+        response = self.client.patch(url, {'status': 'open'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update_status_attendant_forbidden(self):
+        self._authenticate(self.attendant)
+        url = reverse('async-ticket-update-status', args=[self.ticket.pk])
+
+        response = self.client.patch(url, {'status': 'in_progress'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
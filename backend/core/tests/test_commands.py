@@ -0,0 +1,124 @@
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from authentication.models import UserProfile
+from core.counters import get_stats
+from core.models import Ticket, TicketArchive, TicketCounter, TicketStatus
+
+User = get_user_model()
+
+
+class ImportTicketsCommandTest(TestCase):
+    def setUp(self):
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+    def _write(self, suffix, content):
+        handle = tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False, encoding='utf-8')
+        handle.write(content)
+        handle.close()
+        self.addCleanup(os.remove, handle.name)
+        return handle.name
+
+    def test_import_tickets_in_batches(self):
+        path = self._write('.ndjson', ''.join(
+            f'{{"title": "Ticket {i}", "priority": "low"}}\n' for i in range(25)
+        ) + '{"priority": "low"}\n')
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command(
+            'import_tickets', path, attendant='atendente@test.com', batch_size=10,
+            stdout=stdout, stderr=stderr
+        )
+
+        self.assertEqual(Ticket.objects.filter(attendant=self.attendant).count(), 25)
+        self.assertIn('25 tickets importados, 1 com erro', stdout.getvalue())
+        self.assertIn('"row": 26', stderr.getvalue())
+
+    def test_import_tickets_unknown_attendant(self):
+        path = self._write('.csv', 'title\nCancela\n')
+
+        with self.assertRaises(CommandError):
+            call_command('import_tickets', path, attendant='ninguem@test.com')
+
+
+class ReconcileTicketCountersCommandTest(TestCase):
+    def setUp(self):
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        for i in range(3):
+            Ticket.objects.create(title=f'Ticket {i}', attendant=self.attendant)
+
+    def test_reports_and_fixes_drift(self):
+        Ticket.objects.filter(title='Ticket 0').update(status=TicketStatus.CANCELED)
+        stdout = StringIO()
+
+        call_command('reconcile_ticket_counters', dry_run=True, stdout=stdout)
+
+        self.assertIn('status:canceled contador=0 real=1', stdout.getvalue())
+        self.assertIn('status:open contador=3 real=2', stdout.getvalue())
+        self.assertEqual(get_stats()['by_status'], {'open': 3})
+
+        call_command('reconcile_ticket_counters', stdout=StringIO())
+
+        self.assertEqual(get_stats()['by_status'], {'open': 2, 'canceled': 1})
+
+    def test_consistent_counters(self):
+        stdout = StringIO()
+
+        call_command('reconcile_ticket_counters', stdout=stdout)
+
+        self.assertIn('Contadores consistentes.', stdout.getvalue())
+        self.assertEqual(TicketCounter.objects.get(dimension='status', key='open').count, 3)
+
+
+class ArchiveTicketsCommandTest(TestCase):
+    def setUp(self):
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        for i in range(5):
+            Ticket.objects.create(title=f'Ticket {i}', attendant=self.attendant)
+        Ticket.objects.filter(title__in=['Ticket 0', 'Ticket 1', 'Ticket 2']).update(
+            status=TicketStatus.RESOLVED,
+            status_changed_at=timezone.now() - timedelta(days=40)
+        )
+
+    def test_dry_run_only_counts(self):
+        stdout = StringIO()
+
+        call_command('archive_tickets', days=30, dry_run=True, stdout=stdout)
+
+        self.assertIn('3 chamados seriam arquivados.', stdout.getvalue())
+        self.assertEqual(TicketArchive.objects.count(), 0)
+
+    def test_archives_in_batches(self):
+        stdout = StringIO()
+
+        call_command('archive_tickets', days=30, batch_size=2, stdout=stdout)
+
+        self.assertIn('2 chamados arquivados...', stdout.getvalue())
+        self.assertIn('3 chamados arquivados em', stdout.getvalue())
+        self.assertEqual(TicketArchive.objects.count(), 3)
+        self.assertEqual(Ticket.objects.count(), 2)
+
+        call_command('archive_tickets', days=60, stdout=StringIO())
+        self.assertEqual(TicketArchive.objects.count(), 3)
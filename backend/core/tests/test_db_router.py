@@ -0,0 +1,89 @@
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from authentication.models import User
+from config.db_router import ReplicaRouter, is_pinned
+from config.middleware import ReplicaPinningMiddleware
+from core.models import Ticket
+
+
+@override_settings(DATABASE_REPLICAS=['replica_0', 'replica_1'], REPLICA_PIN_SECONDS=5)
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def _request(self, view, token='token-a'):
+        request = self.factory.get('/api/tickets/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return ReplicaPinningMiddleware(view)(request)
+
+    def test_reads_go_to_replicas_and_writes_to_primary(self):
+        def view(request):
+            return [
+                self.router.db_for_read(Ticket),
+                self.router.db_for_read(User),
+                self.router.db_for_read(Session),
+                self.router.db_for_write(Ticket),
+            ]
+
+        ticket_db, user_db, session_db, write_db = self._request(view)
+
+        self.assertIn(ticket_db, ['replica_0', 'replica_1'])
+        self.assertIn(user_db, ['replica_0', 'replica_1'])
+        self.assertIsNone(session_db)
+        self.assertEqual(write_db, 'default')
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertEqual(self.router.db_for_read(Ticket), 'default')
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_routing_is_untouched(self):
+        self.assertIsNone(self.router.db_for_read(Ticket))
+        self.assertEqual(self.router.db_for_write(Ticket), 'default')
+
+    def test_migrations_only_run_on_primary(self):
+        self.assertTrue(self.router.allow_migrate('default', 'core'))
+        self.assertFalse(self.router.allow_migrate('replica_0', 'core'))
+
+    def test_reads_after_write_stay_on_primary_for_the_request(self):
+        seen = []
+
+        def view(request):
+            seen.append(self.router.db_for_read(Ticket))
+            self.router.db_for_write(Ticket)
+            seen.append(self.router.db_for_read(Ticket))
+            return None
+
+        self._request(view)
+
+        self.assertNotEqual(seen[0], 'default')
+        self.assertEqual(seen[1], 'default')
+        self.assertFalse(is_pinned())
+
+    def test_same_client_is_pinned_after_write(self):
+        self._request(lambda request: self.router.db_for_write(Ticket))
+
+        self.assertEqual(self._request(lambda request: self.router.db_for_read(Ticket)), 'default')
+        self.assertNotEqual(
+            self._request(lambda request: self.router.db_for_read(Ticket), token='token-b'), 'default'
+        )
+
+    @override_settings(REPLICA_PIN_SECONDS=-1)
+    def test_pin_expires(self):
+        self._request(lambda request: self.router.db_for_write(Ticket))
+
+        self.assertNotEqual(self._request(lambda request: self.router.db_for_read(Ticket)), 'default')
+
+    async def test_async_requests_are_tracked(self):
+        async def write(request):
+            self.router.db_for_write(Ticket)
+            return is_pinned()
+
+        async def read(request):
+            return self.router.db_for_read(Ticket)
+
+        request = self.factory.get('/', HTTP_AUTHORIZATION='Bearer token-c')
+        self.assertTrue(await ReplicaPinningMiddleware(write)(request))
+        self.assertEqual(await ReplicaPinningMiddleware(read)(request), 'default')
@@ -0,0 +1,379 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import AsyncClient, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import UserProfile
+from authentication.tokens import ClaimsRefreshToken
+from core.checks import check_ticket_events
+from core.events import (
+    TICKET_CREATED, TICKET_STATUS_CHANGED, CacheBroker, InProcessBroker, get_broker,
+    visibility_filter,
+)
+from core.models import Ticket, TicketStatus
+
+User = get_user_model()
+
+
+def ticket_event(ticket_id, attendant_id=1):
+    return {
+        'type': TICKET_CREATED,
+        'ticket': {'id': ticket_id, 'attendant': {'id': attendant_id}},
+    }
+
+
+class InProcessBrokerTest(SimpleTestCase):
+    async def test_delivers_to_matching_subscribers(self):
+        broker = InProcessBroker()
+        everything, _ = await broker.subscribe(visibility_filter('technician'))
+        own, _ = await broker.subscribe(visibility_filter('attendant:2'))
+
+        broker.publish([ticket_event(1, attendant_id=1), ticket_event(2, attendant_id=2)])
+        await asyncio.sleep(0)
+
+        self.assertEqual((await everything.get())['ticket']['id'], 1)
+        self.assertEqual((await everything.get())['ticket']['id'], 2)
+        self.assertEqual((await own.get())['ticket']['id'], 2)
+        self.assertTrue(own.queue.empty())
+
+        broker.unsubscribe(everything)
+        broker.unsubscribe(own)
+        self.assertEqual(broker.subscribers, {})
+
+    async def test_resumes_from_last_event_id(self):
+        broker = InProcessBroker()
+        first, second, third = broker.publish([ticket_event(i) for i in range(3)])
+
+        _, missed = await broker.subscribe(visibility_filter('technician'), first['id'])
+        self.assertEqual(missed, [second, third])
+
+        _, missed = await broker.subscribe(visibility_filter('technician'), third['id'])
+        self.assertEqual(missed, [])
+
+    async def test_unknown_last_event_id_requires_reset(self):
+        broker = InProcessBroker()
+        broker.publish([ticket_event(1)])
+
+        _, missed = await broker.subscribe(visibility_filter('technician'), 'outro-processo-1')
+        self.assertIsNone(missed)
+
+    @override_settings(TICKET_EVENTS_HISTORY=2)
+    async def test_expired_history_requires_reset(self):
+        broker = InProcessBroker()
+        first, *_ = broker.publish([ticket_event(i) for i in range(4)])
+
+        _, missed = await broker.subscribe(visibility_filter('technician'), first['id'])
+        self.assertIsNone(missed)
+
+    @override_settings(TICKET_EVENTS_QUEUE_SIZE=2)
+    async def test_slow_subscriber_gets_reset(self):
+        broker = InProcessBroker()
+        subscription, _ = await broker.subscribe(visibility_filter('technician'))
+
+        broker.publish([ticket_event(i) for i in range(5)])
+        await asyncio.sleep(0)
+
+        self.assertIsNone(await subscription.get())
+        self.assertTrue(subscription.queue.empty())
+
+        broker.publish([ticket_event(6)])
+        await asyncio.sleep(0)
+        self.assertEqual((await subscription.get())['ticket']['id'], 6)
+
+
+@override_settings(TICKET_EVENTS_POLL_INTERVAL=0.01)
+class CacheBrokerTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    async def test_polls_shared_cache(self):
+        subscriber, publisher = CacheBroker(), CacheBroker()
+        subscription, _ = await subscriber.subscribe(visibility_filter('technician'))
+
+        published = publisher.publish([ticket_event(1), ticket_event(2)])
+
+        received = [
+            await asyncio.wait_for(subscription.get(), 1),
+            await asyncio.wait_for(subscription.get(), 1),
+        ]
+        self.assertEqual(received, published)
+        self.assertEqual(await subscriber.alast_event_id(), published[-1]['id'])
+
+        subscriber.unsubscribe(subscription)
+        await asyncio.sleep(0.05)
+        self.assertEqual(subscriber.pollers, {})
+
+    async def test_resumes_from_last_event_id(self):
+        broker = CacheBroker()
+        first, second = broker.publish([ticket_event(1), ticket_event(2)])
+
+        subscription, missed = await broker.subscribe(visibility_filter('technician'), first['id'])
+        self.assertEqual(missed, [second])
+
+        _, missed = await broker.subscribe(visibility_filter('technician'), 'abc')
+        self.assertIsNone(missed)
+
+        broker.unsubscribe(subscription)
+
+
+    @override_settings(TICKET_EVENTS_POLL_INTERVAL=0.1)
+    async def test_waits_for_missing_event(self):
+        broker = CacheBroker()
+        subscription, _ = await broker.subscribe(visibility_filter('technician'))
+        first, second = broker.publish([ticket_event(1), ticket_event(2)])
+        cache.delete(broker._event_key(first['id']))
+
+        await asyncio.sleep(0.13)
+        self.assertTrue(subscription.queue.empty())
+
+        cache.set(broker._event_key(first['id']), first)
+        received = [
+            await asyncio.wait_for(subscription.get(), 1),
+            await asyncio.wait_for(subscription.get(), 1),
+        ]
+        self.assertEqual(received, [first, second])
+        broker.unsubscribe(subscription)
+
+    async def test_lost_event_requires_reset(self):
+        broker = CacheBroker()
+        subscription, _ = await broker.subscribe(visibility_filter('technician'))
+        first, second = broker.publish([ticket_event(1), ticket_event(2)])
+        cache.delete(broker._event_key(first['id']))
+
+        self.assertIsNone(await asyncio.wait_for(subscription.get(), 1))
+        self.assertEqual(await asyncio.wait_for(subscription.get(), 1), second)
+        broker.unsubscribe(subscription)
+
+    def test_publish_skips_claimed_ids(self):
+        broker = CacheBroker()
+        cache.add(broker._event_key('1'), ticket_event(9))
+
+        published = broker.publish([ticket_event(1)])
+
+        self.assertEqual(published[0]['id'], '2')
+        self.assertEqual(cache.get(broker.sequence_key), 1)
+
+
+@override_settings(
+    TICKET_EVENTS_POLL_INTERVAL=0.01,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache'}},
+)
+class DatabaseCacheBrokerTest(TestCase):
+    def setUp(self):
+        call_command('createcachetable', verbosity=0)
+
+    async def test_subscribes_from_async_code(self):
+        broker = CacheBroker()
+        await sync_to_async(broker.publish)([ticket_event(1)])
+
+        subscription, missed = await broker.subscribe(visibility_filter('technician'), '0')
+
+        self.assertEqual([event['id'] for event in missed], ['1'])
+        self.assertEqual(await broker.alast_event_id(), '1')
+        broker.unsubscribe(subscription)
+
+
+class TicketEventsCheckTest(SimpleTestCase):
+    def _ids(self):
+        return [error.id for error in check_ticket_events(None)]
+
+    @override_settings(WEB_CONCURRENCY=1, TICKET_EVENTS_BACKEND='core.events.InProcessBroker')
+    def test_in_process_broker_is_fine_with_one_worker(self):
+        self.assertEqual(self._ids(), [])
+
+    @override_settings(WEB_CONCURRENCY=3, TICKET_EVENTS_BACKEND='core.events.InProcessBroker')
+    def test_in_process_broker_is_refused_with_several_workers(self):
+        self.assertEqual(self._ids(), ['core.E001'])
+
+    @override_settings(WEB_CONCURRENCY=3, TICKET_EVENTS_BACKEND='core.events.CacheBroker')
+    def test_cache_broker_needs_shared_cache(self):
+        self.assertEqual(self._ids(), ['core.E002'])
+
+        with self.settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache'},
+        }):
+            self.assertEqual(self._ids(), [])
+
+
+class TicketEventPublishingTest(TestCase):
+    def setUp(self):
+        get_broker.cache_clear()
+        self.client = APIClient()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+    def tearDown(self):
+        get_broker.cache_clear()
+
+    def _events(self):
+        return [(event['type'], event['ticket']['id']) for event in get_broker().history]
+
+    def test_create_and_status_change_publish_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ticket = Ticket.objects.create(title='Novo', attendant=self.attendant)
+        self.assertEqual(self._events(), [(TICKET_CREATED, ticket.pk)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ticket.title = 'Só o título'
+            ticket.save()
+        self.assertEqual(len(self._events()), 1)
+
+        self.client.force_authenticate(user=self.technician)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                reverse('ticket-update-status', args=[ticket.pk]),
+                {'status': 'in_progress'},
+                format='json'
+            )
+
+        event = get_broker().history[-1]
+        self.assertEqual(event['type'], TICKET_STATUS_CHANGED)
+        self.assertEqual(event['ticket']['status'], 'in_progress')
+        self.assertEqual(event['ticket']['title'], 'Só o título')
+
+    def test_rolled_back_changes_are_not_published(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Ticket.objects.create(title='Novo', attendant=self.attendant)
+
+        self.assertEqual(len(callbacks), 2)
+        self.assertEqual(self._events(), [])
+
+    def test_bulk_update_publishes_moved_tickets(self):
+        tickets = [Ticket.objects.create(title=f'Ticket {i}', attendant=self.attendant) for i in range(3)]
+        Ticket.objects.filter(pk=tickets[2].pk).update(status=TicketStatus.CANCELED)
+        get_broker.cache_clear()
+
+        self.client.force_authenticate(user=self.technician)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse('ticket-bulk-update-status'),
+                {'ids': [ticket.pk for ticket in tickets], 'status': 'in_progress'},
+                format='json'
+            )
+
+        self.assertEqual(self._events(), [
+            (TICKET_STATUS_CHANGED, tickets[0].pk),
+            (TICKET_STATUS_CHANGED, tickets[1].pk),
+        ])
+
+    def test_import_publishes_created_tickets(self):
+        self.client.force_authenticate(user=self.technician)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse('ticket-import-tickets'),
+                {'file': SimpleUploadedFile('tickets.csv', b'title\nA\nB\n')},
+                format='multipart'
+            )
+
+        self.assertEqual(
+            [event_type for event_type, _ in self._events()], [TICKET_CREATED, TICKET_CREATED]
+        )
+
+
+class TicketEventStreamTest(TestCase):
+    def setUp(self):
+        get_broker.cache_clear()
+        self.client = AsyncClient()
+        self.url = reverse('ticket-events')
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+    def tearDown(self):
+        get_broker.cache_clear()
+
+    def _token(self, user):
+        return str(ClaimsRefreshToken.for_user(user).access_token)
+
+    async def _next(self, stream):
+        return (await asyncio.wait_for(anext(stream), 1)).decode()
+
+    def _publish(self, attendant):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Ticket.objects.create(title='Novo', attendant=attendant)
+
+    async def test_streams_visible_events(self):
+        response = await self.client.get(
+            self.url, headers={'Authorization': f'Bearer {self._token(self.attendant)}'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        stream = response.streaming_content
+        self.assertTrue((await self._next(stream)).startswith('retry: '))
+
+        await sync_to_async(self._publish)(self.technician)
+        ticket = await sync_to_async(self._publish)(self.attendant)
+
+        message = await self._next(stream)
+        lines = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+        self.assertEqual(lines['event'], TICKET_CREATED)
+        self.assertEqual(json.loads(lines['data'])['id'], ticket.pk)
+        self.assertEqual(lines['id'], get_broker().last_event_id)
+        await stream.aclose()
+
+    async def test_resumes_with_last_event_id(self):
+        first = await sync_to_async(self._publish)(self.attendant)
+        second = await sync_to_async(self._publish)(self.attendant)
+        first_id = get_broker().history[0]['id']
+
+        response = await self.client.get(
+            self.url,
+            {'access_token': self._token(self.technician)},
+            headers={'Last-Event-ID': first_id}
+        )
+        stream = response.streaming_content
+        await self._next(stream)
+
+        self.assertIn(f'"id":{second.pk}', await self._next(stream))
+        self.assertNotEqual(first.pk, second.pk)
+        await stream.aclose()
+
+    async def test_unknown_last_event_id_sends_reset(self):
+        response = await self.client.get(
+            self.url,
+            {'access_token': self._token(self.technician), 'last_event_id': 'antigo-1'}
+        )
+        stream = response.streaming_content
+        await self._next(stream)
+
+        self.assertIn('event: reset', await self._next(stream))
+        await stream.aclose()
+
+    async def test_requires_authentication(self):
+        response = await self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = await self.client.get(self.url, {'access_token': 'invalido'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_requires_asgi(self):
+        response = APIClient().get(self.url, {'access_token': self._token(self.technician)})
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
@@ -0,0 +1,132 @@
+import json
+import pstats
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authentication.models import UserProfile
+from authentication.tokens import ClaimsRefreshToken
+from config import profiling
+from config.profiling import RequestProfile
+from core.models import Ticket
+
+User = get_user_model()
+
+
+def _server_timing(response):
+    metrics = {}
+    for metric in response['Server-Timing'].split(', '):
+        name, *params = metric.split(';')
+        metrics[name] = dict(param.split('=', 1) for param in params)
+    return metrics
+
+
+@override_settings(REQUEST_PROFILING=True, REQUEST_PROFILING_SAMPLE_RATE=0, REQUEST_PROFILING_SLOW_MS=10000)
+class RequestProfilingTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+        for i in range(3):
+            Ticket.objects.create(title=f'Ticket {i}', attendant=self.technician)
+        token = ClaimsRefreshToken.for_user(self.technician).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def _profiled_get(self, url, **params):
+        return self.client.get(url, params, HTTP_X_PROFILE='1')
+
+    @override_settings(REQUEST_PROFILING=False)
+    def test_disabled_by_default(self):
+        response = self._profiled_get(reverse('ticket-list'))
+
+        self.assertNotIn('Server-Timing', response)
+
+    def test_unsampled_requests_are_not_profiled(self):
+        response = self.client.get(reverse('ticket-list'))
+
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(REQUEST_PROFILING_SAMPLE_RATE=1)
+    def test_sampled_requests_are_profiled(self):
+        response = self.client.get(reverse('ticket-list'))
+
+        self.assertIn('Server-Timing', response)
+
+    def test_server_timing_reports_request_breakdown(self):
+        response = self._profiled_get(reverse('ticket-list'))
+
+        self.assertEqual(response.status_code, 200)
+        metrics = _server_timing(response)
+        self.assertEqual(set(metrics), {'total', 'db', 'serialize'})
+        self.assertGreater(float(metrics['total']['dur']), 0)
+        self.assertGreater(float(metrics['serialize']['dur']), 0)
+        self.assertGreaterEqual(float(metrics['total']['dur']), float(metrics['db']['dur']))
+        self.assertRegex(metrics['db']['desc'], r'^"consultas=[1-9]\d* duplicadas=\d+"$')
+
+    def test_async_views_are_profiled(self):
+        response = self._profiled_get(reverse('async-ticket-list'))
+
+        self.assertEqual(response.status_code, 200)
+        metrics = _server_timing(response)
+        self.assertRegex(metrics['db']['desc'], r'consultas=[1-9]')
+        self.assertGreater(float(metrics['serialize']['dur']), 0)
+
+    async def test_asgi_requests_are_profiled(self):
+        token = await sync_to_async(lambda: str(ClaimsRefreshToken.for_user(self.technician).access_token))()
+        response = await self.async_client.get(
+            reverse('async-ticket-list'), headers={'Authorization': f'Bearer {token}', 'X-Profile': '1'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(_server_timing(response)['db']['desc'], r'consultas=[1-9]')
+
+    @override_settings(REQUEST_PROFILING_SLOW_MS=0)
+    def test_slow_requests_are_logged(self):
+        with self.assertLogs('config.profiling', 'WARNING') as logs:
+            self._profiled_get(reverse('ticket-detail', args=[Ticket.objects.first().pk]))
+
+        entry = logs.records[0].profile
+        self.assertEqual(entry['method'], 'GET')
+        self.assertEqual(entry['status'], 200)
+        self.assertGreater(entry['queries'], 0)
+        self.assertEqual(json.loads(logs.records[0].getMessage().split(': ', 1)[1]), entry)
+        for key in ('total_ms', 'db_ms', 'duplicate_queries', 'serialize_ms'):
+            self.assertIn(key, entry)
+
+    def test_slowest_requests_are_saved_as_cprofile(self):
+        with tempfile.TemporaryDirectory() as directory, self.settings(
+            REQUEST_PROFILING_SLOW_MS=0, REQUEST_PROFILING_DIR=directory, REQUEST_PROFILING_KEEP=1
+        ), patch.object(profiling, '_saved_profiles', []), self.assertLogs('config.profiling', 'WARNING') as logs:
+            self._profiled_get(reverse('ticket-list'))
+            self._profiled_get(reverse('ticket-list'))
+
+            saved = list(Path(directory).glob('*.prof'))
+            self.assertEqual(len(saved), 1)
+            self.assertIn(str(saved[0]), [record.profile['profile'] for record in logs.records])
+            self.assertGreater(pstats.Stats(str(saved[0])).total_calls, 0)
+
+
+class RequestProfileTest(SimpleTestCase):
+    def test_counts_duplicate_queries(self):
+        profile = RequestProfile(RequestFactory().get('/api/tickets/'))
+        profile.record_query('SELECT 1 WHERE id = %s', (1,), 0.001)
+        profile.record_query('SELECT 1 WHERE id = %s', (1,), 0.001)
+        profile.record_query('SELECT 1 WHERE id = %s', (2,), 0.001)
+
+        self.assertEqual(profile.query_count, 3)
+        self.assertEqual(profile.duplicate_count, 1)
+        self.assertEqual(
+            profile.log_entry(200)['most_repeated_query'],
+            {'sql': 'SELECT 1 WHERE id = %s', 'count': 2}
+        )
@@ -0,0 +1,138 @@
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from authentication.models import UserProfile
+from core.archive import archivable_tickets
+from core.models import Ticket, TicketStatus, TicketTombstone, Priority
+from core.sync import _after
+from core.views import TicketViewSet
+
+User = get_user_model()
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Os planos verificados são do SQLite.')
+class TicketQueryPlanTest(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+        self.technician = User.objects.create_user(
+            email='tecnico@test.com',
+            password='testpass123',
+            profile=UserProfile.TECHNICIAN
+        )
+
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+
+        statuses = list(TicketStatus.values)
+        priorities = list(Priority.values)
+        Ticket.objects.bulk_create([
+            Ticket(
+                title=f'Ticket {i}',
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+                attendant=self.attendant if i % 2 else self.technician
+            )
+            for i in range(40)
+        ])
+
+    def _list_queryset(self, user, params=None):
+        request = Request(self.factory.get('/api/tickets/', params or {}))
+        request.user = user
+        view = TicketViewSet(request=request, action='list', format_kwarg=None, args=(), kwargs={})
+        return view.filter_queryset(view.get_queryset())
+
+    def assertUsesIndex(self, queryset, index_name=None):
+        plan = queryset.explain()
+
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan, plan)
+        for line in plan.splitlines():
+            if 'core_ticket' in line and ' SCAN ' in f' {line} ':
+                self.assertIn('USING', line, plan)
+        if index_name:
+            self.assertIn(index_name, plan)
+
+    def test_default_list_technician(self):
+        self.assertUsesIndex(self._list_queryset(self.technician), 'ticket_created_idx')
+
+    def test_default_list_attendant(self):
+        self.assertUsesIndex(self._list_queryset(self.attendant), 'ticket_attendant_created_idx')
+
+    def test_filter_by_status(self):
+        queryset = self._list_queryset(self.technician, {'status': 'open'})
+        self.assertUsesIndex(queryset, 'ticket_status_created_idx')
+
+    def test_filter_by_priority(self):
+        queryset = self._list_queryset(self.technician, {'priority': 'high'})
+        self.assertUsesIndex(queryset, 'ticket_priority_created_idx')
+
+    def test_filter_by_status_and_priority(self):
+        queryset = self._list_queryset(self.technician, {'status': 'open', 'priority': 'high'})
+        self.assertUsesIndex(queryset, 'ticket_status_prio_created_idx')
+
+    def test_filter_by_attendant(self):
+        queryset = self._list_queryset(self.technician, {'attendant': self.attendant.pk})
+        self.assertUsesIndex(queryset, 'ticket_attendant_created_idx')
+
+    def test_filter_by_created_range(self):
+        queryset = self._list_queryset(self.technician, {
+            'created_after': '2025-01-01T00:00:00Z',
+            'created_before': '2030-01-01T00:00:00Z',
+        })
+        self.assertUsesIndex(queryset, 'ticket_created_idx')
+
+    def test_attendant_with_status(self):
+        queryset = self._list_queryset(self.attendant, {'status': 'open'})
+        self.assertUsesIndex(queryset)
+
+    def _changes_queryset(self, user):
+        request = Request(self.factory.get('/api/tickets/changes/'))
+        request.user = user
+        view = TicketViewSet(request=request, action='changes', format_kwarg=None, args=(), kwargs={})
+        ticket = Ticket.objects.order_by('updated_at').first()
+        return _after(view.get_queryset(), 'updated_at', (ticket.updated_at, ticket.pk)).order_by(
+            'updated_at', 'id'
+        )
+
+    def test_changes_technician(self):
+        self.assertUsesIndex(self._changes_queryset(self.technician), 'ticket_updated_idx')
+
+    def test_changes_attendant(self):
+        self.assertUsesIndex(self._changes_queryset(self.attendant), 'ticket_attendant_updated_idx')
+
+    def test_tombstones_attendant(self):
+        queryset = _after(
+            TicketTombstone.objects.filter(attendant_id=self.attendant.pk),
+            'deleted_at',
+            (Ticket.objects.first().created_at, 1)
+        ).order_by('deleted_at', 'id')
+        self.assertUsesIndex(queryset, 'tombstone_attendant_idx')
+
+    def test_archivable_tickets(self):
+        queryset = archivable_tickets(90).order_by().values('id')
+        self.assertUsesIndex(queryset, 'ticket_status_changed_idx')
+
+    def test_status_history(self):
+        ticket = Ticket.objects.first()
+        self.assertUsesIndex(ticket.status_events.order_by('created_at', 'id'), 'status_event_ticket_idx')
+
+    def test_search_uses_full_text_index(self):
+        queryset = self._list_queryset(self.technician, {'search': 'ticket'})
+        plan = queryset.explain()
+
+        self.assertIn('VIRTUAL TABLE INDEX', plan)
+        self.assertNotIn('LIKE', str(queryset.query))
+
+    def test_search_rank_joins_full_text_index_once(self):
+        plan = self._list_queryset(self.technician, {'search': 'ticket'})[:20].explain()
+
+        self.assertEqual(plan.count('core_ticket_fts VIRTUAL TABLE INDEX'), 1, plan)
+        self.assertNotIn('SUBQUERY', plan, plan)
@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from authentication.models import UserProfile
+from core.counters import get_stats
+from core.models import Ticket, TicketStatus, TicketStatusEvent
+from core.transitions import VALID_TRANSITIONS, change_status, change_statuses
+
+User = get_user_model()
+
+
+class ChangeStatusTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+        self.ticket = Ticket.objects.create(title='Ticket', attendant=self.attendant)
+
+    def test_updates_when_status_matches(self):
+        previous_updated_at = self.ticket.updated_at
+
+        self.assertTrue(change_status(self.ticket, TicketStatus.IN_PROGRESS))
+
+        self.assertEqual(self.ticket.status, TicketStatus.IN_PROGRESS)
+        self.assertGreater(self.ticket.updated_at, previous_updated_at)
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, TicketStatus.IN_PROGRESS)
+        self.assertEqual(get_stats()['by_status'], {'in_progress': 1})
+
+    def test_stale_expected_status_changes_nothing(self):
+        Ticket.objects.filter(pk=self.ticket.pk).update(status=TicketStatus.CANCELED)
+
+        self.assertFalse(change_status(self.ticket, TicketStatus.IN_PROGRESS))
+
+        self.assertEqual(self.ticket.status, TicketStatus.OPEN)
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, TicketStatus.CANCELED)
+
+
+class ChangeStatusesTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+        self.tickets = [Ticket.objects.create(title=f'Ticket {i}', attendant=self.attendant) for i in range(5)]
+
+    @patch('core.transitions.STATUS_UPDATE_BATCH_SIZE', 2)
+    def test_updates_large_selections_in_batches(self):
+        ticket_ids = [ticket.pk for ticket in self.tickets]
+        Ticket.objects.filter(pk=ticket_ids[3]).update(status=TicketStatus.CANCELED)
+
+        with CaptureQueriesContext(connection) as queries:
+            conflicts = change_statuses({TicketStatus.OPEN: ticket_ids}, TicketStatus.IN_PROGRESS)
+
+        self.assertEqual(conflicts, {ticket_ids[3]})
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "core_ticket"')]
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(
+            set(Ticket.objects.filter(status=TicketStatus.IN_PROGRESS).values_list('id', flat=True)),
+            set(ticket_ids) - conflicts
+        )
+        self.assertEqual(
+            TicketStatusEvent.objects.filter(to_status=TicketStatus.IN_PROGRESS).count(), 4
+        )
+        self.assertEqual(get_stats()['by_status']['in_progress'], 4)
+
+
+class ConcurrentChangeStatusTest(TransactionTestCase):
+    workers = 8
+    attempts = 25
+
+    def setUp(self):
+        cache.clear()
+        self.attendant = User.objects.create_user(
+            email='atendente@test.com',
+            password='testpass123',
+            profile=UserProfile.ATTENDANT
+        )
+        self.ticket = Ticket.objects.create(title='Ticket', attendant=self.attendant)
+
+    def _retry(self, operation):
+        while True:
+            try:
+                return operation()
+            except OperationalError as error:
+                if 'locked' not in str(error):
+                    raise
+                time.sleep(random.random() / 1000)
+
+    def test_no_lost_updates(self):
+        moves = Counter()
+        conflicts = Counter()
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                for _ in range(self.attempts):
+                    ticket = self._retry(lambda: Ticket.objects.get(pk=self.ticket.pk))
+                    expected = ticket.status
+                    new_status = random.choice(VALID_TRANSITIONS[expected])
+                    applied = self._retry(lambda: change_status(ticket, new_status, expected))
+                    with lock:
+                        if applied:
+                            moves[expected, new_status] += 1
+                        else:
+                            conflicts[expected] += 1
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for future in [executor.submit(worker) for _ in range(self.workers)]:
+                future.result()
+
+        self.ticket.refresh_from_db()
+        self.assertEqual(sum(moves.values()) + sum(conflicts.values()), self.workers * self.attempts)
+
+        balance = Counter()
+        for (source, target), count in moves.items():
+            balance[source] += count
+            balance[target] -= count
+        expected_balance = Counter({TicketStatus.OPEN: 1})
+        expected_balance[self.ticket.status] -= 1
+        for current_status in TicketStatus.values:
+            self.assertEqual(balance[current_status], expected_balance[current_status], current_status)
+
+        self.assertEqual(get_stats()['by_status'], {self.ticket.status: 1})
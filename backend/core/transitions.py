@@ -0,0 +1,83 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .counters import record_status_moved, ticket_state
+from .events import TICKET_STATUS_CHANGED, batched, publish_ticket_events
+from .history import expire_rollups, record_transitions, rollup_updates
+from .list_cache import bump_generation
+from .models import Ticket, TicketStatus
+
+VALID_TRANSITIONS = {
+    TicketStatus.OPEN: [TicketStatus.IN_PROGRESS, TicketStatus.CANCELED],
+    TicketStatus.IN_PROGRESS: [TicketStatus.RESOLVED, TicketStatus.CANCELED],
+    TicketStatus.RESOLVED: [TicketStatus.IN_PROGRESS],
+    TicketStatus.CANCELED: [TicketStatus.OPEN],
+}
+
+
+# Ids por UPDATE: seleções grandes não podem estourar o limite de variáveis por consulta.
+STATUS_UPDATE_BATCH_SIZE = 500
+
+
+def is_valid_transition(current_status, new_status):
+    return new_status in VALID_TRANSITIONS.get(current_status, [])
+
+
+def loaded_status(ticket):
+    return ticket._counter_state['status'] or ticket.status
+
+
+def change_status(ticket, new_status, expected_status=None, changed_by=None):
+    if expected_status is None:
+        expected_status = loaded_status(ticket)
+    now = timezone.now()
+
+    with transaction.atomic():
+        updated = Ticket.objects.filter(pk=ticket.pk, status=expected_status).update(
+            status=new_status, updated_at=now, **rollup_updates(expected_status, new_status, now)
+        )
+        if not updated:
+            return False
+        record_transitions([ticket.pk], expected_status, new_status, now, changed_by)
+        record_status_moved({expected_status: 1}, new_status)
+        bump_generation()
+        publish_ticket_events(TICKET_STATUS_CHANGED, [ticket.pk])
+
+    expire_rollups(ticket, now)
+    ticket.status = new_status
+    ticket.updated_at = now
+    ticket._counter_state = ticket_state(ticket)
+    return True
+
+
+def change_statuses(groups, new_status, changed_by=None):
+    now = timezone.now()
+    moved = {}
+    conflicts = set()
+
+    with transaction.atomic():
+        for current_status, ticket_ids in groups.items():
+            moved[current_status] = 0
+            for batch in batched(ticket_ids, STATUS_UPDATE_BATCH_SIZE):
+                updated = Ticket.objects.filter(id__in=batch, status=current_status).update(
+                    status=new_status, updated_at=now, **rollup_updates(current_status, new_status, now)
+                )
+                moved[current_status] += updated
+                if updated != len(batch):
+                    conflicts.update(set(batch) - set(
+                        Ticket.objects.filter(id__in=batch, status=new_status, updated_at=now)
+                        .values_list('id', flat=True)
+                    ))
+                record_transitions(
+                    [ticket_id for ticket_id in batch if ticket_id not in conflicts],
+                    current_status, new_status, now, changed_by
+                )
+
+        record_status_moved(moved, new_status)
+        if any(moved.values()):
+            bump_generation()
+            publish_ticket_events(TICKET_STATUS_CHANGED, [
+                ticket_id for ticket_ids in groups.values() for ticket_id in ticket_ids
+                if ticket_id not in conflicts
+            ])
+    return conflicts
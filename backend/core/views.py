@@ -1,13 +1,40 @@
+import hashlib
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.filters import OrderingFilter
+from rest_framework.parsers import MultiPartParser
 from django_filters import rest_framework as filters
-from django.db.models import Q
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, FloatField, Max, Value
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 
-from .models import Ticket, TicketStatus
-from .serializers import TicketSerializer, TicketStatusUpdateSerializer
+from .archive import reopen_archived, restore_ticket
+from .counters import get_stats
+from .exports import EXPORT_FORMATS, aiter_export, iter_export
+from .history import sla_report
+from .imports import TicketImporter, detect_format, iter_rows
+from .list_cache import get_cached_list, list_cache_enabled, list_cache_key, set_cached_list
+from .models import Ticket, TicketArchive, TicketStatus, TicketStatusEvent, TicketTombstone
+from .pagination import KeysetPagination, TicketPageNumberPagination
+from .search import SEARCH_RANK, search_tickets
+from .serializers import (
+    TicketBulkStatusUpdateSerializer,
+    TicketListSerializer,
+    TicketSerializer,
+    TicketStatusEventSerializer,
+    TicketStatusUpdateSerializer,
+)
+from .sync import changes_since
+from .transitions import change_status, change_statuses, is_valid_transition
 from authentication.models import UserProfile
+from config.db_router import is_pinned
+from config.profiling import serialization
 
 
 class TicketFilter(filters.FilterSet):
@@ -17,63 +44,403 @@ class TicketFilter(filters.FilterSet):
     created_after = filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
     created_before = filters.DateTimeFilter(field_name='created_at', lookup_expr='lte')
     search = filters.CharFilter(method='search_filter')
+    include_archived = filters.BooleanFilter(method='include_archived_filter')
 
     class Meta:
         model = Ticket
-        fields = ['status', 'priority', 'attendant', 'created_after', 'created_before', 'search']
+        fields = [
+            'status', 'priority', 'attendant', 'created_after', 'created_before', 'search',
+            'include_archived',
+        ]
 
     def search_filter(self, queryset, name, value):
-        return queryset.filter(
-            Q(title__icontains=value) | Q(description__icontains=value)
-        )
+        return search_tickets(queryset, value)
+
+    def include_archived_filter(self, queryset, name, value):
+        return queryset
+
+
+class TicketOrderingFilter(OrderingFilter):
+    def get_ordering(self, request, queryset, view):
+        explicit = request.query_params.get(self.ordering_param)
+        if not explicit and SEARCH_RANK in queryset.query.annotations:
+            return [f'-{SEARCH_RANK}', *self.get_default_ordering(view)]
+        return super().get_ordering(request, queryset, view)
 
 
 class TicketViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = TicketSerializer
     permission_classes = [IsAuthenticated]
+    filter_backends = [filters.DjangoFilterBackend, TicketOrderingFilter]
     filterset_class = TicketFilter
     ordering_fields = ['created_at', 'updated_at', 'title', 'priority', 'status']
     ordering = ['-created_at']
+    pagination_class = TicketPageNumberPagination
+    keyset_pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self._wants_keyset_pagination():
+                self._paginator = self.keyset_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
+    def _wants_keyset_pagination(self):
+        request = getattr(self, 'request', None)
+        if request is None:
+            return False
+        params = request.query_params
+        return params.get('pagination') == 'cursor' or 'cursor' in params
 
     def get_queryset(self):
         user = self.request.user
 
-        queryset = Ticket.objects.all()
+        queryset = Ticket.objects.select_related('attendant')
 
         if user.is_superuser:
             return queryset
         elif hasattr(user, 'profile') and user.profile == UserProfile.TECHNICIAN:
             return queryset
         else:
-            return queryset.filter(attendant=user)
+            return queryset.filter(attendant_id=user.pk)
+
+    def get_archive_queryset(self):
+        queryset = TicketArchive.objects.select_related('attendant')
+        if self._visibility_scope(self.request.user).startswith('attendant:'):
+            return queryset.filter(attendant_id=self.request.user.pk)
+        return queryset
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            archived = self.get_archive_queryset().filter(pk=self.kwargs['pk']).first()
+            if archived is None:
+                raise
+            self.check_object_permissions(self.request, archived)
+            return archived
+
+    def includes_archived(self):
+        return self.request.query_params.get('include_archived') in ('true', 'True', '1')
+
+    def filter_list_querysets(self):
+        querysets = [self.filter_queryset(self.get_queryset())]
+        if self.includes_archived():
+            archived = TicketFilter(
+                self.request.query_params, queryset=self.get_archive_queryset(), request=self.request
+            ).qs
+            querysets.append(TicketOrderingFilter().filter_queryset(self.request, archived, self))
+        return querysets
+
+    def list_rows(self, querysets):
+        queryset = querysets[0]
+        annotations = list(queryset.query.annotations)
+        rows = queryset.values(*TicketListSerializer.values_fields, *annotations)
+        if len(querysets) == 1:
+            return rows
+
+        branches = [rows.order_by()]
+        for archived in querysets[1:]:
+            missing = {
+                name: Value(0.0, output_field=FloatField())
+                for name in annotations if name not in archived.query.annotations
+            }
+            branches.append(
+                archived.annotate(**missing).order_by()
+                .values(*TicketListSerializer.values_fields, *annotations)
+            )
+        return branches[0].union(*branches[1:], all=True).order_by(*queryset.query.order_by)
+
+    def list_summary(self, summaries):
+        modified = [summary['last_modified'] for summary in summaries if summary['last_modified']]
+        return {
+            'total': sum(summary['total'] for summary in summaries),
+            'last_modified': max(modified) if modified else None,
+        }
+
+    def keyset_summary(self):
+        # Sem COUNT, o validador olha o escopo visível inteiro, não só o filtrado: um chamado que
+        # sai do filtro também muda updated_at, e remoções e arquivamentos deixam tombstone.
+        last_updated = self.get_queryset().order_by().aggregate(last_updated=Max('updated_at'))['last_updated']
+        last_deleted = self.get_tombstone_queryset().aggregate(last_deleted=Max('deleted_at'))['last_deleted']
+        return {
+            'last_modified': max(filter(None, (last_updated, last_deleted)), default=None),
+            'last_deleted': last_deleted,
+        }
+
+    def get_tombstone_queryset(self):
+        if self._visibility_scope(self.request.user).startswith('attendant:'):
+            return TicketTombstone.objects.filter(attendant_id=self.request.user.pk)
+        return TicketTombstone.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        cache_key = None if is_pinned() or not list_cache_enabled() else list_cache_key(self._visibility_scope(request.user), request)
+        cached = get_cached_list(cache_key) if cache_key else None
+        if cached is not None:
+            data, etag, last_modified = cached
+            not_modified = self._conditional_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            return self._with_validators(Response(data), etag, last_modified)
+
+        querysets = self.filter_list_querysets()
+        if len(querysets) > 1 and isinstance(self.paginator, KeysetPagination):
+            return Response(
+                {'error': 'Paginação por cursor não suporta include_archived.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if isinstance(self.paginator, KeysetPagination):
+            summary = self.keyset_summary()
+        else:
+            summary = self.list_summary([
+                queryset.order_by().aggregate(last_modified=Max('updated_at'), total=Count('id'))
+                for queryset in querysets
+            ])
+        etag = self._etag(request, *summary.values())
+        not_modified = self._conditional_response(request, etag, summary['last_modified'])
+        if not_modified is not None:
+            return not_modified
+
+        queryset = self.list_rows(querysets)
+
+        if isinstance(self.paginator, TicketPageNumberPagination):
+            self.paginator.known_count = summary['total']
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            with serialization():
+                data = TicketListSerializer(page, many=True).data
+            response = self.get_paginated_response(data)
+        else:
+            with serialization():
+                data = TicketListSerializer(queryset, many=True).data
+            response = Response(data)
+
+        if cache_key:
+            set_cached_list(cache_key, (response.data, etag, summary['last_modified']))
+        return self._with_validators(response, etag, summary['last_modified'])
+
+    def retrieve(self, request, *args, **kwargs):
+        ticket = self.get_object()
+
+        etag = self._etag(request, ticket.pk, ticket.updated_at)
+        not_modified = self._conditional_response(request, etag, ticket.updated_at)
+        if not_modified is not None:
+            return not_modified
+
+        with serialization():
+            data = self.get_serializer(ticket).data
+        response = Response(data)
+        return self._with_validators(response, etag, ticket.updated_at)
+
+    def _visibility_scope(self, user):
+        if user.is_superuser:
+            return 'superuser'
+        elif hasattr(user, 'profile') and user.profile == UserProfile.TECHNICIAN:
+            return 'technician'
+        return f'attendant:{user.pk}'
+
+    def _etag(self, request, *parts):
+        value = ':'.join(
+            str(part) for part in (self._visibility_scope(request.user), request.get_full_path(), *parts)
+        )
+        return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
+
+    def _conditional_response(self, request, etag, last_modified):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=quote_etag(etag), last_modified=timestamp)
+        if response is not None:
+            return self._with_validators(response, etag, last_modified)
+        return None
+
+    def _with_validators(self, response, etag, last_modified):
+        response['ETag'] = quote_etag(etag)
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
     @action(detail=True, methods=['patch'], permission_classes=[IsAuthenticated])
     def update_status(self, request, pk=None):
         ticket = self.get_object()
-        user = request.user
+        data, status_code = self._update_status(ticket, request.user, request.data)
+        return Response(data, status=status_code)
 
+    def _update_status(self, ticket, user, data):
         if not self._can_update_status(user):
+            return (
+                {'error': 'Apenas técnicos podem alterar o status dos tickets.'},
+                status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = TicketStatusUpdateSerializer(data=data)
+        if not serializer.is_valid():
+            return serializer.errors, status.HTTP_400_BAD_REQUEST
+
+        new_status = serializer.validated_data['status']
+
+        if not self._is_valid_status_transition(ticket.status, new_status):
+            return (
+                {'error': 'Transição de status inválida.'},
+                status.HTTP_400_BAD_REQUEST
+            )
+
+        if isinstance(ticket, TicketArchive):
+            ticket = reopen_archived(ticket, new_status, changed_by=user)
+            updated = ticket is not None
+        else:
+            updated = change_status(ticket, new_status, expected_status=ticket.status, changed_by=user)
+        if not updated:
+            return (
+                {'error': 'Status alterado por outra requisição.'},
+                status.HTTP_409_CONFLICT
+            )
+
+        return TicketSerializer(ticket).data, status.HTTP_200_OK
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
+    def bulk_update_status(self, request):
+        if not self._can_update_status(request.user):
             return Response(
                 {'error': 'Apenas técnicos podem alterar o status dos tickets.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        serializer = TicketStatusUpdateSerializer(data=request.data)
+        serializer = TicketBulkStatusUpdateSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+        ids = list(dict.fromkeys(serializer.validated_data['ids']))
         new_status = serializer.validated_data['status']
+        errors = {}
+        groups = {}
 
-        if not self._is_valid_status_transition(ticket.status, new_status):
+        with transaction.atomic():
+            current = dict(
+                self.get_queryset()
+                .select_for_update()
+                .filter(id__in=ids)
+                .order_by()
+                .values_list('id', 'status')
+            )
+
+            missing = [ticket_id for ticket_id in ids if ticket_id not in current]
+            for archived in self.get_archive_queryset().filter(id__in=missing) if missing else []:
+                if self._is_valid_status_transition(archived.status, new_status):
+                    if restore_ticket(archived) is None:
+                        continue
+                current[archived.pk] = archived.status
+
+            for ticket_id in ids:
+                if ticket_id not in current:
+                    errors[ticket_id] = 'Ticket não encontrado.'
+                elif not self._is_valid_status_transition(current[ticket_id], new_status):
+                    errors[ticket_id] = 'Transição de status inválida.'
+                else:
+                    groups.setdefault(current[ticket_id], []).append(ticket_id)
+
+            for ticket_id in change_statuses(groups, new_status, request.user):
+                errors[ticket_id] = 'Status alterado por outra requisição.'
+
+        results = [
+            {'id': ticket_id, 'success': False, 'error': errors[ticket_id]}
+            if ticket_id in errors else {'id': ticket_id, 'success': True}
+            for ticket_id in ids
+        ]
+
+        return Response({
+            'status': new_status,
+            'updated': sum(1 for result in results if result['success']),
+            'failed': len(errors),
+            'results': results,
+        })
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def changes(self, request):
+        return Response(changes_since(
+            self.get_queryset(),
+            self.get_tombstone_queryset(),
+            cursor=request.query_params.get('cursor'),
+            limit=request.query_params.get('limit')
+        ))
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def stats(self, request):
+        if not self._can_update_status(request.user):
             return Response(
-                {'error': 'Transição de status inválida.'},
+                {'error': 'Apenas técnicos podem consultar as estatísticas.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(get_stats())
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def sla(self, request):
+        if not self._can_update_status(request.user):
+            return Response(
+                {'error': 'Apenas técnicos podem consultar as estatísticas.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(sla_report(*self.filter_list_querysets()))
+
+    @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated])
+    def history(self, request, pk=None):
+        ticket = self.get_object()
+        events = TicketStatusEvent.objects.filter(ticket_id=ticket.pk).order_by('created_at', 'id')
+        return Response(TicketStatusEventSerializer(events, many=True).data)
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def export(self, request):
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': 'Formato inválido. Use csv ou ndjson.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        ticket.status = new_status
-        ticket.save()
+        rows = self.list_rows(self.filter_list_querysets())
+        stream = aiter_export if isinstance(request._request, ASGIRequest) else iter_export
+        response = StreamingHttpResponse(
+            stream(rows, export_format),
+            content_type=EXPORT_FORMATS[export_format]
+        )
+        response['Content-Disposition'] = f'attachment; filename="tickets.{export_format}"'
+        return response
 
-        return Response(TicketSerializer(ticket).data)
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        permission_classes=[IsAuthenticated],
+        parser_classes=[MultiPartParser]
+    )
+    def import_tickets(self, request):
+        if not self._can_update_status(request.user):
+            return Response(
+                {'error': 'Apenas técnicos podem importar tickets.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'error': 'Arquivo é obrigatório.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        file_format = detect_format(upload.name, request.data.get('format'))
+        if file_format is None:
+            return Response(
+                {'error': 'Formato inválido. Use csv ou ndjson.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        report = TicketImporter(default_attendant=request.user).run(iter_rows(upload, file_format))
+
+        return Response(report)
 
     def _can_update_status(self, user):
         return (
@@ -82,11 +449,4 @@ class TicketViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
     def _is_valid_status_transition(self, current_status, new_status):
-        valid_transitions = {
-            TicketStatus.OPEN: [TicketStatus.IN_PROGRESS, TicketStatus.CANCELED],
-            TicketStatus.IN_PROGRESS: [TicketStatus.RESOLVED, TicketStatus.CANCELED],
-            TicketStatus.RESOLVED: [TicketStatus.IN_PROGRESS],
-            TicketStatus.CANCELED: [TicketStatus.OPEN],
-        }
-
-        return new_status in valid_transitions.get(current_status, [])
+        return is_valid_transition(current_status, new_status)
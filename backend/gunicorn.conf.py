@@ -0,0 +1,61 @@
+import logging
+import multiprocessing
+import os
+import re
+
+from decouple import config as env
+
+# Perfil de produção: gunicorn gerenciando workers uvicorn (ASGI).
+# Uso: gunicorn -c gunicorn.conf.py (comando padrão da imagem Docker)
+# Para comparar com o caminho WSGI síncrono:
+#   GUNICORN_APP=config.wsgi:application GUNICORN_WORKER_CLASS=gthread gunicorn -c gunicorn.conf.py
+
+wsgi_app = env('GUNICORN_APP', default='config.asgi:application')
+bind = env('GUNICORN_BIND', default='0.0.0.0:8000')
+# Vários workers só com cache compartilhado (eventos SSE e cache de listas dependem dele).
+shared_cache = not any(
+    backend in env('CACHE_BACKEND', default='locmem').lower() for backend in ('locmem', 'dummy')
+)
+workers = env('WEB_CONCURRENCY', default=multiprocessing.cpu_count() * 2 + 1 if shared_cache else 1, cast=int)
+os.environ['WEB_CONCURRENCY'] = str(workers)
+worker_class = env('GUNICORN_WORKER_CLASS', default='uvicorn.workers.UvicornWorker')
+threads = env('GUNICORN_THREADS', default=1, cast=int)
+worker_connections = env('GUNICORN_WORKER_CONNECTIONS', default=1000, cast=int)
+timeout = env('GUNICORN_TIMEOUT', default=30, cast=int)
+graceful_timeout = env('GUNICORN_GRACEFUL_TIMEOUT', default=30, cast=int)
+keepalive = env('GUNICORN_KEEPALIVE', default=5, cast=int)
+max_requests = env('GUNICORN_MAX_REQUESTS', default=10000, cast=int)
+max_requests_jitter = env('GUNICORN_MAX_REQUESTS_JITTER', default=1000, cast=int)
+accesslog = env('GUNICORN_ACCESSLOG', default='-')
+reload = env('GUNICORN_RELOAD', default=False, cast=bool)
+
+
+class RedactTokenFilter(logging.Filter):
+    pattern = re.compile(r'(access_token=)[^&\s"]+')
+
+    def filter(self, record):
+        if isinstance(record.args, dict):
+            for key, value in record.args.items():
+                record.args[key] = self._redact(value)
+        elif isinstance(record.args, tuple):
+            record.args = tuple(self._redact(value) for value in record.args)
+        return True
+
+    def _redact(self, value):
+        return self.pattern.sub(r'\1[removido]', value) if isinstance(value, str) else value
+
+
+def on_starting(server):
+    # Recusa subir com configuração que quebra entre workers (ex.: broker de eventos em processo).
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('check')
+
+
+def post_worker_init(worker):
+    # O stream SSE recebe o token em ?access_token=; não deixa ele chegar ao log de acesso.
+    for logger in (logging.getLogger('uvicorn.access'), worker.log.access_log):
+        logger.addFilter(RedactTokenFilter())
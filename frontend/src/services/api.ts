@@ -63,6 +63,17 @@ export const authService = {
         const userStr = localStorage.getItem('user');
         return userStr ? JSON.parse(userStr) : null;
     },
+
+    async refreshAccessToken(): Promise<string | null> {
+        const refreshToken = localStorage.getItem('refresh_token');
+        if (!refreshToken) return null;
+
+        const response = await axios.post(`${API_BASE_URL}/auth/refresh/`, {
+            refresh_token: refreshToken,
+        });
+        localStorage.setItem('access_token', response.data.access_token);
+        return response.data.access_token;
+    },
 };
 
 export const ticketService = {
@@ -70,6 +81,7 @@ export const ticketService = {
         status?: string;
         priority?: string;
         search?: string;
+        include_archived?: boolean;
     }): Promise<Ticket[]> {
         const response = await api.get('/tickets/', { params });
         return response.data.results || response.data;
@@ -84,6 +96,12 @@ export const ticketService = {
         const response = await api.patch(`/tickets/${id}/update_status/`, statusUpdate);
         return response.data;
     },
+
+    openEvents(lastEventId?: string | null): EventSource {
+        const params = new URLSearchParams({ access_token: localStorage.getItem('access_token') || '' });
+        if (lastEventId) params.set('last_event_id', lastEventId);
+        return new EventSource(`${API_BASE_URL}/tickets/events/?${params}`);
+    },
 };
 
 export default api; 
\ No newline at end of file
@@ -1,7 +1,12 @@
 import { defineStore } from 'pinia';
 import { ref } from 'vue';
-import { ticketService } from '@/services/api';
-import type { Ticket, TicketStatusUpdate } from '@/types';
+import { authService, ticketService } from '@/services/api';
+import type { Ticket, TicketEventType, TicketStatusUpdate } from '@/types';
+
+const RECONNECT_BASE_DELAY = 1000;
+const RECONNECT_MAX_DELAY = 30000;
+const MAX_RECONNECT_ATTEMPTS = 5;
+const POLL_INTERVAL = 30000;
 
 export const useTicketStore = defineStore('tickets', () => {
     const tickets = ref<Ticket[]>([]);
@@ -9,10 +14,17 @@ export const useTicketStore = defineStore('tickets', () => {
     const loading = ref(false);
     const error = ref<string | null>(null);
 
+    let events: EventSource | null = null;
+    let lastEventId: string | null = null;
+    let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+    let pollTimer: ReturnType<typeof setInterval> | null = null;
+    let failures = 0;
+
     const fetchTickets = async (params?: {
         status?: string;
         priority?: string;
         search?: string;
+        include_archived?: boolean;
     }) => {
         loading.value = true;
         error.value = null;
@@ -70,6 +82,88 @@ export const useTicketStore = defineStore('tickets', () => {
         error.value = null;
     };
 
+    const applyTicket = (ticket: Ticket) => {
+        const index = tickets.value.findIndex(t => t.id === ticket.id);
+        if (index !== -1) {
+            tickets.value[index] = ticket;
+        }
+
+        if (currentTicket.value?.id === ticket.id) {
+            currentTicket.value = ticket;
+        }
+    };
+
+    const subscribeToEvents = (onEvent: (type: TicketEventType, ticket: Ticket | null) => void) => {
+        unsubscribeFromEvents();
+        failures = 0;
+        connectEvents(onEvent);
+    };
+
+    const connectEvents = (onEvent: (type: TicketEventType, ticket: Ticket | null) => void) => {
+        events = ticketService.openEvents(lastEventId);
+
+        const handle = (type: TicketEventType) => (message: MessageEvent) => {
+            lastEventId = message.lastEventId || lastEventId;
+            const ticket = type === 'reset' ? null : JSON.parse(message.data) as Ticket;
+            if (ticket) applyTicket(ticket);
+            onEvent(type, ticket);
+        };
+
+        events.addEventListener('ticket_created', handle('ticket_created') as EventListener);
+        events.addEventListener('ticket_status_changed', handle('ticket_status_changed') as EventListener);
+        events.addEventListener('reset', handle('reset') as EventListener);
+
+        events.onopen = () => {
+            failures = 0;
+        };
+
+        // CLOSED significa que o servidor recusou a conexão (401 com token expirado, 501 sem
+        // ASGI, 5xx...). Reconecta com espera exponencial e, depois de várias falhas seguidas,
+        // desiste do stream e passa a atualizar a lista por polling.
+        events.onerror = () => {
+            if (events?.readyState !== EventSource.CLOSED) return;
+            events.close();
+            events = null;
+
+            failures += 1;
+            if (failures > MAX_RECONNECT_ATTEMPTS) {
+                startPolling(onEvent);
+                return;
+            }
+
+            const delay = Math.min(RECONNECT_BASE_DELAY * 2 ** (failures - 1), RECONNECT_MAX_DELAY);
+            reconnectTimer = setTimeout(async () => {
+                reconnectTimer = null;
+                if (failures === 1) {
+                    try {
+                        await authService.refreshAccessToken();
+                    } catch {
+                        // a próxima tentativa conta como nova falha
+                    }
+                }
+                connectEvents(onEvent);
+            }, delay);
+        };
+    };
+
+    const startPolling = (onEvent: (type: TicketEventType, ticket: Ticket | null) => void) => {
+        onEvent('reset', null);
+        pollTimer = setInterval(() => onEvent('reset', null), POLL_INTERVAL);
+    };
+
+    const unsubscribeFromEvents = () => {
+        if (reconnectTimer) {
+            clearTimeout(reconnectTimer);
+            reconnectTimer = null;
+        }
+        if (pollTimer) {
+            clearInterval(pollTimer);
+            pollTimer = null;
+        }
+        events?.close();
+        events = null;
+    };
+
     return {
         tickets,
         currentTicket,
@@ -79,5 +173,7 @@ export const useTicketStore = defineStore('tickets', () => {
         fetchTicket,
         updateTicketStatus,
         clearError,
+        subscribeToEvents,
+        unsubscribeFromEvents,
     };
 }); 
\ No newline at end of file
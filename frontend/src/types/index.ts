@@ -23,6 +23,8 @@ export interface Ticket {
     updated_at: string;
 }
 
+export type TicketEventType = 'ticket_created' | 'ticket_status_changed' | 'reset';
+
 export interface TicketStatusUpdate {
     status: Ticket['status'];
 }